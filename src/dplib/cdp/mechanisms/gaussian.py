@@ -54,6 +54,9 @@ class GaussianMechanism(BaseMechanism):
       - Call `calibrate` before `randomise`.
     """
 
+    # 参与批量列式序列化（serialize_batch）的数值字段
+    _BATCH_FIELDS = ("epsilon", "delta", "sensitivity", "sigma")
+
     def __init__(
         self,
         epsilon: float = 1.0,
@@ -91,25 +94,66 @@ class GaussianMechanism(BaseMechanism):
         if self.delta <= 0 or self.delta >= 1:
             # 二次防御：高斯机制要求 δ 位于 (0,1)
             raise ValidationError("delta must be in (0,1) for Gaussian calibration")
+        # 输入与上次校准一致且 sigma 已就绪时直接返回，跳过 log/sqrt 计算
+        signature = (self.sensitivity, self.delta, self.epsilon)
+        if signature == self._last_calib_sig and self.sigma is not None:
+            return
         # 计算高斯噪声标准差 σ，采用常用校准常数 1.25
         # σ = (Δf * sqrt(2 * ln(1.25/δ))) / ε
         self.sigma = self.sensitivity * math.sqrt(2.0 * math.log(1.25 / self.delta)) / self.epsilon
         self._meta["distribution"] = "gaussian"
+        self._last_calib_sig = signature
 
     def randomise(self, value: Any) -> Any:
-        """Inject i.i.d. Gaussian noise into scalars, vectors, or numpy arrays."""
-        # 加噪入口：确保校准完成并按输入形状采样 i.i.d. 高斯噪声后相加
+        """
+        Inject i.i.d. Gaussian noise into scalars, vectors, or numpy arrays.
+
+        Array inputs draw noise into a buffer cached on the mechanism, so concurrent calls
+        on one instance are not thread-safe; use `randomise_fresh` from multiple threads.
+        """
+        # 非标量浮点 ndarray 是大批量场景的主流输入：直接走数组快路径，跳过类型规整与还原
+        if type(value) is np.ndarray and value.dtype.kind == "f" and value.ndim > 0:
+            return self.randomise_array(value)
+        return self._randomise(value, reuse_buffer=True)
+
+    def randomise_fresh(self, value: Any) -> Any:
+        """Thread-safe variant of `randomise` that allocates fresh noise on every call."""
+        return self._randomise(value, reuse_buffer=False)
+
+    def randomise_array(self, arr: np.ndarray) -> np.ndarray:
+        """Add Gaussian noise to a non-scalar float ndarray without input coercion or type restoration."""
+        return self._add_array_noise(arr, self._require_sigma(), reuse_buffer=True)
+
+    def _require_sigma(self) -> float:
         self.require_calibrated()  # 未校准将抛出异常
         if self.sigma is None:
             # 防御式：理论上 require_calibrated 后应已有 sigma
             raise CalibrationError("Gaussian mechanism missing sigma; call calibrate()")
+        return self.sigma
+
+    def _randomise(self, value: Any, *, reuse_buffer: bool) -> Any:
+        # 通用加噪入口：确保校准完成并按输入形状采样 i.i.d. 高斯噪声后相加
+        sigma = self._require_sigma()
+        if isinstance(value, np.ndarray) and value.dtype == np.float32 and value.ndim > 0:
+            # float32 数组保持单精度，不经过 float64 规整
+            return self._add_array_noise(value, sigma, reuse_buffer=reuse_buffer)
         arr, was_scalar = self._coerce_numeric(value)  # 统一为 ndarray，并记录是否原为标量
-        # 标量输入 -> size=None 采样一个数；数组输入 -> 与形状一致逐元素采样
-        size = None if was_scalar else arr.shape
-        noise = sample_noise(self._rng, "gaussian", scale=self.sigma, size=size)
-        result = arr + noise
+        if was_scalar:
+            # 标量输入 -> 采样单个噪声值
+            noise = sample_noise(self._rng, "gaussian", scale=sigma, size=None)
+            return self._restore_numeric_like(value, arr + noise, was_scalar)
+        result = self._add_array_noise(arr, sigma, reuse_buffer=reuse_buffer)
         return self._restore_numeric_like(value, result, was_scalar)  # 还原为与原输入等价的标量/数组类型
 
+    def _add_array_noise(self, arr: np.ndarray, sigma: float, *, reuse_buffer: bool) -> np.ndarray:
+        # 按输入精度将标准正态噪声直接写入（可复用的）缓冲区，再原地缩放为 σ·N(0,1)；
+        # float32 输入在 float32 上采样与相加，避免上转 float64 使内存带宽翻倍
+        dtype = np.float32 if arr.dtype == np.float32 else np.float64
+        noise = self._noise_buffer(arr.shape, dtype) if reuse_buffer else np.empty(arr.shape, dtype=dtype)
+        self._rng.standard_normal(dtype=dtype, out=noise)
+        noise *= sigma
+        return arr + noise
+
     def serialize(self) -> Dict[str, Any]:
         """Capture Gaussian-specific parameters for reproducibility."""
         # 在基类序列化结果上，补充高斯机制特有参数，便于跨进程复现
@@ -48,6 +48,9 @@ class GeometricMechanism(BaseMechanism):
       - Call `calibrate` before `randomise`.
     """
 
+    # 参与批量列式序列化（serialize_batch）的数值字段
+    _BATCH_FIELDS = ("epsilon", "sensitivity", "decay", "success_prob")
+
     def __init__(
         self,
         epsilon: float = 1.0,
@@ -70,34 +73,24 @@ class GeometricMechanism(BaseMechanism):
         if sensitivity is not None:
             self._validate_sensitivity(sensitivity)
             self.sensitivity = float(sensitivity)
+        # 输入与上次校准一致且衰减参数已就绪时直接返回，跳过 exp 计算
+        signature = (self.sensitivity, self.epsilon)
+        if signature == self._last_calib_sig and self.success_prob is not None:
+            return
         rate = self.epsilon / self.sensitivity
         self.decay = math.exp(-rate)
         self.success_prob = 1.0 - self.decay
         if not (0.0 < self.success_prob < 1.0):
             raise MechanismError("invalid calibration for geometric mechanism")
         self._meta["distribution"] = "geometric"
+        self._last_calib_sig = signature
 
-    def _integer_preserving_restore(self, original: Any, value: np.ndarray, was_scalar: bool) -> Any:
-        # 在恢复输出类型时尽量保持原始整数 dtype（数组/列表/元组/标量），避免因噪声导致类型退化
-        """Restore output type while preserving integer dtype when possible."""
-        original_dtype = None
-        if not isinstance(original, (str, bytes)):
-            try:
-                original_dtype = np.asarray(original).dtype
-            except Exception:  # pragma: no cover - defensive
-                original_dtype = None
-
-        restored = self._restore_numeric_like(original, value, was_scalar)
-        if original_dtype is not None and np.issubdtype(original_dtype, np.integer):
-            if isinstance(restored, np.ndarray):
-                return np.rint(restored).astype(original_dtype)
-            if isinstance(restored, list):
-                return [int(round(x)) for x in restored]
-            if isinstance(restored, tuple):
-                return tuple(int(round(x)) for x in restored)
-            if isinstance(restored, float):
-                return int(round(restored))
-        return restored
+    def _signed_geometric_scalar(self) -> int:
+        # 标量噪声：幅度取几何分布减一，符号由一次 {0,1} 采样映射为 ±1（与数组路径的采样顺序一致）
+        """Draw one two-sided geometric noise value without array allocation."""
+        magnitude = int(self._rng.geometric(self.success_prob)) - 1
+        sign = 2 * int(self._rng.integers(0, 2)) - 1
+        return sign * magnitude
 
     def randomise(self, value: Any) -> Any:
         # 对输入添加对称几何噪声；要求机制已校准且成功概率已设置
@@ -107,7 +100,11 @@ class GeometricMechanism(BaseMechanism):
             raise CalibrationError("Geometric mechanism not calibrated; missing success probability")
 
         arr, was_scalar = self._coerce_numeric(value)
-        size = None if was_scalar else arr.shape
+        if was_scalar:
+            # 标量快路径：直接采样单个带符号整数噪声，跳过 np.where 与数组分配
+            result = float(arr) + self._signed_geometric_scalar()
+            return self._integer_preserving_restore(value, result, was_scalar)
+        size = arr.shape
         magnitude = self._rng.geometric(self.success_prob, size=size) - 1
         sign = self._rng.integers(0, 2, size=size)
         sign = np.where(sign == 0, -1, 1)
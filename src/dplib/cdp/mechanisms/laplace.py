@@ -29,6 +29,11 @@ import numpy as np
 from dplib.core.privacy.base_mechanism import BaseMechanism, CalibrationError
 from dplib.core.utils.random import sample_noise
 
+# 超过该元素数时改用单次均匀采样的逆 CDF 采样器：一次 RNG 抽样 + 向量化 log1p 可摊薄调用开销
+_UNIFORM_SAMPLER_MIN_SIZE = 10_000
+# |2u| 的上界截断，避免 u 恰为 -0.5 时 log1p(-1) 产生 -inf
+_ONE_MINUS_ULP = float(np.nextafter(1.0, 0.0))
+
 
 class LaplaceMechanism(BaseMechanism):
     """
@@ -48,6 +53,9 @@ class LaplaceMechanism(BaseMechanism):
       - Call `calibrate` before `randomise`.
     """
 
+    # 参与批量列式序列化（serialize_batch）的数值字段
+    _BATCH_FIELDS = ("epsilon", "sensitivity", "scale")
+
     def __init__(
         self,
         epsilon: float = 1.0,
@@ -70,25 +78,82 @@ class LaplaceMechanism(BaseMechanism):
         if sensitivity is not None:
             self._validate_sensitivity(sensitivity)
             self.sensitivity = float(sensitivity)
+        # 输入与上次校准一致且 scale 已就绪时直接返回，避免重复计算
+        signature = (self.sensitivity, self.epsilon)
+        if signature == self._last_calib_sig and self.scale is not None:
+            return
         self.scale = self.sensitivity / self.epsilon
         self._meta["distribution"] = "laplace"
+        self._last_calib_sig = signature
 
     def randomise(self, value: Any) -> Any:
-        """Add Laplace noise element-wise to numeric inputs."""
-        # 加噪主入口：
-        # 1) 确保已完成校准（scale 已就绪），否则抛出 CalibrationError
-        # 2) 将输入统一为 ndarray，并记录是否为标量以便后续还原类型
-        # 3) 依据输入形状采样拉普拉斯噪声并逐元素相加
+        """
+        Add Laplace noise element-wise to numeric inputs.
+
+        Array inputs draw noise into a buffer cached on the mechanism, so concurrent calls
+        on one instance are not thread-safe; use `randomise_fresh` from multiple threads.
+        """
+        # 非标量浮点 ndarray 是大批量场景的主流输入：直接走数组快路径，跳过类型规整与还原
+        if type(value) is np.ndarray and value.dtype.kind == "f" and value.ndim > 0:
+            return self.randomise_array(value)
+        return self._randomise(value, reuse_buffer=True)
+
+    def randomise_fresh(self, value: Any) -> Any:
+        """Thread-safe variant of `randomise` that allocates fresh noise on every call."""
+        return self._randomise(value, reuse_buffer=False)
+
+    def randomise_array(self, arr: np.ndarray) -> np.ndarray:
+        """Add Laplace noise to a non-scalar float ndarray without input coercion or type restoration."""
+        return self._add_array_noise(arr, self._require_scale(), reuse_buffer=True)
+
+    def _require_scale(self) -> float:
+        # 确保已完成校准（scale 已就绪），否则抛出 CalibrationError
         self.require_calibrated()
         if self.scale is None:
             raise CalibrationError("Laplace mechanism missing scale; call calibrate()")
+        return self.scale
+
+    def _randomise(self, value: Any, *, reuse_buffer: bool) -> Any:
+        # 通用加噪入口：
+        # 1) 确保已完成校准
+        # 2) 将输入统一为 ndarray，并记录是否为标量以便后续还原类型
+        # 3) 依据输入形状采样拉普拉斯噪声并逐元素相加
+        scale = self._require_scale()
         arr, was_scalar = self._coerce_numeric(value)  # arr: ndarray；was_scalar: 是否原始为标量
-        # size=None -> 标量采样；否则与输入形状一致逐元素采样
-        size = None if was_scalar else arr.shape
-        noise = sample_noise(self._rng, "laplace", scale=self.scale, size=size)
-        result = arr + noise
+        if was_scalar:
+            # 标量 -> 直接采样单个拉普拉斯噪声
+            noise = sample_noise(self._rng, "laplace", scale=scale, size=None)
+            return self._restore_numeric_like(value, arr + noise, was_scalar)
+        result = self._add_array_noise(arr, scale, reuse_buffer=reuse_buffer)
         return self._restore_numeric_like(value, result, was_scalar)  # 按原始类型恢复（标量/数组等）
 
+    def _add_array_noise(self, arr: np.ndarray, scale: float, *, reuse_buffer: bool) -> np.ndarray:
+        noise = self._noise_buffer(arr.shape) if reuse_buffer else np.empty(arr.shape, dtype=np.float64)
+        if arr.size > _UNIFORM_SAMPLER_MIN_SIZE:
+            # 大数组：逆 CDF 采样，u ~ U[-0.5, 0.5)，噪声 = -b·sign(u)·log1p(-2|u|)；
+            # 每个元素只需一次均匀抽样，其余步骤均为原地向量化运算
+            self._rng.random(out=noise)
+            noise -= 0.5
+            result = np.sign(noise)
+            np.abs(noise, out=noise)
+            noise *= 2.0
+            np.minimum(noise, _ONE_MINUS_ULP, out=noise)
+            np.negative(noise, out=noise)
+            np.log1p(noise, out=noise)
+            result *= noise
+            result *= -scale
+            result += arr
+            return result
+        # Laplace(0, b) = b·(E1 - E2)，E1/E2 为独立标准指数变量；
+        # Generator.laplace 不支持 out=，而 standard_exponential 支持，可直接写入缓冲区与结果数组
+        result = np.empty(arr.shape, dtype=np.float64)
+        self._rng.standard_exponential(out=noise)
+        self._rng.standard_exponential(out=result)
+        np.subtract(noise, result, out=noise)
+        noise *= scale
+        np.add(arr, noise, out=result)
+        return result
+
     def serialize(self) -> Dict[str, Any]:
         """Persist sensitivity and scale alongside the base metadata."""
         # 序列化：在基类元数据基础上，额外保存敏感度与当前尺度参数
@@ -86,7 +86,11 @@ def create_mechanism(
         return mech_instance
 
     # 对字符串或枚举形式的机制标识符进行归一化并获取对应机制类
-    mech_type = normalize_mechanism(mechanism)
+    # 已是 MechanismType 时（类型化调用点的常见情况）直接使用，跳过归一化
+    if type(mechanism) is MechanismType:
+        mech_type = mechanism
+    else:
+        mech_type = normalize_mechanism(mechanism)
     mech_cls = get_mechanism_class(mech_type)
     if model is not None:
         # 在实例化前校验机制与目标隐私模型的支持关系
@@ -23,12 +23,81 @@ Limitations
 from __future__ import annotations
 
 import math
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional, Sequence
 
 import numpy as np
 
 from dplib.core.privacy.base_mechanism import BaseMechanism, CalibrationError, MechanismError, ValidationError
 
+try:
+    import numba
+except Exception:  # pragma: no cover - optional dependency
+    # 可选依赖 numba 缺失时退化为 None，阶梯噪声采样保持纯 NumPy 实现
+    numba = None  # type: ignore
+
+# 启用 numba 融合内核的最小元素数；更小的数组 JIT 调度开销不划算，继续使用 NumPy
+_NUMBA_MIN_SIZE = 2500
+# 说明：融合内核为显式开启（StaircaseMechanism(use_numba=True)）的可选路径，默认始终走 NumPy；
+# 开启时在构造阶段完成一次 JIT 编译预热，编译开销不会落在首次 randomise 调用中
+
+
+def _staircase_transform(exp_draws, uniforms, inv_rate, gamma, sensitivity, out):  # pragma: no cover - jitted
+    # 融合内核：将预先抽取的指数/均匀样本逐元素映射为阶梯噪声，单次遍历、无中间数组；
+    # 随机数在调用内核之前由机制自身的 Generator 顺序抽取，内核只做逐元素的纯函数变换，
+    # 因此 prange 的线程调度不影响结果：给定种子下输出与 NumPy 路径消费相同样本、按元素一致
+    for i in numba.prange(out.size):
+        magnitude = math.floor(exp_draws[i] * inv_rate)
+        u = uniforms[i]
+        frac = 2.0 * u
+        if frac >= 1.0:
+            frac -= 1.0
+        offset = gamma if frac < gamma else 0.0
+        value = (magnitude + offset) * sensitivity
+        out[i] = -value if u < 0.5 else value
+
+
+if numba is not None:
+    _staircase_noise_numba = numba.njit(parallel=True, cache=True)(_staircase_transform)
+else:  # pragma: no cover - optional dependency
+    _staircase_noise_numba = None
+
+_NUMBA_WARMED_UP = False
+
+
+def _warm_up_numba_kernel() -> bool:
+    # 以极小输入触发一次 JIT 编译（cache=True 时后续进程直接读取磁盘缓存）；numba 缺失时返回 False
+    global _NUMBA_WARMED_UP
+    if _staircase_noise_numba is None:
+        return False
+    if not _NUMBA_WARMED_UP:
+        scratch = np.zeros(1)
+        _staircase_noise_numba(scratch, np.zeros(1), 1.0, 0.5, 1.0, scratch)
+        _NUMBA_WARMED_UP = True
+    return True
+
+
+class _NoiseBuffer:
+    """Iterator yielding scalar noise values drawn in blocks."""
+
+    # 说明：逐条流式加噪时每次调用都走完整的 NumPy 调度开销；
+    # 此处按块批量抽取噪声并逐个产出，耗尽后再整块补充
+    def __init__(self, draw_fn: Callable[[int], np.ndarray], block: int = 4096):
+        self.block = int(block)
+        self.draw = draw_fn
+        self.buf: List[float] = []
+        self.i = 0
+
+    def __iter__(self) -> "_NoiseBuffer":
+        return self
+
+    def __next__(self) -> float:
+        if self.i >= len(self.buf):
+            self.buf = self.draw(self.block).tolist()
+            self.i = 0
+        value = self.buf[self.i]
+        self.i += 1
+        return value
+
 
 class StaircaseMechanism(BaseMechanism):
     """
@@ -38,6 +107,13 @@ class StaircaseMechanism(BaseMechanism):
       - epsilon: Privacy budget for noise calibration.
       - sensitivity: Global sensitivity of the query.
       - gamma: Fractional offset parameter in [0, 1].
+      - stream_block: Optional block size for buffered scalar noise; when set,
+        scalar `randomise` calls consume pre-drawn noise instead of sampling
+        one value at a time.
+      - use_numba: Opt in to a fused numba kernel for arrays of at least 2500
+        elements. The kernel is compiled when the mechanism is constructed and
+        consumes the same random draws as the NumPy path; it is ignored when
+        numba is not installed.
       - rng: Optional RNG for noise sampling.
       - name: Optional mechanism name override.
 
@@ -56,6 +132,8 @@ class StaircaseMechanism(BaseMechanism):
         gamma: float = 0.5,
         rng: Optional[Any] = None,
         name: Optional[str] = None,
+        stream_block: Optional[int] = None,
+        use_numba: bool = False,
     ):
         # 初始化阶梯机制：设置 ε / 敏感度 / γ，并为后续校准的 decay / success_prob 预留状态
         super().__init__(epsilon=epsilon, rng=rng, name=name)
@@ -65,6 +143,16 @@ class StaircaseMechanism(BaseMechanism):
         self.gamma = float(gamma)
         self.decay: Optional[float] = None
         self.success_prob: Optional[float] = None
+        # 校准时缓存的几何速率 ε/Δ 及其倒数，供噪声采样直接使用，避免逐次除法
+        self._rate: Optional[float] = None
+        self._inv_rate: Optional[float] = None
+        # 标量流式噪声缓冲区：仅在配置 stream_block 时按需创建，重新校准或重置种子时丢弃
+        if stream_block is not None and (isinstance(stream_block, bool) or int(stream_block) <= 0):
+            raise ValidationError("stream_block must be a positive integer")
+        self.stream_block: Optional[int] = None if stream_block is None else int(stream_block)
+        self._buffer: Optional[_NoiseBuffer] = None
+        # numba 融合内核仅在显式开启且 numba 可用时启用，并在此处预热编译
+        self.use_numba = bool(use_numba) and _warm_up_numba_kernel()
 
     @staticmethod
     def _validate_gamma(gamma: float) -> None:
@@ -90,36 +178,104 @@ class StaircaseMechanism(BaseMechanism):
         if gamma is not None:
             self._validate_gamma(gamma)
             self.gamma = float(gamma)
+        # 输入与上次校准一致且衰减参数已就绪时直接返回，跳过 exp 计算
+        signature = (self.sensitivity, self.gamma, self.epsilon)
+        if signature == self._last_calib_sig and self.success_prob is not None:
+            return
         rate = self.epsilon / self.sensitivity
         self.decay = math.exp(-rate)
         self.success_prob = 1.0 - self.decay
         if not (0.0 < self.success_prob < 1.0):
             raise MechanismError("invalid calibration for staircase mechanism")
+        self._cache_rates()
+        self._buffer = None
         self._meta["distribution"] = "staircase"
+        self._last_calib_sig = signature
+
+    def _cache_rates(self) -> None:
+        # 由 ε 与敏感度派生几何速率及其倒数；校准与反序列化共用
+        self._rate = self.epsilon / self.sensitivity
+        self._inv_rate = 1.0 / self._rate
 
     def _sample_noise(self, size: Optional[tuple[int, ...]]) -> np.ndarray:
         # 生成阶梯噪声：几何步长 + 以 γ 概率添加偏移，再乘以随机符号与敏感度
         """Sample staircase noise with optional fractional offset gamma."""
-        if self.success_prob is None or self.decay is None:
+        if self.success_prob is None or self.decay is None or self._inv_rate is None:
             raise CalibrationError("staircase mechanism not calibrated")
-        # 几何步长 + 以 gamma 概率添加偏移，形成阶梯状分布
-        magnitude = self._rng.geometric(self.success_prob, size=size) - 1
-        offset_mask = self._rng.random(size=size) < self.gamma
-        offset = np.where(offset_mask, self.gamma, 0.0)
-        sign = self._rng.integers(0, 2, size=size)
-        sign = np.where(sign == 0, -1.0, 1.0)
-        return sign * (magnitude + offset) * self.sensitivity
+        # 几何步长：floor(E / rate) 与 Geometric(1 - decay) - 1 同分布（E 为标准指数变量），
+        # 以一次指数抽样替代 NumPy 内部基于对数迭代的几何采样
+        # 一次均匀抽样同时派生符号（u < 0.5）与偏移掩码（2u 的小数部分 < γ），两者相互独立
+        if size is None:
+            magnitude = math.floor(self._rng.standard_exponential() * self._inv_rate)
+            u = float(self._rng.random())
+            offset = self.gamma if (u * 2.0) % 1.0 < self.gamma else 0.0
+            sign = -1.0 if u < 0.5 else 1.0
+            return np.float64(sign * (magnitude + offset) * self.sensitivity)
+        # 数组路径：在步长数组上原地累加偏移、施加符号与缩放，仅保留一个均匀数组作为临时量
+        noise = self._rng.standard_exponential(size=size)
+        if self.use_numba and _staircase_noise_numba is not None and noise.size >= _NUMBA_MIN_SIZE:
+            # 可选 numba 融合内核：与下方 NumPy 路径消费相同的随机样本，一次遍历完成变换
+            flat = noise.reshape(-1)
+            uniforms = self._rng.random(size=flat.size)
+            _staircase_noise_numba(flat, uniforms, self._inv_rate, self.gamma, self.sensitivity, flat)
+            return noise
+        noise *= self._inv_rate
+        np.floor(noise, out=noise)
+        u = self._rng.random(size=size)
+        # frac(2u)：先倍增再对 ≥1 的元素减一，避免较慢的 np.mod；
+        # 同一掩码（2u ≥ 1 ⇔ u ≥ 0.5）即为正号标记，无需再单独比较 u < 0.5
+        u *= 2.0
+        positive = u >= 1.0
+        u -= positive
+        # 偏移量 γ·1[frac(2u) < γ] 直接写回 u，免去额外的浮点临时数组
+        np.multiply(u < self.gamma, self.gamma, out=u)
+        noise += u
+        # 复用 u 存放 ±0.5 的符号载体，再以 copysign 一次性施加符号
+        np.subtract(positive, 0.5, out=u)
+        np.copysign(noise, u, out=noise)
+        noise *= self.sensitivity
+        return noise
+
+    def reseed(self, seed: Optional[Any]) -> None:
+        # 重置种子时丢弃已预抽取的噪声，保证后续输出只取决于新种子
+        super().reseed(seed)
+        self._buffer = None
+
+    def _next_buffered_noise(self) -> float:
+        # 懒加载标量噪声缓冲区，并从中取出下一个噪声值
+        if self._buffer is None:
+            self._buffer = _NoiseBuffer(lambda n: self._sample_noise((n,)), self.stream_block or 4096)
+        return next(self._buffer)
 
     def randomise(self, value: Any) -> Any:
         # 对输入值添加阶梯分布噪声，并通过 _restore_numeric_like 保持标量/数组语义
         """Add staircase-distributed noise to numeric inputs."""
         self.require_calibrated()
+        if isinstance(value, self._SCALAR_TYPES):
+            # 标量快路径：跳过数组规整与类型还原，直接采样单个噪声
+            noise = self._next_buffered_noise() if self.stream_block is not None else self._sample_noise(None)
+            return float(value) + float(noise)
         arr, was_scalar = self._coerce_numeric(value)
         size = None if was_scalar else arr.shape
-        noise = self._sample_noise(size)
+        if was_scalar and self.stream_block is not None:
+            noise = self._next_buffered_noise()
+        else:
+            noise = self._sample_noise(size)
         result = arr + noise
         return self._restore_numeric_like(value, result, was_scalar)
 
+    def randomise_batch(self, arrays: Sequence[Any]) -> List[np.ndarray]:
+        # 将所有输入的噪声合并为一次采样，再按各自大小切分并还原形状
+        """Add staircase noise to several arrays using a single noise draw."""
+        self.require_calibrated()
+        values = [np.asarray(arr, dtype=float) for arr in arrays]
+        if not values:
+            return []
+        sizes = [arr.size for arr in values]
+        noise = self._sample_noise((sum(sizes),))
+        chunks = np.split(noise, np.cumsum(sizes)[:-1])
+        return [arr + chunk.reshape(arr.shape) for arr, chunk in zip(values, chunks)]
+
     def serialize(self) -> Dict[str, Any]:
         # 在基类序列化结果基础上附加敏感度、γ 与校准参数，便于重建机制
         base = super().serialize()
@@ -129,6 +285,8 @@ class StaircaseMechanism(BaseMechanism):
                 "gamma": self.gamma,
                 "decay": self.decay,
                 "success_prob": self.success_prob,
+                "stream_block": self.stream_block,
+                "use_numba": self.use_numba,
             }
         )
         return base
@@ -142,9 +300,13 @@ class StaircaseMechanism(BaseMechanism):
             gamma=data.get("gamma", 0.5),
             rng=None,
             name=data.get("name"),
+            stream_block=data.get("stream_block"),
+            use_numba=data.get("use_numba", False),
         )
         inst._meta = dict(data.get("meta", {}))
         inst._calibrated = bool(data.get("calibrated", False))
         inst.decay = data.get("decay")
         inst.success_prob = data.get("success_prob")
+        if inst.decay is not None:
+            inst._cache_rates()
         return inst
@@ -3,7 +3,8 @@ Vector-valued mechanism applying element-wise noise.
 
 Responsibilities
   - Calibrate per-dimension noise using L1/L2 sensitivity.
-  - Support Laplace (pure DP) or Gaussian (approximate DP) noise.
+  - Support Laplace (pure DP), discrete Laplace (pure DP, integer-valued),
+    or Gaussian (approximate DP) noise.
   - Preserve input shape for numpy arrays and Python sequences.
 
 Usage Context
@@ -17,19 +18,70 @@ Limitations
 # 说明：向量值机制。
 # 职责：
 # - 基于 L1/L2 敏感度逐元素校准噪声
-# - 支持 Laplace（纯 DP）与 Gaussian（近似 DP）两种分布
+# - 支持 Laplace（纯 DP）、离散 Laplace（纯 DP，整数噪声）与 Gaussian（近似 DP）三种分布
 # - 保持输入形状与容器类型
 
 from __future__ import annotations
 
 import math
-from typing import Any, Dict, Optional
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence
 
 import numpy as np
 
 from dplib.core.privacy.base_mechanism import BaseMechanism, CalibrationError, MechanismError, ValidationError
 from dplib.core.utils.random import sample_noise
 
+# 说明：超过该元素数时将噪声采样切分到多个线程，每个分片至少包含 _PARALLEL_MIN_CHUNK 个元素
+_PARALLEL_MIN_SIZE = 10**6
+_PARALLEL_MIN_CHUNK = 2**18
+# 说明：支持的噪声/输出精度；bfloat16 以低 16 位清零的 float32 表示（NumPy 无原生 bfloat16）
+_SUPPORTED_DTYPES = ("float64", "float32", "float16", "bfloat16")
+
+
+def _parallel_sample(
+    rng: np.random.Generator,
+    kind: str,
+    scale: float,
+    size: Sequence[int],
+    nshard: int,
+    max_workers: int,
+) -> np.ndarray:
+    """Sample noise in contiguous chunks using jumped substreams of ``rng``."""
+    # 每个分片使用 rng.bit_generator.jumped(i) 派生的独立子流，结果只取决于 rng 当前状态与 nshard；
+    # max_workers 仅决定并发度，不影响采样结果；底层位生成器不支持 jumped（如 SFC64）或只有一个分片时退化为串行采样
+    shape = tuple(size)
+    bit_generator = rng.bit_generator
+    if nshard <= 1 or not hasattr(bit_generator, "jumped"):
+        return sample_noise(rng, kind, scale=scale, size=shape)
+    out = np.empty(shape, dtype=np.float64)
+    flat = out.reshape(-1)
+    bounds = np.linspace(0, flat.size, nshard + 1).astype(np.intp)
+    streams = [np.random.Generator(bit_generator.jumped(i + 1)) for i in range(nshard)]
+
+    def _fill(index: int) -> None:
+        # NumPy 的分布采样在填充时释放 GIL，因此各线程可真正并行
+        chunk = flat[bounds[index] : bounds[index + 1]]
+        if kind == "laplace":
+            chunk[...] = streams[index].laplace(0.0, scale, size=chunk.size)
+        else:
+            streams[index].standard_normal(out=chunk)
+            chunk *= scale
+
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, nshard))) as pool:
+        list(pool.map(_fill, range(nshard)))
+    # 将父生成器推进到所有子流之后，保证后续采样不与已用子流重叠
+    bit_generator.state = bit_generator.jumped(nshard + 1).state
+    return out
+
+
+def _truncate_bfloat16(arr: np.ndarray) -> np.ndarray:
+    """Round a float32 array toward zero to bfloat16 precision in place."""
+    # 清零 float32 尾数的低 16 位，保留 bfloat16 可表示的 8 位指数与 7 位尾数
+    arr.view(np.uint32)[...] &= np.uint32(0xFFFF0000)
+    return arr
+
 
 class VectorMechanism(BaseMechanism):
     """
@@ -39,14 +91,20 @@ class VectorMechanism(BaseMechanism):
       - epsilon: Privacy budget for noise calibration.
       - delta: Optional delta for Gaussian noise.
       - sensitivity: Global sensitivity for the vector query.
-      - distribution: "laplace" or "gaussian".
+      - distribution: "laplace", "discrete_laplace", or "gaussian".
       - norm: Sensitivity norm label ("l1" or "l2").
+      - dtype: Precision of array outputs ("float64", "float32", "float16",
+        or "bfloat16"; bfloat16 values are stored in a float32 array). Ignored
+        by "discrete_laplace", whose noise is integer-valued.
       - rng: Optional RNG for noise sampling.
       - name: Optional mechanism name override.
 
     - Behavior
-      - Calibrates scale or sigma based on distribution and delta.
+      - Calibrates scale, sigma, or the discrete Laplace decay based on
+        distribution and delta.
       - Adds independent noise to each coordinate.
+      - Discrete Laplace noise is the difference of two geometric draws and
+        keeps integer inputs integer-typed.
 
     - Usage Notes
       - Call `calibrate` before `randomise`.
@@ -60,6 +118,7 @@ class VectorMechanism(BaseMechanism):
         *,
         distribution: str = "gaussian",
         norm: str = "l2",
+        dtype: str = "float64",
         rng: Optional[Any] = None,
         name: Optional[str] = None,
     ):
@@ -69,16 +128,24 @@ class VectorMechanism(BaseMechanism):
         self.sensitivity = float(sensitivity)
         self.distribution = distribution.lower()
         self.norm = norm.lower()
+        self.dtype = str(dtype).lower()
         self.scale: Optional[float] = None
         self.sigma: Optional[float] = None
+        # 离散 Laplace 的衰减因子 exp(-ε/Δ) 与对应几何分布成功概率
+        self.decay: Optional[float] = None
+        self.success_prob: Optional[float] = None
+        # 校准时缓存的 float32 噪声幅度，供低精度采样路径直接使用
+        self._scale32: Optional[np.float32] = None
         self._validate_configuration()
 
     def _validate_configuration(self) -> None:
-        # 校验配置合法性：分布必须是 laplace/gaussian，范数必须是 l1/l2
-        if self.distribution not in {"laplace", "gaussian"}:
-            raise ValidationError("distribution must be 'laplace' or 'gaussian'")
+        # 校验配置合法性：分布必须是 laplace/discrete_laplace/gaussian，范数必须是 l1/l2，精度须为受支持的浮点类型
+        if self.distribution not in {"laplace", "discrete_laplace", "gaussian"}:
+            raise ValidationError("distribution must be 'laplace', 'discrete_laplace' or 'gaussian'")
         if self.norm not in {"l1", "l2"}:
             raise ValidationError("norm must be 'l1' or 'l2'")
+        if self.dtype not in _SUPPORTED_DTYPES:
+            raise ValidationError(f"dtype must be one of {', '.join(_SUPPORTED_DTYPES)}")
 
     # pylint: disable=arguments-differ
     def _calibrate_parameters(
@@ -89,7 +156,8 @@ class VectorMechanism(BaseMechanism):
         distribution: Optional[str] = None,
         **kwargs: Any,
     ) -> None:
-        # 根据更新后的敏感度/δ/分布类型计算噪声幅度：Laplace 使用 scale，Gaussian 使用 sigma
+        # 根据更新后的敏感度/δ/分布类型计算噪声幅度：Laplace 使用 scale，Gaussian 使用 sigma，
+        # 离散 Laplace 使用几何衰减因子 decay = exp(-ε/Δ)
         del kwargs
         if sensitivity is not None:
             self._validate_sensitivity(sensitivity)
@@ -102,34 +170,143 @@ class VectorMechanism(BaseMechanism):
 
         self._validate_configuration()
 
+        # 输入与上次校准一致且对应噪声参数已就绪时直接返回
+        signature = (self.sensitivity, self.delta, self.epsilon, self.distribution)
+        if self.distribution == "laplace":
+            target = self.scale
+        elif self.distribution == "discrete_laplace":
+            target = self.success_prob
+        else:
+            target = self.sigma
+        if signature == self._last_calib_sig and target is not None:
+            return
+        self.decay = None
+        self.success_prob = None
         if self.distribution == "laplace":
             self.scale = self.sensitivity / self.epsilon
             self.sigma = None
+        elif self.distribution == "discrete_laplace":
+            self.decay = math.exp(-self.epsilon / self.sensitivity)
+            self.success_prob = 1.0 - self.decay
+            if not (0.0 < self.success_prob < 1.0):
+                raise MechanismError("invalid calibration for discrete Laplace vector mechanism")
+            self.scale = None
+            self.sigma = None
         else:
             if self.delta <= 0 or self.delta >= 1:
                 raise MechanismError("delta must be in (0,1) for Gaussian vector mechanism")
             self.sigma = self.sensitivity * math.sqrt(2.0 * math.log(1.25 / self.delta)) / self.epsilon
             self.scale = None
+        self._cache_noise_scale()
         self._meta["distribution"] = self.distribution
         self._meta["norm"] = self.norm
+        self._last_calib_sig = signature
+
+    def _cache_noise_scale(self) -> None:
+        # 按当前分布缓存 float32 噪声幅度；校准与反序列化共用
+        active = self.scale if self.distribution == "laplace" else self.sigma
+        self._scale32 = None if active is None else np.float32(active)
 
     def randomise(self, value: Any) -> Any:
         # 对输入每个坐标添加独立噪声（Laplace 或 Gaussian），并保持标量/数组/序列的形状与类型
         """Add independent noise to each coordinate."""
         self.require_calibrated()
-        arr, was_scalar = self._coerce_numeric(value)
+        if self.distribution == "discrete_laplace":
+            return self._randomise_discrete(value)
+        if isinstance(value, self._SCALAR_TYPES):
+            # 标量快路径：跳过数组规整与类型还原，按当前分布直接采样单个噪声
+            if self.distribution == "laplace":
+                if self.scale is None:
+                    raise CalibrationError("Vector mechanism missing Laplace scale; call calibrate()")
+                return float(value) + float(self._rng.laplace(0.0, self.scale))
+            if self.sigma is None:
+                raise CalibrationError("Vector mechanism missing Gaussian sigma; call calibrate()")
+            return float(value) + float(self._rng.normal(0.0, self.sigma))
+        # 低精度模式下浮点 ndarray 直接参与运算，避免先提升到 float64 再降回
+        if self.dtype != "float64" and isinstance(value, np.ndarray) and value.dtype.kind == "f":
+            arr, was_scalar = value, value.ndim == 0
+        else:
+            arr, was_scalar = self._coerce_numeric(value)
         size = None if was_scalar else arr.shape
         if self.distribution == "laplace":
             if self.scale is None:
                 raise CalibrationError("Vector mechanism missing Laplace scale; call calibrate()")
-            noise = sample_noise(self._rng, "laplace", scale=self.scale, size=size)
+            scale = self.scale
         else:
             if self.sigma is None:
                 raise CalibrationError("Vector mechanism missing Gaussian sigma; call calibrate()")
-            noise = sample_noise(self._rng, "gaussian", scale=self.sigma, size=size)
+            scale = self.sigma
+        if self.dtype != "float64" and size is not None:
+            result = self._add_reduced_precision_noise(arr, scale)
+            return self._restore_numeric_like(value, result, was_scalar)
+        # 大数组按固定分片数采样（分片数只由元素个数决定，保证同一种子在不同主机上结果一致），
+        # CPU 数仅用作线程池并发度；小数组沿用单线程路径
+        if size is not None and arr.size >= _PARALLEL_MIN_SIZE:
+            nshard = math.ceil(arr.size / _PARALLEL_MIN_CHUNK)
+            noise = _parallel_sample(self._rng, self.distribution, scale, size, nshard, os.cpu_count() or 1)
+        else:
+            noise = sample_noise(self._rng, self.distribution, scale=scale, size=size)
         result = arr + noise
         return self._restore_numeric_like(value, result, was_scalar)
 
+    def randomise_batch(self, arrays: Sequence[Any]) -> List[Any]:
+        # 将所有输入的噪声合并为一次采样后按大小切分；低精度与离散分布沿用逐个 randomise
+        """Add noise to several arrays using a single noise draw."""
+        if self.distribution == "discrete_laplace" or self.dtype != "float64":
+            return super().randomise_batch(arrays)
+        self.require_calibrated()
+        scale = self.scale if self.distribution == "laplace" else self.sigma
+        if scale is None:
+            raise CalibrationError("Vector mechanism not calibrated; call calibrate()")
+        values = [np.asarray(arr, dtype=float) for arr in arrays]
+        if not values:
+            return []
+        sizes = [arr.size for arr in values]
+        noise = sample_noise(self._rng, self.distribution, scale=scale, size=(sum(sizes),))
+        chunks = np.split(noise, np.cumsum(sizes)[:-1])
+        return [arr + chunk.reshape(arr.shape) for arr, chunk in zip(values, chunks)]
+
+    def _randomise_discrete(self, value: Any) -> Any:
+        # 离散 Laplace：噪声为两个独立 Geometric(1 - decay) 之差（两者的 -1 偏移相互抵消），取值为整数；
+        # 有符号整数 ndarray 直接在整数域相加，其余输入按几何机制的方式保持整数类型
+        p = self.success_prob
+        if p is None:
+            raise CalibrationError("Vector mechanism missing discrete Laplace decay; call calibrate()")
+        if isinstance(value, self._SCALAR_TYPES):
+            noise = int(self._rng.geometric(p)) - int(self._rng.geometric(p))
+            return self._integer_preserving_restore(value, float(value) + noise, True)
+        if isinstance(value, np.ndarray) and value.dtype.kind == "i" and value.ndim > 0:
+            noise = self._rng.geometric(p, size=value.shape)
+            noise -= self._rng.geometric(p, size=value.shape)
+            return (value + noise).astype(value.dtype, copy=False)
+        arr, was_scalar = self._coerce_numeric(value)
+        size = None if was_scalar else arr.shape
+        noise = self._rng.geometric(p, size=size) - self._rng.geometric(p, size=size)
+        return self._integer_preserving_restore(value, arr + noise, was_scalar)
+
+    def _add_reduced_precision_noise(self, arr: np.ndarray, scale: float) -> np.ndarray:
+        # 以 float32 采样噪声（Laplace 取两个指数分布之差），再按配置精度与输入相加；
+        # 结果写入新数组，不修改调用方传入的数据
+        shape = arr.shape
+        if self.distribution == "gaussian":
+            noise = self._rng.standard_normal(size=shape, dtype=np.float32)
+        else:
+            noise = self._rng.standard_exponential(size=shape, dtype=np.float32)
+            noise -= self._rng.standard_exponential(size=shape, dtype=np.float32)
+        noise *= self._scale32 if self._scale32 is not None else np.float32(scale)
+        if self.dtype == "float16":
+            result = arr.astype(np.float16)
+            np.add(result, noise, out=result, casting="same_kind")
+            return result
+        result = arr.astype(np.float32)
+        if self.dtype == "bfloat16":
+            _truncate_bfloat16(result)
+            _truncate_bfloat16(noise)
+        np.add(result, noise, out=result)
+        if self.dtype == "bfloat16":
+            _truncate_bfloat16(result)
+        return result
+
     def serialize(self) -> Dict[str, Any]:
         # 在基类序列化结果上补充向量机制特有的敏感度、分布、范数及标定参数
         base = super().serialize()
@@ -138,8 +315,11 @@ class VectorMechanism(BaseMechanism):
                 "sensitivity": self.sensitivity,
                 "distribution": self.distribution,
                 "norm": self.norm,
+                "dtype": self.dtype,
                 "scale": self.scale,
                 "sigma": self.sigma,
+                "decay": self.decay,
+                "success_prob": self.success_prob,
             }
         )
         return base
@@ -153,6 +333,7 @@ class VectorMechanism(BaseMechanism):
             sensitivity=data.get("sensitivity", 1.0),
             distribution=data.get("distribution", "gaussian"),
             norm=data.get("norm", "l2"),
+            dtype=data.get("dtype", "float64"),
             rng=None,
             name=data.get("name"),
         )
@@ -160,4 +341,7 @@ class VectorMechanism(BaseMechanism):
         inst._calibrated = bool(data.get("calibrated", False))
         inst.scale = data.get("scale")
         inst.sigma = data.get("sigma")
+        inst.decay = data.get("decay")
+        inst.success_prob = data.get("success_prob")
+        inst._cache_noise_scale()
         return inst
@@ -20,14 +20,21 @@ Limitations
 
 from __future__ import annotations
 
+import functools
 import importlib.util
+import sys
 from dataclasses import dataclass, field
+from types import MappingProxyType
 from typing import Any, Dict, Mapping, Optional
 
+from dplib.core.utils.compat import DATACLASS_SLOTS
 from dplib.core.utils.param_validation import ensure, ensure_type, ParamValidationError
 
 from ..exceptions import BackendNotAvailable
 
+# 共享的只读空元数据映射，常见的无元数据场景不再为每个实例分配字典
+_EMPTY_METADATA: Mapping[str, Any] = MappingProxyType({})
+
 __all__ = [
     "BackendCapabilities",
     "BackendSpec",
@@ -36,7 +43,7 @@ __all__ = [
 ]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class BackendCapabilities:
     """
     Capability metadata for an ML backend.
@@ -60,7 +67,7 @@ class BackendCapabilities:
     supports_gpu: bool = False
     supports_callbacks: bool = True
     supports_partial_fit: bool = False
-    metadata: Mapping[str, Any] = field(default_factory=dict)
+    metadata: Mapping[str, Any] = field(default_factory=lambda: _EMPTY_METADATA)
 
     def to_dict(self) -> Dict[str, Any]:
         """Export capabilities to a JSON-friendly dictionary."""
@@ -86,7 +93,7 @@ class BackendCapabilities:
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class BackendSpec:
     """
     Specification for an ML backend implementation.
@@ -152,62 +159,86 @@ class BackendSpec:
         )
 
 
-_BACKEND_SPECS: Dict[str, BackendSpec] = {
-    "sklearn": BackendSpec(
-        name="sklearn",
-        module="sklearn",
-        extras="ml",
-        capabilities=BackendCapabilities(
-            supports_dp=False,
-            supports_gpu=False,
-            supports_callbacks=True,
-            supports_partial_fit=True,
+# 说明：内置后端规范表在导入后以只读映射暴露，防止运行期被意外修改
+_BACKEND_SPECS: Mapping[str, BackendSpec] = MappingProxyType(
+    {
+        "sklearn": BackendSpec(
+            name="sklearn",
+            module="sklearn",
+            extras="ml",
+            capabilities=BackendCapabilities(
+                supports_dp=False,
+                supports_gpu=False,
+                supports_callbacks=True,
+                supports_partial_fit=True,
+            ),
         ),
-    ),
-    "torch": BackendSpec(
-        name="torch",
-        module="torch",
-        extras="ml-torch",
-        capabilities=BackendCapabilities(
-            supports_dp=True,
-            supports_gpu=True,
-            supports_callbacks=True,
-            supports_partial_fit=False,
+        "torch": BackendSpec(
+            name="torch",
+            module="torch",
+            extras="ml-torch",
+            capabilities=BackendCapabilities(
+                supports_dp=True,
+                supports_gpu=True,
+                supports_callbacks=True,
+                supports_partial_fit=False,
+            ),
         ),
-    ),
-    "tensorflow": BackendSpec(
-        name="tensorflow",
-        module="tensorflow",
-        extras="ml-tf",
-        capabilities=BackendCapabilities(
-            supports_dp=True,
-            supports_gpu=True,
-            supports_callbacks=True,
-            supports_partial_fit=False,
+        "tensorflow": BackendSpec(
+            name="tensorflow",
+            module="tensorflow",
+            extras="ml-tf",
+            capabilities=BackendCapabilities(
+                supports_dp=True,
+                supports_gpu=True,
+                supports_callbacks=True,
+                supports_partial_fit=False,
+            ),
         ),
-    ),
-}
+    }
+)
+# 已规范化的后端名称（驻留字符串），命中时 get_backend 可跳过 strip/lower
+_KNOWN_NAMES = frozenset(sys.intern(name) for name in _BACKEND_SPECS)
 
 
-def detect_available_backends() -> Dict[str, BackendSpec]:
-    """Detect installed ML backends using importlib specs."""
-    # 使用 importlib.util.find_spec 探测已安装的后端依赖
+@functools.lru_cache(maxsize=1)
+def _detect_cached() -> Mapping[str, BackendSpec]:
+    # 使用 importlib.util.find_spec 探测已安装的后端依赖；find_spec 需遍历 sys.path，
+    # 结果在进程内缓存并以只读映射返回，避免每次获取后端时重复扫描
     detected: Dict[str, BackendSpec] = {}
     for name, spec in _BACKEND_SPECS.items():
         available = importlib.util.find_spec(spec.module) is not None
         detected[name] = spec.with_availability(available)
-    return detected
+    return MappingProxyType(detected)
+
+
+def detect_available_backends() -> Dict[str, BackendSpec]:
+    """Detect installed ML backends using importlib specs.
+
+    Results are cached for the lifetime of the process; call
+    ``detect_available_backends.cache_clear()`` after installing a backend
+    at runtime to force a fresh scan.
+    """
+    # 返回缓存探测结果的副本，调用方修改返回字典不会影响缓存
+    return dict(_detect_cached())
+
+
+# 暴露缓存清理入口，便于测试或运行期安装依赖后重新探测
+detect_available_backends.cache_clear = _detect_cached.cache_clear  # type: ignore[attr-defined]
 
 
 def get_backend(name: str) -> BackendSpec:
     """Return an available backend spec or raise an error."""
     # 获取指定名称的后端规范，若缺失则抛出明确的异常提示
     ensure_type(name, (str,), label="name")
-    normalized = name.strip().lower()
-    ensure(normalized != "", "backend name must be non-empty")
-    if normalized not in _BACKEND_SPECS:
-        raise ParamValidationError(f"unknown backend '{name}'")
-    spec = detect_available_backends()[normalized]
+    if name in _KNOWN_NAMES:
+        normalized = name
+    else:
+        normalized = name.strip().lower()
+        ensure(normalized != "", "backend name must be non-empty")
+        if normalized not in _BACKEND_SPECS:
+            raise ParamValidationError(f"unknown backend '{name}'")
+    spec = _detect_cached()[normalized]
     if not spec.available:
         raise BackendNotAvailable(spec.name, extras=spec.extras)
     return spec
@@ -21,23 +21,23 @@ Limitations
 
 from __future__ import annotations
 
-import inspect
-from typing import Any, Iterable, Mapping, Optional, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterable, Mapping, Optional, Sequence
 
 from dplib.core.utils.logging import get_logger
 from dplib.core.utils.param_validation import ensure, ensure_type
 
+from .estimator_wrappers import _supports_argument
+
 logger = get_logger(__name__)
 
 
-def _supports_argument(func: Any, name: str) -> bool:
-    """Check whether a callable accepts a named argument."""
-    # 使用签名检查方法是否接受指定参数名，无法检查时默认不传递
-    try:
-        signature = inspect.signature(func)
-    except (TypeError, ValueError):
-        return False
-    return name in signature.parameters
+def _resolve_partial_fit(estimator: Any) -> Optional[Callable[..., Any]]:
+    """Return the bound partial_fit method of an estimator, or None if unusable."""
+    # 一次性解析估计器的 partial_fit 绑定方法；不存在或不可调用时返回 None。
+    # 按实例解析而非按类缓存：sklearn 的 available_if 等描述符会依实例状态决定方法是否存在
+    partial_fit = getattr(estimator, "partial_fit", None)
+    return partial_fit if callable(partial_fit) else None
 
 
 class Callback:
@@ -87,6 +87,8 @@ class CallbackRunner:
 
     - Configuration
       - callbacks: Iterable of Callback instances.
+      - overlap: When True, step/epoch end callbacks for epoch i-1 run while
+        partial_fit for epoch i executes on a worker thread.
 
     - Behavior
       - Uses partial_fit when available, emitting one step per epoch.
@@ -94,13 +96,18 @@ class CallbackRunner:
 
     - Usage Notes
       - Provide classes when using partial_fit for classifiers.
+      - With overlap enabled, end-of-epoch callbacks must not read or mutate
+        estimator state, since the next partial_fit may be running; the
+        on_epoch_start hook of epoch i fires before the end hooks of i-1.
     """
     # 训练回调运行器，围绕 fit/partial_fit 触发生命周期事件
 
-    def __init__(self, callbacks: Optional[Iterable[Callback]] = None) -> None:
+    def __init__(self, callbacks: Optional[Iterable[Callback]] = None, *, overlap: bool = False) -> None:
         """Create a callback runner with optional callbacks."""
-        # 初始化回调列表，缺省时使用空列表
+        # 初始化回调列表，缺省时使用空列表；overlap 控制是否让回调与下一轮训练并行
+        ensure_type(overlap, (bool,), label="overlap")
         self.callbacks = list(callbacks) if callbacks is not None else []
+        self.overlap = overlap
 
     def run(
         self,
@@ -117,6 +124,11 @@ class CallbackRunner:
         # 执行训练并在关键阶段触发回调事件
         ensure_type(epochs, (int,), label="epochs")
         ensure(epochs > 0, "epochs must be > 0")
+        partial_fit = _resolve_partial_fit(estimator)
+        if partial_fit is None and epochs == 1 and not self.callbacks:
+            # 最常见的无回调单次 fit 场景：直接调用 fit，跳过上下文构建与事件分发
+            self._call_fit(estimator, features, labels, sample_weight=sample_weight)
+            return estimator
         context: dict[str, Any] = {
             "estimator": estimator,
             "epochs": epochs,
@@ -125,17 +137,30 @@ class CallbackRunner:
         for callback in self.callbacks:
             callback.on_train_start(context)
 
-        if hasattr(estimator, "partial_fit") and callable(getattr(estimator, "partial_fit")):
-            for epoch in range(epochs):
-                context["epoch"] = epoch
-                for callback in self.callbacks:
-                    callback.on_epoch_start(context)
-                self._call_partial_fit(estimator, features, labels, sample_weight=sample_weight, classes=classes)
-                context["step"] = epoch
-                for callback in self.callbacks:
-                    callback.on_step_end(context)
-                for callback in self.callbacks:
-                    callback.on_epoch_end(context)
+        if partial_fit is not None:
+            # 在 epoch 循环外一次性完成方法解析与签名检查，循环内只剩 partial_fit 调用本身
+            fit_kwargs = self._partial_fit_kwargs(partial_fit, sample_weight=sample_weight, classes=classes)
+            if not self.callbacks:
+                # 无回调的常见场景：直接循环 partial_fit，跳过全部事件分发
+                for _epoch in range(epochs):
+                    partial_fit(features, labels, **fit_kwargs)
+            elif self.overlap:
+                self._run_overlapped(partial_fit, features, labels, fit_kwargs, epochs, context)
+            else:
+                # 在循环外预先绑定各事件的回调方法，避免每轮重复属性查找
+                epoch_start = [callback.on_epoch_start for callback in self.callbacks]
+                step_end = [callback.on_step_end for callback in self.callbacks]
+                epoch_end = [callback.on_epoch_end for callback in self.callbacks]
+                for epoch in range(epochs):
+                    context["epoch"] = epoch
+                    for hook in epoch_start:
+                        hook(context)
+                    partial_fit(features, labels, **fit_kwargs)
+                    context["step"] = epoch
+                    for hook in step_end:
+                        hook(context)
+                    for hook in epoch_end:
+                        hook(context)
             context["epochs_run"] = epochs
         else:
             if epochs > 1:
@@ -155,6 +180,43 @@ class CallbackRunner:
             callback.on_train_end(context)
         return estimator
 
+    def _run_overlapped(
+        self,
+        partial_fit: Callable[..., Any],
+        features: Any,
+        labels: Any,
+        fit_kwargs: Mapping[str, Any],
+        epochs: int,
+        context: dict[str, Any],
+    ) -> None:
+        """Run partial_fit on a worker thread while end callbacks of the previous epoch execute."""
+        # 单工作线程执行 partial_fit（其 Cython/BLAS 内核会释放 GIL），主线程同时处理上一轮的结束回调；
+        # 任一时刻只有一个 partial_fit 在执行，估计器不会被并发修改；回调始终在主线程中串行触发
+        epoch_start = [callback.on_epoch_start for callback in self.callbacks]
+        step_end = [callback.on_step_end for callback in self.callbacks]
+        epoch_end = [callback.on_epoch_end for callback in self.callbacks]
+
+        def _emit_end(epoch: int) -> None:
+            context["epoch"] = epoch
+            context["step"] = epoch
+            for hook in step_end:
+                hook(context)
+            for hook in epoch_end:
+                hook(context)
+
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            for epoch in range(epochs):
+                context["epoch"] = epoch
+                for hook in epoch_start:
+                    hook(context)
+                future = pool.submit(partial_fit, features, labels, **fit_kwargs)
+                try:
+                    if epoch > 0:
+                        _emit_end(epoch - 1)
+                finally:
+                    future.result()
+        _emit_end(epochs - 1)
+
     def _call_fit(
         self,
         estimator: Any,
@@ -170,20 +232,18 @@ class CallbackRunner:
             fit_kwargs["sample_weight"] = sample_weight
         estimator.fit(features, labels, **fit_kwargs)
 
-    def _call_partial_fit(
-        self,
-        estimator: Any,
-        features: Any,
-        labels: Any,
+    @staticmethod
+    def _partial_fit_kwargs(
+        partial_fit: Callable[..., Any],
         *,
         sample_weight: Optional[Any] = None,
         classes: Optional[Sequence[Any]] = None,
-    ) -> None:
-        """Call estimator.partial_fit with supported arguments."""
-        # 调用 partial_fit 时按需传递 classes 与 sample_weight
+    ) -> dict[str, Any]:
+        """Build the optional keyword arguments accepted by partial_fit."""
+        # 仅收集 partial_fit 签名中存在的可选参数
         fit_kwargs: dict[str, Any] = {}
-        if sample_weight is not None and _supports_argument(estimator.partial_fit, "sample_weight"):
+        if sample_weight is not None and _supports_argument(partial_fit, "sample_weight"):
             fit_kwargs["sample_weight"] = sample_weight
-        if classes is not None and _supports_argument(estimator.partial_fit, "classes"):
+        if classes is not None and _supports_argument(partial_fit, "classes"):
             fit_kwargs["classes"] = classes
-        estimator.partial_fit(features, labels, **fit_kwargs)
+        return fit_kwargs
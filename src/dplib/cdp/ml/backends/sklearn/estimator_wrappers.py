@@ -20,33 +20,71 @@ Limitations
 
 from __future__ import annotations
 
+import functools
 import inspect
-from typing import Any, Mapping, Optional
+from typing import Any, Dict, Mapping, Optional
 
 from dplib.core.utils.logging import get_logger
 from dplib.core.utils.param_validation import ensure, ensure_type, ParamValidationError
 
 logger = get_logger(__name__)
 
+# 说明：ensure_type 使用的类型元组在模块级预先构建，避免每次构造包装器时重复分配
+_T_INT = (int,)
+
+
+@functools.lru_cache(maxsize=512)
+def _signature_for(func: Any, bound: bool) -> inspect.Signature:
+    # 按底层函数缓存签名；绑定方法去掉首个 self/cls 参数，与 inspect.signature 对绑定方法的处理一致
+    signature = inspect.signature(func)
+    if bound:
+        params = list(signature.parameters.values())
+        if params and params[0].kind in (params[0].POSITIONAL_ONLY, params[0].POSITIONAL_OR_KEYWORD):
+            signature = signature.replace(parameters=params[1:])
+    return signature
+
+
+def _cached_signature(func: Any) -> inspect.Signature:
+    """Return the signature of a callable, reusing cached results for the same function."""
+    # 优先使用显式声明的 __signature__；绑定方法每次访问都是新对象，因此以其 __func__ 作为缓存键
+    declared = getattr(func, "__signature__", None)
+    if isinstance(declared, inspect.Signature):
+        return declared
+    target = getattr(func, "__func__", None)
+    try:
+        if target is not None:
+            return _signature_for(target, True)
+        return _signature_for(func, False)
+    except TypeError:
+        # 不可哈希的可调用对象无法进入缓存，退回直接计算
+        return inspect.signature(func)
+
 
 def _supports_argument(func: Any, name: str) -> bool:
     """Check whether a callable accepts a named argument."""
-    # 使用签名检查方法是否接受指定参数名，无法检查时默认不传递
+    # 使用签名检查方法是否接受指定参数名，无法检查时默认不传递；
+    # 普通 Python 函数先用 __code__ 中的具名参数做快速肯定判断（与签名参数集合一致），
+    # 显式声明 __signature__ 或经装饰器包装（__wrapped__）的可调用对象交由完整签名解析
+    if getattr(func, "__signature__", None) is None and getattr(func, "__wrapped__", None) is None:
+        code = getattr(func, "__code__", None)
+        if code is not None:
+            named_args = code.co_varnames[: code.co_argcount + code.co_kwonlyargcount]
+            if name in named_args:
+                return True
     try:
-        signature = inspect.signature(func)
+        signature = _cached_signature(func)
     except (TypeError, ValueError):
         return False
     return name in signature.parameters
 
 
-def _filter_kwargs(func: Any, values: Mapping[str, Any]) -> dict[str, Any]:
-    """Filter kwargs to those supported by the callable signature."""
-    # 根据函数签名过滤可用参数，避免向 sklearn 方法传入未知参数
+def _param_names(func: Any) -> frozenset[str]:
+    """Return the parameter names accepted by a callable, or an empty set if unknown."""
+    # 预先提取方法的参数名集合，后续调用只需做集合成员判断
     try:
-        signature = inspect.signature(func)
+        return frozenset(_cached_signature(func).parameters)
     except (TypeError, ValueError):
-        return {}
-    return {key: value for key, value in values.items() if key in signature.parameters}
+        return frozenset()
 
 
 def _set_param_if_supported(estimator: Any, name: str, value: Any) -> bool:
@@ -54,15 +92,24 @@ def _set_param_if_supported(estimator: Any, name: str, value: Any) -> bool:
     # 若估计器支持指定参数则进行设置，返回是否设置成功
     if value is None:
         return False
-    if hasattr(estimator, "get_params") and hasattr(estimator, "set_params"):
-        params = estimator.get_params(deep=False)
-        if name in params:
-            estimator.set_params(**{name: value})
-            return True
-    if hasattr(estimator, name):
+    # 说明：sklearn 约定超参数均以同名属性保存，先做属性探测即可排除不支持的参数，
+    # 避免 get_params 构建整份参数字典；非超参数属性由 set_params 报错后回退到 setattr
+    if not hasattr(estimator, name):
+        return False
+    if hasattr(type(estimator), "_get_param_names"):
+        # 说明：BaseEstimator.set_params 对非嵌套键本身只做 setattr，其内部仍会调用 get_params，
+        # 因此对 sklearn 估计器直接赋值即可
         setattr(estimator, name, value)
         return True
-    return False
+    set_params = getattr(estimator, "set_params", None)
+    if set_params is not None:
+        try:
+            set_params(**{name: value})
+            return True
+        except (ValueError, TypeError):
+            pass
+    setattr(estimator, name, value)
+    return True
 
 
 class SklearnEstimatorWrapper:
@@ -83,6 +130,8 @@ class SklearnEstimatorWrapper:
 
     - Usage Notes
       - Use with any estimator exposing fit/predict/score methods.
+      - Supported keyword arguments are resolved at construction; wrap a new
+        estimator instead of reassigning `estimator` on an existing wrapper.
     """
     # sklearn 估计器包装类，用于统一训练与评估调用并处理常见参数
 
@@ -104,13 +153,25 @@ class SklearnEstimatorWrapper:
         ensure(hasattr(estimator, "predict"), "estimator must implement predict")
         ensure(hasattr(estimator, "score"), "estimator must implement score")
         if random_state is not None:
-            ensure_type(random_state, (int,), label="random_state")
+            ensure_type(random_state, _T_INT, label="random_state")
         self.estimator = estimator
         self.class_weight = class_weight
         self.random_state = random_state
         self.dp_enabled = bool(dp_enabled)
-        self.dp_params = dict(dp_params) if dp_params is not None else {}
-        self.metadata = dict(metadata) if metadata is not None else {}
+        # 输入已是 dict 时使用更快的 dict.copy 做防御性拷贝
+        self.dp_params: Dict[str, Any] = {}
+        if dp_params is not None:
+            self.dp_params = dp_params.copy() if type(dp_params) is dict else dict(dp_params)
+        self.metadata: Dict[str, Any] = {}
+        if metadata is not None:
+            self.metadata = metadata.copy() if type(metadata) is dict else dict(metadata)
+        # 估计器方法及其签名在包装器生命周期内不变，构造时一次性绑定方法并解析可接受的参数名
+        self._fit = estimator.fit
+        self._predict = estimator.predict
+        self._score = estimator.score
+        self._fit_params = _param_names(self._fit)
+        self._predict_params = _param_names(self._predict)
+        self._score_params = _param_names(self._score)
 
         if _set_param_if_supported(self.estimator, "random_state", self.random_state):
             logger.debug("Set random_state on sklearn estimator.")
@@ -130,20 +191,27 @@ class SklearnEstimatorWrapper:
     ) -> "SklearnEstimatorWrapper":
         """Fit the wrapped estimator with normalized arguments."""
         # 统一处理样本权重与类别权重，并过滤不支持的关键字参数
-        fit_kwargs = _filter_kwargs(self.estimator.fit, kwargs)
-        if sample_weight is not None and _supports_argument(self.estimator.fit, "sample_weight"):
+        if not kwargs and sample_weight is None and class_weight is None and self.class_weight is None:
+            # 无任何附加参数的常见情形直接调用，跳过参数过滤
+            self._fit(features, labels)
+            return self
+        fit_params = self._fit_params
+        fit_kwargs = {key: value for key, value in kwargs.items() if key in fit_params}
+        if sample_weight is not None and "sample_weight" in fit_params:
             fit_kwargs["sample_weight"] = sample_weight
         effective_class_weight = class_weight if class_weight is not None else self.class_weight
-        if effective_class_weight is not None and _supports_argument(self.estimator.fit, "class_weight"):
+        if effective_class_weight is not None and "class_weight" in fit_params:
             fit_kwargs["class_weight"] = effective_class_weight
-        self.estimator.fit(features, labels, **fit_kwargs)
+        self._fit(features, labels, **fit_kwargs)
         return self
 
     def predict(self, features: Any, **kwargs: Any) -> Any:
         """Predict using the wrapped estimator."""
         # 过滤 predict 的可用参数，避免向 sklearn 传入未知参数
-        predict_kwargs = _filter_kwargs(self.estimator.predict, kwargs)
-        return self.estimator.predict(features, **predict_kwargs)
+        if not kwargs:
+            return self._predict(features)
+        predict_kwargs = {key: value for key, value in kwargs.items() if key in self._predict_params}
+        return self._predict(features, **predict_kwargs)
 
     def score(
         self,
@@ -155,7 +223,9 @@ class SklearnEstimatorWrapper:
     ) -> float:
         """Score the wrapped estimator with optional sample weights."""
         # 过滤 score 的可用参数并按需传递 sample_weight
-        score_kwargs = _filter_kwargs(self.estimator.score, kwargs)
-        if sample_weight is not None and _supports_argument(self.estimator.score, "sample_weight"):
+        if sample_weight is None and not kwargs:
+            return float(self._score(features, labels))
+        score_kwargs = {key: value for key, value in kwargs.items() if key in self._score_params}
+        if sample_weight is not None and "sample_weight" in self._score_params:
             score_kwargs["sample_weight"] = sample_weight
-        return float(self.estimator.score(features, labels, **score_kwargs))
+        return float(self._score(features, labels, **score_kwargs))
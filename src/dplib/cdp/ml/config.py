@@ -23,11 +23,57 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import Any, Dict, Mapping, Optional
 
+from dplib.core.utils.compat import DATACLASS_SLOTS
 from dplib.core.utils.param_validation import ensure, ensure_type, ParamValidationError
 
 
-@dataclass
-class ModelConfig:
+# 说明：ensure_type 使用的类型元组在模块级预先构建，避免每次 validate 重复分配
+_T_INT = (int,)
+_T_FLOAT = (float, int)
+_T_BOOL = (bool,)
+_T_STR = (str,)
+
+
+def _is_mapping_fast(value: Any) -> bool:
+    # 常见的 dict 输入仅做一次类型身份比较，其余情况才走 Mapping ABC 的 isinstance 检查
+    return type(value) is dict or isinstance(value, Mapping)
+
+
+def _copy_mapping(value: Mapping[str, Any]) -> Dict[str, Any]:
+    # 浅拷贝映射：dict 输入走更快的 dict.copy，其余 Mapping 退回 dict() 构造
+    return value.copy() if type(value) is dict else dict(value)
+
+
+def _field_default(cls: type, name: str) -> Any:
+    # 读取数据类字段的声明默认值；启用 __slots__ 后类属性变为槽描述符，不能再用 cls.<name> 取默认值
+    return cls.__dataclass_fields__[name].default  # type: ignore[attr-defined]
+
+
+class _ValidationCache:
+    """Mixin that remembers a successful validate() until a field is reassigned."""
+
+    # 说明：validate 成功后置位 _validated，任一字段被重新赋值即清除标记，
+    # 使重复校验在配置未变时只需一次属性读取；
+    # 标记存放在本混入类的槽中而非数据类字段，不会出现在 fields()/asdict()/序列化输出里
+    __slots__ = ("_validated",)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        object.__setattr__(self, name, value)
+        if name != "_validated":
+            object.__setattr__(self, "_validated", False)
+
+    def _is_validated(self) -> bool:
+        # 槽在首次赋值前未初始化（如 pickle/copy 经 object.__setattr__ 还原字段时），视为未校验
+        return getattr(self, "_validated", False)
+
+    def invalidate(self) -> None:
+        """Drop the cached validation result after in-place mutation (e.g. of params)."""
+        # 说明：字段重新赋值会自动清除标记，但就地修改 dict 等可变字段无法被感知，需显式调用
+        object.__setattr__(self, "_validated", False)
+
+
+@dataclass(**DATACLASS_SLOTS)
+class ModelConfig(_ValidationCache):
     """
     Model configuration describing the model type and backend.
 
@@ -46,16 +92,19 @@ class ModelConfig:
 
     model_type: str
     backend: Optional[str] = None
-    params: Mapping[str, Any] = field(default_factory=dict)
+    params: Dict[str, Any] = field(default_factory=dict)
 
     def validate(self) -> "ModelConfig":
-        # 校验模型名称与参数类型，确保后续工厂逻辑可用
-        ensure_type(self.model_type, (str,), label="model_type")
+        # 校验模型名称与参数类型，确保后续工厂逻辑可用；字段未变时复用上次校验结果
+        if self._is_validated():
+            return self
+        ensure_type(self.model_type, _T_STR, label="model_type")
         ensure(self.model_type.strip() != "", "model_type must be non-empty")
         if self.backend is not None:
-            ensure_type(self.backend, (str,), label="backend")
+            ensure_type(self.backend, _T_STR, label="backend")
             ensure(self.backend.strip() != "", "backend must be non-empty")
-        ensure_type(self.params, (Mapping,), label="params")
+        ensure(_is_mapping_fast(self.params), "params must be instance of Mapping")
+        self._validated = True
         return self
 
     def to_dict(self) -> Dict[str, Any]:
@@ -64,7 +113,7 @@ class ModelConfig:
         return {
             "model_type": self.model_type,
             "backend": self.backend,
-            "params": dict(self.params),
+            "params": _copy_mapping(self.params),
         }
 
     @classmethod
@@ -76,12 +125,12 @@ class ModelConfig:
         return cls(
             model_type=data["model_type"],
             backend=data.get("backend"),
-            params=data.get("params", {}),
+            params=dict(data.get("params", {})),
         )
 
 
-@dataclass
-class TrainingConfig:
+@dataclass(**DATACLASS_SLOTS)
+class TrainingConfig(_ValidationCache):
     """
     Training configuration for ML workloads.
 
@@ -107,16 +156,34 @@ class TrainingConfig:
     seed: Optional[int] = None
 
     def validate(self) -> "TrainingConfig":
-        # 校验训练参数的基本范围，确保训练循环的基本假设成立
-        ensure_type(self.epochs, (int,), label="epochs")
-        ensure_type(self.batch_size, (int,), label="batch_size")
-        ensure_type(self.learning_rate, (float, int), label="learning_rate")
-        ensure_type(self.shuffle, (bool,), label="shuffle")
+        # 校验训练参数的基本范围，确保训练循环的基本假设成立；字段未变时复用上次校验结果
+        if self._is_validated():
+            return self
+        epochs, batch_size, learning_rate = self.epochs, self.batch_size, self.learning_rate
+        if (
+            type(epochs) is int
+            and type(batch_size) is int
+            and type(learning_rate) in _T_FLOAT
+            and type(self.shuffle) is bool
+            and (self.seed is None or type(self.seed) is int)
+            and epochs > 0
+            and batch_size > 0
+            and learning_rate > 0
+        ):
+            # 说明：常见取值均为内置精确类型，单条布尔表达式即可完成全部检查；
+            # 其余情形（子类、numpy 标量或非法值）交由下方逐项检查给出具体错误
+            self._validated = True
+            return self
+        ensure_type(self.epochs, _T_INT, label="epochs")
+        ensure_type(self.batch_size, _T_INT, label="batch_size")
+        ensure_type(self.learning_rate, _T_FLOAT, label="learning_rate")
+        ensure_type(self.shuffle, _T_BOOL, label="shuffle")
         ensure(self.epochs > 0, "epochs must be > 0")
         ensure(self.batch_size > 0, "batch_size must be > 0")
         ensure(self.learning_rate > 0, "learning_rate must be > 0")
         if self.seed is not None:
-            ensure_type(self.seed, (int,), label="seed")
+            ensure_type(self.seed, _T_INT, label="seed")
+        self._validated = True
         return self
 
     def to_dict(self) -> Dict[str, Any]:
@@ -139,16 +206,16 @@ class TrainingConfig:
         lr_value = data.get("learning_rate")
         shuffle_value = data.get("shuffle")
         return cls(
-            epochs=int(epochs_value) if epochs_value is not None else cls.epochs,
-            batch_size=int(batch_value) if batch_value is not None else cls.batch_size,
-            learning_rate=float(lr_value) if lr_value is not None else cls.learning_rate,
-            shuffle=shuffle_value if shuffle_value is not None else cls.shuffle,
+            epochs=int(epochs_value) if epochs_value is not None else _field_default(cls, "epochs"),
+            batch_size=int(batch_value) if batch_value is not None else _field_default(cls, "batch_size"),
+            learning_rate=float(lr_value) if lr_value is not None else _field_default(cls, "learning_rate"),
+            shuffle=shuffle_value if shuffle_value is not None else _field_default(cls, "shuffle"),
             seed=data.get("seed"),
         )
 
 
-@dataclass
-class DPConfig:
+@dataclass(**DATACLASS_SLOTS)
+class DPConfig(_ValidationCache):
     """
     Differential privacy configuration for training.
 
@@ -174,23 +241,36 @@ class DPConfig:
     max_grad_norm: Optional[float] = None
 
     def validate(self) -> "DPConfig":
-        # 校验 DP 训练参数的范围，并在启用 DP 时要求关键字段存在
-        ensure_type(self.enabled, (bool,), label="enabled")
+        # 校验 DP 训练参数的范围，并在启用 DP 时要求关键字段存在；字段未变时复用上次校验结果
+        if self._is_validated():
+            return self
+        if (
+            self.enabled is False
+            and self.epsilon is None
+            and self.delta is None
+            and self.noise_multiplier is None
+            and self.max_grad_norm is None
+        ):
+            # 未启用 DP 且各字段均为缺省 None 的常见情形，无需逐项检查
+            self._validated = True
+            return self
+        ensure_type(self.enabled, _T_BOOL, label="enabled")
         if self.epsilon is not None:
-            ensure_type(self.epsilon, (float, int), label="epsilon")
+            ensure_type(self.epsilon, _T_FLOAT, label="epsilon")
             ensure(self.epsilon >= 0, "epsilon must be >= 0")
         if self.delta is not None:
-            ensure_type(self.delta, (float, int), label="delta")
+            ensure_type(self.delta, _T_FLOAT, label="delta")
             ensure(0 < float(self.delta) < 1, "delta must be in (0,1)")
         if self.noise_multiplier is not None:
-            ensure_type(self.noise_multiplier, (float, int), label="noise_multiplier")
+            ensure_type(self.noise_multiplier, _T_FLOAT, label="noise_multiplier")
             ensure(self.noise_multiplier >= 0, "noise_multiplier must be >= 0")
         if self.max_grad_norm is not None:
-            ensure_type(self.max_grad_norm, (float, int), label="max_grad_norm")
+            ensure_type(self.max_grad_norm, _T_FLOAT, label="max_grad_norm")
             ensure(self.max_grad_norm > 0, "max_grad_norm must be > 0")
         if self.enabled:
             ensure(self.noise_multiplier is not None, "noise_multiplier required when dp is enabled")
             ensure(self.max_grad_norm is not None, "max_grad_norm required when dp is enabled")
+        self._validated = True
         return self
 
     def to_dict(self) -> Dict[str, Any]:
@@ -210,7 +290,7 @@ class DPConfig:
         # 从字典还原 DP 配置，缺省字段使用默认值
         enabled_value = data.get("enabled")
         return cls(
-            enabled=enabled_value if enabled_value is not None else cls.enabled,
+            enabled=enabled_value if enabled_value is not None else _field_default(cls, "enabled"),
             epsilon=data.get("epsilon"),
             delta=data.get("delta"),
             noise_multiplier=data.get("noise_multiplier"),
@@ -218,8 +298,8 @@ class DPConfig:
         )
 
 
-@dataclass
-class AccountingConfig:
+@dataclass(**DATACLASS_SLOTS)
+class AccountingConfig(_ValidationCache):
     """
     Privacy accounting configuration for ML training.
 
@@ -245,21 +325,24 @@ class AccountingConfig:
     target_delta: Optional[float] = None
 
     def validate(self) -> "AccountingConfig":
-        # 校验会计配置参数的基本范围，确保会计器可用
-        ensure_type(self.method, (str,), label="method")
+        # 校验会计配置参数的基本范围，确保会计器可用；字段未变时复用上次校验结果
+        if self._is_validated():
+            return self
+        ensure_type(self.method, _T_STR, label="method")
         ensure(self.method.strip() != "", "method must be non-empty")
         if self.sample_rate is not None:
-            ensure_type(self.sample_rate, (float, int), label="sample_rate")
+            ensure_type(self.sample_rate, _T_FLOAT, label="sample_rate")
             ensure(0 < float(self.sample_rate) <= 1, "sample_rate must be in (0,1]")
         if self.steps is not None:
-            ensure_type(self.steps, (int,), label="steps")
+            ensure_type(self.steps, _T_INT, label="steps")
             ensure(self.steps > 0, "steps must be > 0")
         if self.target_epsilon is not None:
-            ensure_type(self.target_epsilon, (float, int), label="target_epsilon")
+            ensure_type(self.target_epsilon, _T_FLOAT, label="target_epsilon")
             ensure(self.target_epsilon >= 0, "target_epsilon must be >= 0")
         if self.target_delta is not None:
-            ensure_type(self.target_delta, (float, int), label="target_delta")
+            ensure_type(self.target_delta, _T_FLOAT, label="target_delta")
             ensure(0 < float(self.target_delta) < 1, "target_delta must be in (0,1)")
+        self._validated = True
         return self
 
     def to_dict(self) -> Dict[str, Any]:
@@ -278,7 +361,7 @@ class AccountingConfig:
         """Create AccountingConfig from a dictionary payload."""
         # 从字典还原会计配置，缺省字段使用默认值
         return cls(
-            method=data.get("method", cls.method),
+            method=data.get("method", _field_default(cls, "method")),
             sample_rate=data.get("sample_rate"),
             steps=data.get("steps"),
             target_epsilon=data.get("target_epsilon"),
@@ -286,8 +369,30 @@ class AccountingConfig:
         )
 
 
-@dataclass
-class MLConfig:
+# 说明：MLConfig 的子配置字段及其配置类型，from_dict 按此表统一还原
+_SECTIONS = (
+    ("model", ModelConfig),
+    ("training", TrainingConfig),
+    ("dp", DPConfig),
+    ("accounting", AccountingConfig),
+)
+
+
+def _coerce_section(key: str, value: Any, klass: type) -> Any:
+    # 子配置已是目标类型时直接复用，dict/Mapping 通过 from_dict 还原，其余类型报错；
+    # 先做精确类型判断，常见的 dict 输入无需走 Mapping ABC 的 isinstance 检查
+    value_type = type(value)
+    if value_type is klass:
+        return value
+    if value_type is dict or isinstance(value, Mapping):
+        return klass.from_dict(value)  # type: ignore[attr-defined]
+    if isinstance(value, klass):
+        return value
+    raise ParamValidationError(f"{key} must be {klass.__name__} or mapping")
+
+
+@dataclass(**DATACLASS_SLOTS)
+class MLConfig(_ValidationCache):
     """
     Aggregated ML configuration for training workflows.
 
@@ -310,19 +415,28 @@ class MLConfig:
     training: TrainingConfig = field(default_factory=TrainingConfig)
     dp: DPConfig = field(default_factory=DPConfig)
     accounting: AccountingConfig = field(default_factory=AccountingConfig)
-    metadata: Mapping[str, Any] = field(default_factory=dict)
+    metadata: Dict[str, Any] = field(default_factory=dict)
 
     def validate(self) -> "MLConfig":
-        # 统一调用子配置的校验逻辑，确保整体配置可用
+        # 统一调用子配置的校验逻辑，确保整体配置可用；自身与各子配置均未变化时直接返回
+        if (
+            self._is_validated()
+            and self.model._is_validated()
+            and self.training._is_validated()
+            and self.dp._is_validated()
+            and self.accounting._is_validated()
+        ):
+            return self
         ensure_type(self.model, (ModelConfig,), label="model")
         ensure_type(self.training, (TrainingConfig,), label="training")
         ensure_type(self.dp, (DPConfig,), label="dp")
         ensure_type(self.accounting, (AccountingConfig,), label="accounting")
-        ensure_type(self.metadata, (Mapping,), label="metadata")
+        ensure(_is_mapping_fast(self.metadata), "metadata must be instance of Mapping")
         self.model.validate()
         self.training.validate()
         self.dp.validate()
         self.accounting.validate()
+        self._validated = True
         return self
 
     def to_dict(self) -> Dict[str, Any]:
@@ -333,7 +447,7 @@ class MLConfig:
             "training": self.training.to_dict(),
             "dp": self.dp.to_dict(),
             "accounting": self.accounting.to_dict(),
-            "metadata": dict(self.metadata),
+            "metadata": _copy_mapping(self.metadata),
         }
 
     @classmethod
@@ -342,42 +456,5 @@ class MLConfig:
         # 从字典还原聚合配置，支持嵌套 dict 或对象实例
         if "model" not in data:
             raise ParamValidationError("model configuration is required")
-        model_value = data["model"]
-        if isinstance(model_value, ModelConfig):
-            model = model_value
-        elif isinstance(model_value, Mapping):
-            model = ModelConfig.from_dict(model_value)
-        else:
-            raise ParamValidationError("model must be ModelConfig or mapping")
-
-        training_value = data.get("training", {})
-        if isinstance(training_value, TrainingConfig):
-            training = training_value
-        elif isinstance(training_value, Mapping):
-            training = TrainingConfig.from_dict(training_value)
-        else:
-            raise ParamValidationError("training must be TrainingConfig or mapping")
-
-        dp_value = data.get("dp", {})
-        if isinstance(dp_value, DPConfig):
-            dp = dp_value
-        elif isinstance(dp_value, Mapping):
-            dp = DPConfig.from_dict(dp_value)
-        else:
-            raise ParamValidationError("dp must be DPConfig or mapping")
-
-        accounting_value = data.get("accounting", {})
-        if isinstance(accounting_value, AccountingConfig):
-            accounting = accounting_value
-        elif isinstance(accounting_value, Mapping):
-            accounting = AccountingConfig.from_dict(accounting_value)
-        else:
-            raise ParamValidationError("accounting must be AccountingConfig or mapping")
-
-        return cls(
-            model=model,
-            training=training,
-            dp=dp,
-            accounting=accounting,
-            metadata=data.get("metadata", {}),
-        )
+        sections = {key: _coerce_section(key, data.get(key, {}), klass) for key, klass in _SECTIONS}
+        return cls(**sections, metadata=dict(data.get("metadata", {})))
@@ -20,7 +20,11 @@ Limitations
 
 from __future__ import annotations
 
-from typing import Optional, Sequence, Union
+import functools
+from typing import Any, Dict, Optional, Sequence, Union
+
+# 安装提示文本缓存：后端与 extras 组合有限，重复构造同一后端的异常时复用已拼接的字符串
+_EXTRAS_TABLE: Dict[Any, str] = {}
 
 
 class MLBaseError(RuntimeError):
@@ -61,17 +65,37 @@ class BackendNotAvailable(MLBaseError):
         message: Optional[str] = None,
     ) -> None:
         # 构造包含可选依赖提示信息的错误消息，便于用户快速定位安装方式
+        # 说明：后端探测时会反复构造同一后端的异常，extras 拼接与完整消息均按参数复用缓存结果；
+        # 完整消息仍作为 args[0] 传给基类，保证 args / repr / pickle 行为不变
         extras_text = None
         if extras:
             if isinstance(extras, str):
                 extras_text = extras
             else:
-                extras_text = ",".join(extras)
-        hint = f" Install with `pip install dplib[{extras_text}]`." if extras_text else ""
-        final_message = message or f"backend '{backend}' is not available."
-        super().__init__(f"{final_message}{hint}")
+                key = tuple(extras)
+                extras_text = _EXTRAS_TABLE.get(key)
+                if extras_text is None:
+                    extras_text = _EXTRAS_TABLE[key] = ",".join(key)
+        super().__init__(_format_backend_message(backend, extras_text, message))
         self.backend = backend
         self.extras = extras_text
+        self.message = message
+
+    def __reduce__(self):  # type: ignore[override]
+        # 基类默认以 args[0]（完整消息）重建实例，会被误当作 backend；改为按原始字段重建
+        return (
+            functools.partial(type(self), self.backend, extras=self.extras, message=self.message),
+            (),
+            self.__dict__,
+        )
+
+
+@functools.lru_cache(maxsize=256)
+def _format_backend_message(backend: str, extras: Optional[str], message: Optional[str]) -> str:
+    # 拼接后端缺失消息与安装提示；参数组合有限，按参数缓存
+    hint = f" Install with `pip install dplib[{extras}]`." if extras else ""
+    final_message = message or f"backend '{backend}' is not available."
+    return f"{final_message}{hint}"
 
 
 class InvalidConfig(MLBaseError):
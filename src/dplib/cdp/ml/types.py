@@ -22,17 +22,77 @@ Limitations
 from __future__ import annotations
 
 import array
+import functools
 from dataclasses import dataclass, field, fields, is_dataclass
 from typing import Any, Dict, Mapping, Optional
 
 import numpy as np
 
+from dplib.core.utils.compat import DATACLASS_SLOTS
+
+
+@functools.lru_cache(maxsize=None)
+def _field_names(cls: type) -> tuple:
+    # 按类缓存 dataclass 字段名元组，避免每次序列化都调用 fields() 重建元组
+    return tuple(item.name for item in fields(cls))
+
+
+def _identity(value: Any) -> Any:
+    # JSON 基础标量原样返回
+    return value
+
+
+# JSON 基础标量的精确类型集合，容器内的此类叶子节点原样保留
+_JSON_SCALARS = frozenset({type(None), str, int, float, bool})
+
+
+def _jsonify_dict(value: Mapping[str, Any]) -> Dict[str, Any]:
+    # 递归转换映射中的各个值
+    # 说明：指标等载荷中标量叶子占绝大多数，在推导式内先做类型判断即可省去逐值的递归调用
+    scalars = _JSON_SCALARS
+    return {key: val if type(val) in scalars else _jsonify(val) for key, val in value.items()}
+
+
+def _jsonify_sequence(value: Any) -> list:
+    # 递归转换序列元素，统一输出为 list
+    scalars = _JSON_SCALARS
+    return [item if type(item) in scalars else _jsonify(item) for item in value]
+
+
+# 精确类型分发表：覆盖载荷中最常见的内置类型，命中时无需逐个 isinstance 判断
+_FAST_HANDLERS = {
+    type(None): _identity,
+    str: _identity,
+    int: _identity,
+    float: _identity,
+    bool: _identity,
+    dict: _jsonify_dict,
+    list: _jsonify_sequence,
+    tuple: _jsonify_sequence,
+    # ndarray.tolist 已在 C 层一次完成逐元素转换，精确类型命中即可直接调用
+    np.ndarray: np.ndarray.tolist,
+}
+# 常见 numpy 标量类型同样直接转换为 Python 标量
+_FAST_HANDLERS.update(
+    dict.fromkeys(
+        (np.float64, np.float32, np.float16, np.int64, np.int32, np.int16, np.int8, np.bool_),
+        np.generic.item,
+    )
+)
+
 
 def _jsonify(value: Any) -> Any:
     # 递归将对象转换为 JSON 友好的基础结构，重点处理 ndarray 与 array.array
-    if value is None:
-        return None
+    # 说明：载荷中绝大多数为内置标量、dict 与 list，先按精确类型查表分发，
+    # 未命中时才依次走 dataclass/to_dict/numpy 与 Mapping ABC 等较慢的判断
+    value_type = type(value)
+    handler = _FAST_HANDLERS.get(value_type)
+    if handler is not None:
+        return handler(value)
+    if hasattr(value_type, "__dataclass_fields__"):
+        return {name: _jsonify(getattr(value, name)) for name in _field_names(value_type)}
     if is_dataclass(value):
+        # dataclass 类对象本身（而非实例）仍按原逻辑处理
         return {item.name: _jsonify(getattr(value, item.name)) for item in fields(value)}
     if hasattr(value, "to_dict") and callable(value.to_dict):
         return _jsonify(value.to_dict())
@@ -43,13 +103,13 @@ def _jsonify(value: Any) -> Any:
     if isinstance(value, array.array):
         return value.tolist()
     if isinstance(value, Mapping):
-        return {key: _jsonify(val) for key, val in value.items()}
+        return _jsonify_dict(value)
     if isinstance(value, (list, tuple, set)):
-        return [_jsonify(item) for item in value]
+        return _jsonify_sequence(value)
     return value
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class TrainBatch:
     """
     Container for a single training batch.
@@ -95,7 +155,7 @@ class TrainBatch:
         )
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class MetricSpec:
     """
     Metric specification used for evaluation configuration.
@@ -141,7 +201,7 @@ class MetricSpec:
         )
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class PrivacySummary:
     """
     Summary of privacy budget or accounting outcome.
@@ -187,7 +247,7 @@ class PrivacySummary:
         )
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class TrainResult:
     """
     Result container emitted by training loops.
@@ -232,7 +292,13 @@ class TrainResult:
         """Create TrainResult from a dictionary payload."""
         # 从字典还原训练结果对象，并在需要时恢复隐私摘要结构
         privacy_payload = data.get("privacy")
-        if isinstance(privacy_payload, PrivacySummary):
+        # 说明：反序列化载荷中 privacy 通常为 None 或普通 dict，先做精确类型判断，
+        # 仅在其他类型时才走 isinstance（含 Mapping ABC）检查
+        if privacy_payload is None:
+            privacy = None
+        elif type(privacy_payload) is dict:
+            privacy = PrivacySummary.from_dict(privacy_payload)
+        elif isinstance(privacy_payload, PrivacySummary):
             privacy = privacy_payload
         elif isinstance(privacy_payload, Mapping):
             privacy = PrivacySummary.from_dict(privacy_payload)
@@ -248,7 +314,7 @@ class TrainResult:
         )
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class EvalResult:
     """
     Evaluation result container with optional granular metrics.
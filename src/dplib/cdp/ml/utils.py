@@ -14,13 +14,15 @@ Limitations
 """
 # 说明：CDP ML 子模块的轻量工具集合，聚焦训练相关的设备、种子与序列化。
 # 职责：
-# - seed_everything：统一 numpy 与可选框架的随机种子设置
+# - seed_everything：返回已播种的 numpy Generator 并设置可选框架的随机种子
 # - resolve_device：解析训练设备（cpu/cuda）并处理后端缺失
 # - checkpoint_path：规范化模型检查点路径生成
 # - json_read/json_write：复用 core.serialization 的 JSON 读写流程
 
 from __future__ import annotations
 
+import functools
+import math
 import os
 from pathlib import Path
 from typing import Any, Optional, Sequence, Union
@@ -30,44 +32,41 @@ import numpy as np
 from dplib.core.utils.logging import get_logger
 from dplib.core.utils.param_validation import ensure, ensure_type
 from dplib.core.utils.random import create_rng
-from dplib.core.utils.serialization import deserialize_from_json, serialize_to_json
+from dplib.core.utils.serialization import _prepare, deserialize_from_json, serialize_to_json
 
 from .exceptions import BackendNotAvailable
 
+try:
+    import orjson
+except Exception:  # pragma: no cover - optional dependency
+    # 可选依赖 orjson 缺失时退化为 None，JSON 读写沿用 core.serialization 的标准库实现
+    orjson = None  # type: ignore
+
 logger = get_logger(__name__)
 
+# orjson 编码选项：原生序列化 numpy 数组，并与标准库一致允许非字符串键
+_ORJSON_OPTIONS = (orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS) if orjson is not None else 0
+
 
-def seed_everything(seed: Optional[int]) -> np.random.Generator:
+def seed_everything(seed: Optional[int], *, legacy_global: bool = False) -> np.random.Generator:
     """
-    Seed numpy and optional ML backends, returning a numpy Generator.
+    Seed optional ML backends and return a seeded numpy Generator.
+
+    The global ``np.random`` state is only reseeded when ``legacy_global`` is True;
+    numpy randomness should otherwise be drawn from the returned generator.
     """
-    # 设置 numpy 与可选后端的随机种子，返回可复现的 numpy RNG
+    # 设置可选后端的随机种子，返回可复现的 numpy RNG
+    # 说明：默认不再重置 np.random 全局状态，避免重复播种开销与多线程训练间共享全局 RNG 的竞争；
+    # 仍依赖全局状态的旧代码可通过 legacy_global=True 恢复原行为
     ensure_type(seed, (int, type(None)), label="seed")
     rng = create_rng(seed)
-    np.random.seed(seed)
+    if legacy_global:
+        np.random.seed(seed)
     if seed is None:
         return rng
-
-    def _seed_torch(value: int) -> None:
-        # torch 为可选依赖，缺失时直接忽略
-        try:
-            import torch  # type: ignore
-        except Exception:
-            return
-        torch.manual_seed(value)
-        if torch.cuda.is_available():
-            torch.cuda.manual_seed_all(value)
-
-    def _seed_tensorflow(value: int) -> None:
-        # tensorflow 为可选依赖，缺失时直接忽略
-        try:
-            import tensorflow as tf  # type: ignore
-        except Exception:
-            return
-        tf.random.set_seed(value)
-
-    _seed_torch(int(seed))
-    _seed_tensorflow(int(seed))
+    value = int(seed)
+    for seeder in _SEEDERS:
+        seeder(value)
     return rng
 
 
@@ -120,8 +119,17 @@ def checkpoint_path(base_dir: Union[os.PathLike, str], name: str, step: Optional
         filename = f"{name}_step_{step}"
     else:
         filename = name
-    path = Path(base_dir) / f"{filename}.ckpt"
-    return str(path)
+    if os.sep in filename or (os.altsep is not None and os.altsep in filename):
+        # 文件名含路径分隔符时交给 Path 处理其中的规范化
+        return str(Path(base_dir) / f"{filename}.ckpt")
+    # 说明：训练过程中每步都会生成路径，目录部分按 base_dir 缓存规范化结果，之后只需字符串拼接
+    return f"{_checkpoint_prefix(os.fspath(base_dir))}{filename}.ckpt"
+
+
+@functools.lru_cache(maxsize=64)
+def _checkpoint_prefix(base_dir: str) -> str:
+    # 用占位文件名经 Path 拼接后去掉占位符，得到与 Path 规范化一致且带结尾分隔符的目录前缀
+    return str(Path(base_dir) / "_")[:-1]
 
 
 def json_read(path: Union[os.PathLike, str]) -> Any:
@@ -130,6 +138,14 @@ def json_read(path: Union[os.PathLike, str]) -> Any:
     """
     # 读取 JSON 文件并使用 core.serialization 进行反序列化
     ensure_type(path, (str, os.PathLike), label="path")
+    if orjson is not None:
+        raw = Path(path).read_bytes()
+        logger.debug("Loaded JSON payload from %s.", path)
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # 标准库写出的 NaN/Infinity 等非标准记号 orjson 不接受，回退到标准库解析
+            return deserialize_from_json(raw.decode("utf-8"))
     text = Path(path).read_text(encoding="utf-8")
     logger.debug("Loaded JSON payload from %s.", path)
     return deserialize_from_json(text)
@@ -144,18 +160,93 @@ def json_write(
 ) -> None:
     """
     Write a JSON file using core serialization helpers.
+
+    When orjson is installed and neither masking nor versioning is requested, the
+    payload is encoded by orjson directly, provided it holds no non-finite floats
+    and no integers wider than 64 bits; other payloads use the standard library
+    path so the written file does not depend on the optional package.
     """
     # 将对象序列化为 JSON 并写入指定路径
     ensure_type(path, (str, os.PathLike), label="path")
+    if orjson is not None and sensitive_fields is None and version is None:
+        # 说明：训练历史等数值密集载荷每步都会写出，无需掩码与版本包装时直接交给 orjson 编码；
+        # orjson 会把 NaN/Inf 静默写成 null 且拒绝超过 64 位的整数，这类载荷回退标准库以保持输出一致
+        prepared = _prepare(payload)
+        if _orjson_compatible(prepared):
+            try:
+                data = orjson.dumps(prepared, default=_prepare, option=_ORJSON_OPTIONS)
+            except orjson.JSONEncodeError:
+                pass
+            else:
+                Path(path).write_bytes(data)
+                logger.debug("Wrote JSON payload to %s.", path)
+                return
     text = serialize_to_json(payload, sensitive_fields=sensitive_fields, version=version)
     Path(path).write_text(text, encoding="utf-8")
     logger.debug("Wrote JSON payload to %s.", path)
 
 
+def _orjson_compatible(obj: Any) -> bool:
+    # 判断载荷能否由 orjson 无损编码：浮点须为有限值，整数须在 64 位范围内；
+    # 其余对象经 _prepare 展开后递归检查，无法展开的对象交由编码阶段报错并回退
+    if isinstance(obj, (float, np.floating)):
+        return math.isfinite(obj)
+    if isinstance(obj, int) and not isinstance(obj, bool):
+        return -(2**63) <= obj < 2**64
+    if obj is None or isinstance(obj, (str, bool, np.integer, np.bool_)):
+        return True
+    if isinstance(obj, dict):
+        return all(_orjson_compatible(key) and _orjson_compatible(value) for key, value in obj.items())
+    if isinstance(obj, (list, tuple)):
+        return all(_orjson_compatible(item) for item in obj)
+    if isinstance(obj, np.ndarray):
+        if obj.dtype.kind in "fc":
+            return bool(np.isfinite(obj).all())
+        if obj.dtype.kind == "O":
+            return all(_orjson_compatible(item) for item in obj.ravel())
+        return True
+    prepared = _prepare(obj)
+    return prepared is obj or _orjson_compatible(prepared)
+
+
+@functools.lru_cache(maxsize=1)
 def _try_import_torch() -> Optional[Any]:
-    # 尝试懒加载 torch，缺失时返回 None
+    # 尝试懒加载 torch，缺失时返回 None；导入结果在进程内缓存，重复调用不再经过导入机制
+    # 说明：torch.cuda.is_available() 仍由调用方每次查询，不随导入结果缓存
     try:
         import torch  # type: ignore
     except Exception:
         return None
     return torch
+
+
+@functools.lru_cache(maxsize=1)
+def _try_import_tensorflow() -> Optional[Any]:
+    # 尝试懒加载 tensorflow，缺失时返回 None；与 torch 相同按进程缓存导入结果
+    try:
+        import tensorflow as tf  # type: ignore
+    except Exception:
+        return None
+    return tf
+
+
+def _seed_torch(value: int) -> None:
+    # torch 为可选依赖，缺失时直接忽略
+    torch = _try_import_torch()
+    if torch is None:
+        return
+    torch.manual_seed(value)
+    if torch.cuda.is_available():
+        torch.cuda.manual_seed_all(value)
+
+
+def _seed_tensorflow(value: int) -> None:
+    # tensorflow 为可选依赖，缺失时直接忽略
+    tf = _try_import_tensorflow()
+    if tf is None:
+        return
+    tf.random.set_seed(value)
+
+
+# seed_everything 依次调用的可选后端播种函数
+_SEEDERS = (_seed_torch, _seed_tensorflow)
@@ -1,13 +1,25 @@
 """CDP sensitivity analysis and noise calibration utilities."""
 from dplib.core.data.sensitivity import SensitivityError
 from .sensitivity_analyzer import (
+    CountQuery,
+    HistogramQuery,
+    LocalQuery,
+    MeanQuery,
+    RangeQuery,
+    ReportMetadata,
     SensitivityAnalyzer,
     SensitivityReport,
+    SmoothMeanQuery,
+    SumQuery,
+    VarianceQuery,
+    default_analyzer,
 )
 from .noise_calibrator import (
     calibrate,
     calibrate_gaussian,
+    calibrate_gaussian_batch,
     calibrate_laplace,
+    calibrate_laplace_batch,
 )
 from .sensitivity_bounds import (
     SensitivityBounds,
@@ -24,18 +36,33 @@ from .global_sensitivity import (
     count,
     histogram,
     mean,
+    mean_batch,
     range,
     sum,
+    sum_batch,
     variance,
+    variance_batch,
 )
 
 __all__ = [
     "SensitivityError",
     "SensitivityAnalyzer",
     "SensitivityReport",
+    "ReportMetadata",
+    "CountQuery",
+    "SumQuery",
+    "MeanQuery",
+    "VarianceQuery",
+    "HistogramQuery",
+    "RangeQuery",
+    "LocalQuery",
+    "SmoothMeanQuery",
+    "default_analyzer",
     "calibrate",
     "calibrate_gaussian",
+    "calibrate_gaussian_batch",
     "calibrate_laplace",
+    "calibrate_laplace_batch",
     "SensitivityBounds",
     "count_bounds",
     "histogram_bounds",
@@ -48,7 +75,10 @@ __all__ = [
     "count",
     "histogram",
     "mean",
+    "mean_batch",
     "range",
     "sum",
+    "sum_batch",
     "variance",
+    "variance_batch",
 ]
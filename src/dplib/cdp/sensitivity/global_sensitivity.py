@@ -18,14 +18,18 @@ Limitations
 # 职责：
 # - 将 count/sum/mean/variance/histogram/range 等查询的全局敏感度计算以轻量函数导出
 # - 统一暴露 ContinuousDomain 与 max_contribution 等参数接口便于上层 CDP 机制复用
-# - 提供 PRESETS 映射方便在配置或元数据中引用底层敏感度实现名称
+# - 提供 PRESETS 映射（复用 core.data.sensitivity 中的只读视图）方便在配置或元数据中引用底层敏感度实现名称
 
 from __future__ import annotations
 
-from typing import Dict
+from typing import Sequence, Union
+
+import numpy as np
 
 from dplib.core.data.domain import ContinuousDomain
 from dplib.core.data.sensitivity import (
+    PRESETS,
+    SensitivityError,
     count_global_sensitivity,
     histogram_global_sensitivity,
     mean_global_sensitivity,
@@ -87,12 +91,54 @@ def range(
     )
 
 
-# 为常见查询类型提供名称到底层敏感度实现函数名的映射
-PRESETS: Dict[str, str] = {
-    "count": "count_global_sensitivity",
-    "sum": "sum_global_sensitivity",
-    "mean": "mean_global_sensitivity",
-    "variance": "variance_global_sensitivity",
-    "histogram": "histogram_global_sensitivity",
-    "range": "range_global_sensitivity",
-}
+# 批量接口中可按配置逐项变化的整数参数：标量或与 domains 等长的数组
+IntArrayLike = Union[int, Sequence[int], np.ndarray]
+
+
+def _domain_spans(domains: Sequence[ContinuousDomain], query: str) -> np.ndarray:
+    # 将一批连续域的上下界读入 float64 数组并计算跨度，缺失边界或跨度非正时与标量版本一致地报错
+    lower = np.fromiter((np.nan if d.minimum is None else d.minimum for d in domains), dtype=np.float64)
+    upper = np.fromiter((np.nan if d.maximum is None else d.maximum for d in domains), dtype=np.float64)
+    if np.isnan(lower).any() or np.isnan(upper).any():
+        raise SensitivityError(f"continuous domain must specify min/max for {query} sensitivity")
+    spans = upper - lower
+    if (spans <= 0).any():
+        raise SensitivityError(f"domain span must be positive for {query} sensitivity")
+    return spans
+
+
+def sum_batch(domains: Sequence[ContinuousDomain], *, max_contribution: IntArrayLike = 1) -> np.ndarray:
+    # 批量计算求和查询的全局敏感度 (max - min) * max_contribution，用于大规模策略审计
+    spans = _domain_spans(domains, "sum")
+    return spans * np.asarray(max_contribution, dtype=np.float64)
+
+
+def mean_batch(
+    domains: Sequence[ContinuousDomain],
+    *,
+    sample_size: IntArrayLike,
+    max_contribution: IntArrayLike = 1,
+) -> np.ndarray:
+    # 批量计算均值查询的全局敏感度：求和敏感度按样本量缩放
+    sizes = np.asarray(sample_size, dtype=np.float64)
+    if (sizes <= 0).any():
+        raise SensitivityError("sample_size must be positive")
+    return sum_batch(domains, max_contribution=max_contribution) / sizes
+
+
+def variance_batch(
+    domains: Sequence[ContinuousDomain],
+    *,
+    sample_size: IntArrayLike,
+    ddof: int = 1,
+    max_contribution: IntArrayLike = 1,
+) -> np.ndarray:
+    # 批量计算方差查询的全局敏感度上界 min(span^2 * c / max(n - ddof, 1), span^2 / 4)
+    sizes = np.asarray(sample_size, dtype=np.float64)
+    if (sizes <= ddof).any():
+        raise SensitivityError("sample_size must exceed ddof")
+    spans = _domain_spans(domains, "variance")
+    squared = spans * spans
+    denom = np.maximum(sizes - ddof, 1.0)
+    sensitivity = squared * np.asarray(max_contribution, dtype=np.float64) / denom
+    return np.minimum(sensitivity, squared / 4.0)
@@ -25,20 +25,66 @@ Limitations
 
 from __future__ import annotations
 
+import functools
 import math
-from typing import Optional, Tuple
+from typing import Optional, Sequence, Tuple, Union
+
+import numpy as np
 
 from dplib.core.utils.param_validation import ParamValidationError, ensure, ensure_type
 
+# 批量校准接口接受标量、序列或 ndarray，按 NumPy 广播规则组合
+ArrayLike = Union[float, Sequence[float], np.ndarray]
+# 标量校准接口接受的数值类型
+_NUMBER_TYPES = (int, float)
+
+
+@functools.lru_cache(maxsize=128)
+def _gaussian_factor(delta: float) -> float:
+    # 缓存 sqrt(2 * ln(1.25 / δ))：扫描 epsilon 时 δ 通常固定，避免重复计算对数与开方
+    return math.sqrt(2.0 * math.log(1.25 / delta))
+
+
+def _validate_laplace(epsilon: float, sensitivity: float) -> None:
+    # 常见输入为内置 float/int，先用单条表达式完成类型身份比较与范围检查；
+    # 未通过时再逐项调用 ensure_type/ensure，给出与原先一致的具体错误信息
+    if (
+        (type(epsilon) is float or type(epsilon) is int)
+        and (type(sensitivity) is float or type(sensitivity) is int)
+        and epsilon > 0
+        and sensitivity >= 0
+    ):
+        return
+    ensure_type(epsilon, _NUMBER_TYPES, label="epsilon")
+    ensure_type(sensitivity, _NUMBER_TYPES, label="sensitivity")
+    ensure(epsilon > 0, "epsilon must be positive")
+    ensure(sensitivity >= 0, "sensitivity must be non-negative")
+
+
+def _validate_gaussian(epsilon: float, delta: float, sensitivity: float) -> None:
+    # 与 _validate_laplace 相同的快速路径，额外覆盖 delta 的类型与 (0,1) 区间
+    if (
+        (type(epsilon) is float or type(epsilon) is int)
+        and (type(delta) is float or type(delta) is int)
+        and (type(sensitivity) is float or type(sensitivity) is int)
+        and epsilon > 0
+        and 0 < delta < 1
+        and sensitivity >= 0
+    ):
+        return
+    ensure_type(epsilon, _NUMBER_TYPES, label="epsilon")
+    ensure_type(delta, _NUMBER_TYPES, label="delta")
+    ensure_type(sensitivity, _NUMBER_TYPES, label="sensitivity")
+    ensure(epsilon > 0, "epsilon must be positive")
+    ensure(0 < delta < 1, "delta must be in (0,1)")
+    ensure(sensitivity >= 0, "sensitivity must be non-negative")
+
 
 def calibrate_laplace(epsilon: float, *, sensitivity: float) -> float:
     # 按 Laplace 机制噪声校准公式计算尺度参数 b 并处理零敏感度退化场景
     # b = sensitivity / epsilon
     """Return Laplace scale (b) for given epsilon and sensitivity."""
-    ensure_type(epsilon, (int, float), label="epsilon")
-    ensure_type(sensitivity, (int, float), label="sensitivity")
-    ensure(epsilon > 0, "epsilon must be positive")
-    ensure(sensitivity >= 0, "sensitivity must be non-negative")
+    _validate_laplace(epsilon, sensitivity)
     if sensitivity == 0:
         return 0.0
     scale = float(sensitivity) / float(epsilon)
@@ -51,20 +97,92 @@ def calibrate_gaussian(epsilon: float, delta: float, *, sensitivity: float) -> f
     # 使用常见 (ε, δ)-DP 高斯机制 1.25 上界公式计算噪声标准差 σ 并校验参数有效性
     # σ = sensitivity * sqrt(2 * ln(1.25 / δ)) / epsilon
     """Return Gaussian sigma for (epsilon, delta)-DP using common 1.25 bound."""
-    ensure_type(epsilon, (int, float), label="epsilon")
-    ensure_type(delta, (int, float), label="delta")
-    ensure_type(sensitivity, (int, float), label="sensitivity")
-    ensure(epsilon > 0, "epsilon must be positive")
-    ensure(0 < delta < 1, "delta must be in (0,1)")
-    ensure(sensitivity >= 0, "sensitivity must be non-negative")
+    _validate_gaussian(epsilon, delta, sensitivity)
     if sensitivity == 0:
         return 0.0
-    sigma = float(sensitivity) * math.sqrt(2.0 * math.log(1.25 / float(delta))) / float(epsilon)
+    sigma = float(sensitivity) * _gaussian_factor(float(delta)) / float(epsilon)
     if sigma == 0.0:
         return math.ulp(0.0)
     return sigma
 
 
+def _finalize_batch(sensitivity: np.ndarray, values: np.ndarray) -> np.ndarray:
+    # 与标量版本保持一致：零敏感度返回 0，正敏感度下溢为 0 时返回最小正数
+    values = np.where(sensitivity == 0.0, 0.0, values)
+    sensitivity = np.broadcast_to(sensitivity, values.shape)
+    underflow = (values == 0.0) & (sensitivity > 0.0)
+    if underflow.any():
+        values[underflow] = math.ulp(0.0)
+    return values
+
+
+def calibrate_laplace_batch(epsilon: ArrayLike, *, sensitivity: ArrayLike) -> np.ndarray:
+    """Return Laplace scales for broadcastable arrays of epsilon and sensitivity."""
+    # 批量计算 b = sensitivity / epsilon，参数扫描时整体校验一次取值范围，避免逐元素的 Python 调用
+    eps = np.asarray(epsilon, dtype=np.float64)
+    sens = np.asarray(sensitivity, dtype=np.float64)
+    ensure(bool(np.all(eps > 0)), "epsilon must be positive")
+    ensure(bool(np.all(sens >= 0)), "sensitivity must be non-negative")
+    return _finalize_batch(sens, sens / eps)
+
+
+def calibrate_gaussian_batch(epsilon: ArrayLike, delta: ArrayLike, *, sensitivity: ArrayLike) -> np.ndarray:
+    """Return Gaussian sigmas for broadcastable arrays of epsilon, delta and sensitivity."""
+    # 批量计算 σ = sensitivity * sqrt(2 * ln(1.25 / δ)) / epsilon
+    eps = np.asarray(epsilon, dtype=np.float64)
+    dlt = np.asarray(delta, dtype=np.float64)
+    sens = np.asarray(sensitivity, dtype=np.float64)
+    ensure(bool(np.all(eps > 0)), "epsilon must be positive")
+    ensure(bool(np.all((dlt > 0) & (dlt < 1))), "delta must be in (0,1)")
+    ensure(bool(np.all(sens >= 0)), "sensitivity must be non-negative")
+    return _finalize_batch(sens, sens * np.sqrt(2.0 * np.log(1.25 / dlt)) / eps)
+
+
+def _calibrate_laplace_like(
+    epsilon: float, sensitivity: float, delta: Optional[float], distribution: Optional[str]
+) -> Tuple[str, float]:
+    # Laplace 及采用同幅度离散尺度的 geometric/staircase 机制
+    return "scale", calibrate_laplace(epsilon, sensitivity=sensitivity)
+
+
+def _calibrate_gaussian_mech(
+    epsilon: float, sensitivity: float, delta: Optional[float], distribution: Optional[str]
+) -> Tuple[str, float]:
+    if delta is None:
+        raise ParamValidationError("delta is required for gaussian calibration")
+    return "sigma", calibrate_gaussian(epsilon, delta, sensitivity=sensitivity)
+
+
+def _calibrate_exponential(
+    epsilon: float, sensitivity: float, delta: Optional[float], distribution: Optional[str]
+) -> Tuple[str, float]:
+    ensure(sensitivity > 0, "sensitivity must be positive for exponential mechanism")
+    return "utility_multiplier", float(epsilon) / (2.0 * float(sensitivity))
+
+
+def _calibrate_vector(
+    epsilon: float, sensitivity: float, delta: Optional[float], distribution: Optional[str]
+) -> Tuple[str, float]:
+    dist = (distribution or "laplace").lower()
+    if dist == "gaussian":
+        if delta is None:
+            raise ParamValidationError("delta is required for gaussian vector calibration")
+        return "sigma", calibrate_gaussian(epsilon, delta, sensitivity=sensitivity)
+    # 默认使用拉普拉斯向量噪声
+    return "scale", calibrate_laplace(epsilon, sensitivity=sensitivity)
+
+
+# 机制名称到校准函数的分派表，calibrate 每次调用只需一次字典查找
+_DISPATCH = {
+    "laplace": _calibrate_laplace_like,
+    "gaussian": _calibrate_gaussian_mech,
+    "geometric": _calibrate_laplace_like,
+    "staircase": _calibrate_laplace_like,
+    "exponential": _calibrate_exponential,
+    "vector": _calibrate_vector,
+}
+
+
 def calibrate(
     mechanism: str,
     epsilon: float,
@@ -79,25 +197,7 @@ def calibrate(
     Returns (param_name, value) where param_name is "scale" (Laplace) or "sigma" (Gaussian).
     """
     # 统一入口根据机制名称分派到具体校准函数并返回对应噪声参数名与数值
-    name = mechanism.lower()
-    if name in {"laplace"}:
-        return "scale", calibrate_laplace(epsilon, sensitivity=sensitivity)
-    if name in {"gaussian"}:
-        if delta is None:
-            raise ParamValidationError("delta is required for gaussian calibration")
-        return "sigma", calibrate_gaussian(epsilon, delta, sensitivity=sensitivity)
-    if name in {"geometric", "staircase"}:
-        # 采用与拉普拉斯同幅度的离散尺度
-        return "scale", calibrate_laplace(epsilon, sensitivity=sensitivity)
-    if name in {"exponential"}:
-        ensure(sensitivity > 0, "sensitivity must be positive for exponential mechanism")
-        return "utility_multiplier", float(epsilon) / (2.0 * float(sensitivity))
-    if name in {"vector"}:
-        dist = (distribution or "laplace").lower()
-        if dist == "gaussian":
-            if delta is None:
-                raise ParamValidationError("delta is required for gaussian vector calibration")
-            return "sigma", calibrate_gaussian(epsilon, delta, sensitivity=sensitivity)
-        # 默认使用拉普拉斯向量噪声
-        return "scale", calibrate_laplace(epsilon, sensitivity=sensitivity)
-    raise ParamValidationError(f"unsupported mechanism '{mechanism}'")
+    handler = _DISPATCH.get(mechanism.lower())
+    if handler is None:
+        raise ParamValidationError(f"unsupported mechanism '{mechanism}'")
+    return handler(epsilon, sensitivity, delta, distribution)
@@ -26,24 +26,65 @@ Limitations
 
 from __future__ import annotations
 
+import functools
+import sys
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Iterable, Mapping, Optional
+from functools import singledispatchmethod
+from typing import Any, Dict, Iterable, Iterator, Mapping, Optional, Sequence, Tuple
 
 from dplib.core.data.domain import ContinuousDomain
 from dplib.core.data.sensitivity import (
-    count_global_sensitivity,
-    histogram_global_sensitivity,
+    _fast_count_sensitivity,
+    _fast_histogram_sensitivity,
+    _fast_sum_sensitivity,
     local_sensitivity,
     mean_global_sensitivity,
     range_global_sensitivity,
     smooth_sensitivity_mean,
-    sum_global_sensitivity,
     variance_global_sensitivity,
 )
+from dplib.core.utils.compat import DATACLASS_SLOTS
 from dplib.core.utils.param_validation import ParamValidationError
 
 
-@dataclass
+class ReportMetadata(Mapping[str, Any]):
+    """
+    Compact, immutable and hashable metadata mapping backed by ``(key, value)`` pairs.
+
+    - Behavior
+      - Supports read-only mapping access and compares equal to dicts with the same items.
+      - Hashes by its item set so reports carrying it are hashable.
+    """
+
+    # 说明：报告元数据通常只有 1~3 项，以键值对元组作为底层存储，比 dict 更紧凑且可哈希；
+    # 对外保持 Mapping 只读接口，按键查找为线性扫描，对如此少的条目开销可忽略
+    __slots__ = ("_items",)
+
+    def __init__(self, items: Iterable[Tuple[str, Any]] = ()) -> None:
+        self._items = tuple(items)
+
+    def __getitem__(self, key: str) -> Any:
+        for name, value in self._items:
+            if name == key:
+                return value
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        return (name for name, _ in self._items)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __hash__(self) -> int:
+        # 与 Mapping 的相等语义一致：相同条目（不论顺序）得到相同哈希
+        return hash(frozenset(self._items))
+
+    def __repr__(self) -> str:
+        return repr(dict(self._items))
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class SensitivityReport:
     """
     Structured sensitivity result.
@@ -55,6 +96,8 @@ class SensitivityReport:
 
     - Behavior
       - Stores sensitivity outputs without additional validation.
+      - Immutable; reports for global-sensitivity queries are interned and shared.
+      - Hashable when metadata is a ``ReportMetadata`` (as produced by the analyzer).
 
     - Usage Notes
       - Returned by SensitivityAnalyzer methods.
@@ -64,6 +107,94 @@ class SensitivityReport:
     sensitivity: float
     metadata: Mapping[str, float]
 
+    def as_dict(self) -> Dict[str, Any]:
+        # 以普通可变字典导出元数据，供需要就地修改或序列化的调用方使用
+        return dict(self.metadata)
+
+
+def _make_report(query: str, sensitivity: float, metadata: Tuple[Tuple[str, Any], ...]) -> SensitivityReport:
+    # 全局敏感度报告只由查询名、数值与少量元数据决定，参数扫描中会反复生成相同报告；
+    # 按三者缓存并复用同一只读实例，元数据以只读映射暴露以保证共享安全
+    # 说明：typed=True 只区分顶层参数类型，元组内部的 1 / 1.0 / True 仍会相等，因此额外以元数据取值类型参与缓存键
+    return _make_report_cached(query, sensitivity, metadata, tuple(type(value) for _, value in metadata))
+
+
+@functools.lru_cache(maxsize=1024, typed=True)
+def _make_report_cached(
+    query: str,
+    sensitivity: float,
+    metadata: Tuple[Tuple[str, Any], ...],
+    metadata_types: Tuple[type, ...],
+) -> SensitivityReport:
+    return SensitivityReport(query=query, sensitivity=sensitivity, metadata=ReportMetadata(metadata))
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
+class CountQuery:
+    """Typed count query for ``SensitivityAnalyzer.run``."""
+
+    max_contribution: int = 1
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
+class SumQuery:
+    """Typed sum query over a bounded continuous domain."""
+
+    domain: ContinuousDomain
+    max_contribution: int = 1
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
+class MeanQuery:
+    """Typed mean query over a bounded continuous domain."""
+
+    domain: ContinuousDomain
+    sample_size: int
+    max_contribution: int = 1
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
+class VarianceQuery:
+    """Typed variance query over a bounded continuous domain."""
+
+    domain: ContinuousDomain
+    sample_size: int
+    ddof: int = 1
+    max_contribution: int = 1
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
+class HistogramQuery:
+    """Typed per-bin histogram count query."""
+
+    max_contribution: int = 1
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
+class RangeQuery:
+    """Typed fixed-window range query (sum/count/mean)."""
+
+    domain: ContinuousDomain
+    window: int
+    max_contribution: int = 1
+    metric: str = "sum"
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
+class LocalQuery:
+    """Typed local sensitivity query over sample values."""
+
+    values: Sequence[float]
+    metric: str = "l1"
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
+class SmoothMeanQuery:
+    """Typed smooth sensitivity query for the mean."""
+
+    values: Sequence[float]
+    beta: float
+
 
 class SensitivityAnalyzer:
     """
@@ -78,25 +209,23 @@ class SensitivityAnalyzer:
 
     - Usage Notes
       - Use `analyze` for dynamic dispatch in configurable pipelines.
+      - Use `run` with typed query objects when the query kind is known in code.
+      - Global queries are O(1) arithmetic and dispatch-bound; only `local` and
+        `smooth_mean` scale with the sample size and merit vectorized kernels.
     """
 
     def count(self, *, max_contribution: int = 1) -> SensitivityReport:
         # 针对计数查询在给定单用户最大贡献次数约束下计算全局敏感度并生成报告
-        sens = count_global_sensitivity(max_contribution=max_contribution)
-        return SensitivityReport(
-            query="count",
-            sensitivity=sens,
-            metadata={"max_contribution": float(max_contribution)},
-        )
+        # 开销：O(1) 算术，耗时主要在调用与分派开销
+        # 说明：经核心模块共享的快路径计算，合法输入直接套用闭式公式，非法输入回退核心函数以保持原有报错
+        sens = _fast_count_sensitivity(max_contribution)
+        return _make_report("count", sens, (("max_contribution", float(max_contribution)),))
 
     def sum(self, domain: ContinuousDomain, *, max_contribution: int = 1) -> SensitivityReport:
         # 针对有界连续域上的求和查询计算全局敏感度并记录贡献上界
-        sens = sum_global_sensitivity(domain, max_contribution=max_contribution)
-        return SensitivityReport(
-            query="sum",
-            sensitivity=sens,
-            metadata={"max_contribution": float(max_contribution)},
-        )
+        # 开销：O(1) 算术，耗时主要在调用与分派开销
+        sens = _fast_sum_sensitivity(domain, max_contribution)
+        return _make_report("sum", sens, (("max_contribution", float(max_contribution)),))
 
     def mean(
         self,
@@ -106,11 +235,12 @@ class SensitivityAnalyzer:
         max_contribution: int = 1,
     ) -> SensitivityReport:
         # 针对均值查询在给定样本量与贡献上界条件下计算全局敏感度
+        # 开销：O(1) 算术（核心函数按参数缓存），耗时主要在调用与分派开销
         sens = mean_global_sensitivity(domain, sample_size=sample_size, max_contribution=max_contribution)
-        return SensitivityReport(
-            query="mean",
-            sensitivity=sens,
-            metadata={"sample_size": float(sample_size), "max_contribution": float(max_contribution)},
+        return _make_report(
+            "mean",
+            sens,
+            (("sample_size", float(sample_size)), ("max_contribution", float(max_contribution))),
         )
 
     def variance(
@@ -122,30 +252,28 @@ class SensitivityAnalyzer:
         max_contribution: int = 1,
     ) -> SensitivityReport:
         # 针对方差查询计算全局敏感度并保留样本量与自由度信息
+        # 开销：O(1) 算术（核心函数按参数缓存），耗时主要在调用与分派开销
         sens = variance_global_sensitivity(
             domain,
             sample_size=sample_size,
             ddof=ddof,
             max_contribution=max_contribution,
         )
-        return SensitivityReport(
-            query="variance",
-            sensitivity=sens,
-            metadata={
-                "sample_size": float(sample_size),
-                "ddof": float(ddof),
-                "max_contribution": float(max_contribution),
-            },
+        return _make_report(
+            "variance",
+            sens,
+            (
+                ("sample_size", float(sample_size)),
+                ("ddof", float(ddof)),
+                ("max_contribution", float(max_contribution)),
+            ),
         )
 
     def histogram(self, *, max_contribution: int = 1) -> SensitivityReport:
         # 针对直方图计数向量返回每个 bin 的全局敏感度上界
-        sens = histogram_global_sensitivity(max_contribution=max_contribution)
-        return SensitivityReport(
-            query="histogram",
-            sensitivity=sens,
-            metadata={"max_contribution": float(max_contribution)},
-        )
+        # 开销：O(1) 算术，耗时主要在调用与分派开销
+        sens = _fast_histogram_sensitivity(max_contribution)
+        return _make_report("histogram", sens, (("max_contribution", float(max_contribution)),))
 
     def range(
         self,
@@ -156,68 +284,147 @@ class SensitivityAnalyzer:
         metric: str,
     ) -> SensitivityReport:
         # 针对固定窗口长度的区间查询（sum/count/mean）计算全局敏感度
+        # 开销：O(1) 算术（核心函数按参数缓存），耗时主要在调用与分派开销
         sens = range_global_sensitivity(domain, window=window, max_contribution=max_contribution, metric=metric)
-        return SensitivityReport(
-            query=f"range_{metric}",
-            sensitivity=sens,
-            metadata={"window": float(window), "max_contribution": float(max_contribution), "metric": metric},
+        return _make_report(
+            f"range_{metric}",
+            sens,
+            (("window", float(window)), ("max_contribution", float(max_contribution)), ("metric", metric)),
         )
 
     def local(self, values: Iterable[float], *, metric: str = "l1") -> SensitivityReport:
         # 根据样本值与度量类型计算局部敏感度，用于 tighter 的经验估计
-        sens = local_sensitivity(list(values), metric=metric)
-        return SensitivityReport(query="local", sensitivity=sens, metadata={"metric": metric})
+        # 开销：O(n log n)，受排序与样本内存带宽限制，属于 _HOT_METHODS
+        sens = local_sensitivity(values, metric=metric)
+        return SensitivityReport(query="local", sensitivity=sens, metadata=ReportMetadata((("metric", metric),)))
 
     def smooth_mean(self, values: Iterable[float], *, beta: float) -> SensitivityReport:
         # 基于样本值与 beta 参数计算均值查询的平滑敏感度估计
-        estimate = smooth_sensitivity_mean(list(values), beta=beta)
+        # 开销：O(n) 单次极值扫描，受样本内存带宽限制，属于 _HOT_METHODS
+        estimate = smooth_sensitivity_mean(values, beta=beta)
         return SensitivityReport(
             query="smooth_mean",
             sensitivity=estimate.estimate,
-            metadata={"beta": float(beta)},
+            metadata=ReportMetadata((("beta", float(beta)),)),
         )
 
     def analyze(self, query: str, **kwargs) -> SensitivityReport:
         """Dispatch to a built-in analyzer by query name."""
         # 统一入口根据查询名分派到对应分析方法并校验所需参数是否齐全
-        q = query.lower()
-        if q == "count":
-            return self.count(max_contribution=kwargs.get("max_contribution", 1))
-        if q == "sum":
-            domain = self._require_domain(kwargs.get("domain"), "sum")
-            return self.sum(domain, max_contribution=kwargs.get("max_contribution", 1))
-        if q == "mean":
-            domain = self._require_domain(kwargs.get("domain"), "mean")
-            sample_size = self._require_param(kwargs.get("sample_size"), "sample_size", "mean")
-            return self.mean(domain, sample_size=sample_size, max_contribution=kwargs.get("max_contribution", 1))
-        if q == "variance":
-            domain = self._require_domain(kwargs.get("domain"), "variance")
-            sample_size = self._require_param(kwargs.get("sample_size"), "sample_size", "variance")
-            return self.variance(
-                domain,
-                sample_size=sample_size,
-                ddof=kwargs.get("ddof", 1),
-                max_contribution=kwargs.get("max_contribution", 1),
-            )
-        if q == "histogram":
-            return self.histogram(max_contribution=kwargs.get("max_contribution", 1))
-        if q == "range":
-            domain = self._require_domain(kwargs.get("domain"), "range")
-            window = self._require_param(kwargs.get("window"), "window", "range")
-            return self.range(domain, window=window, max_contribution=kwargs.get("max_contribution", 1), metric=kwargs.get("metric", "sum"))
-        if q == "local":
-            values = self._require_param(kwargs.get("values"), "values", "local")
-            return self.local(values, metric=kwargs.get("metric", "l1"))
-        if q == "smooth_mean":
-            values = self._require_param(kwargs.get("values"), "values", "smooth_mean")
-            beta = self._require_param(kwargs.get("beta"), "beta", "smooth_mean")
-            return self.smooth_mean(values, beta=beta)
-        raise ParamValidationError(f"unsupported query type '{query}'")
+        # 说明：查询名经类级分派表一次字典查找定位处理函数，替代逐个字符串比较的分支链
+        # 说明：调用方已使用小写查询名时直接命中分派表，仅在未命中时才回退到 lower() 归一化
+        name = query
+        handler = _ANALYZE_HANDLERS.get(name)
+        if handler is None:
+            name = query.lower()
+            handler = _ANALYZE_HANDLERS.get(name)
+            if handler is None:
+                raise ParamValidationError(f"unsupported query type '{query}'")
+        # 说明：分派层缓存仅用于基类实例；子类可能持有实例状态或重写处理函数，结果不能跨实例共享
+        key = _analyze_cache_key(name, kwargs) if type(self) is SensitivityAnalyzer else None
+        if key is not None:
+            cached = _ANALYZE_CACHE.get(key)
+            if cached is not None:
+                _ANALYZE_CACHE.move_to_end(key)
+                return cached
+        report = handler(self, kwargs)
+        if key is not None:
+            _ANALYZE_CACHE[key] = report
+            if len(_ANALYZE_CACHE) > _ANALYZE_CACHE_SIZE:
+                # 超出容量时只淘汰最久未使用的一项，而不是整体清空
+                _ANALYZE_CACHE.popitem(last=False)
+        return report
+
+    @singledispatchmethod
+    def run(self, query: Any) -> SensitivityReport:
+        """Dispatch a typed query object (e.g. ``CountQuery``) to its analyzer."""
+        # 按查询对象类型分派，调用方无需构造字符串查询名与 kwargs 字典
+        raise ParamValidationError(f"unsupported query object of type '{type(query).__name__}'")
+
+    @run.register(CountQuery)
+    def _run_count(self, query: CountQuery) -> SensitivityReport:
+        return self.count(max_contribution=query.max_contribution)
+
+    @run.register(SumQuery)
+    def _run_sum(self, query: SumQuery) -> SensitivityReport:
+        return self.sum(query.domain, max_contribution=query.max_contribution)
+
+    @run.register(MeanQuery)
+    def _run_mean(self, query: MeanQuery) -> SensitivityReport:
+        return self.mean(query.domain, sample_size=query.sample_size, max_contribution=query.max_contribution)
+
+    @run.register(VarianceQuery)
+    def _run_variance(self, query: VarianceQuery) -> SensitivityReport:
+        return self.variance(
+            query.domain,
+            sample_size=query.sample_size,
+            ddof=query.ddof,
+            max_contribution=query.max_contribution,
+        )
+
+    @run.register(HistogramQuery)
+    def _run_histogram(self, query: HistogramQuery) -> SensitivityReport:
+        return self.histogram(max_contribution=query.max_contribution)
+
+    @run.register(RangeQuery)
+    def _run_range(self, query: RangeQuery) -> SensitivityReport:
+        return self.range(query.domain, window=query.window, max_contribution=query.max_contribution, metric=query.metric)
+
+    @run.register(LocalQuery)
+    def _run_local(self, query: LocalQuery) -> SensitivityReport:
+        return self.local(query.values, metric=query.metric)
+
+    @run.register(SmoothMeanQuery)
+    def _run_smooth_mean(self, query: SmoothMeanQuery) -> SensitivityReport:
+        return self.smooth_mean(query.values, beta=query.beta)
+
+    # ------------------------------------------------------------------ dispatch
+    def _analyze_count(self, kwargs: Mapping[str, object]) -> SensitivityReport:
+        return self.count(max_contribution=kwargs.get("max_contribution", 1))
+
+    def _analyze_sum(self, kwargs: Mapping[str, object]) -> SensitivityReport:
+        domain = self._require_domain(kwargs.get("domain"), "sum")
+        return self.sum(domain, max_contribution=kwargs.get("max_contribution", 1))
+
+    def _analyze_mean(self, kwargs: Mapping[str, object]) -> SensitivityReport:
+        domain = self._require_domain(kwargs.get("domain"), "mean")
+        sample_size = self._require_param(kwargs.get("sample_size"), "sample_size", "mean")
+        return self.mean(domain, sample_size=sample_size, max_contribution=kwargs.get("max_contribution", 1))
+
+    def _analyze_variance(self, kwargs: Mapping[str, object]) -> SensitivityReport:
+        domain = self._require_domain(kwargs.get("domain"), "variance")
+        sample_size = self._require_param(kwargs.get("sample_size"), "sample_size", "variance")
+        return self.variance(
+            domain,
+            sample_size=sample_size,
+            ddof=kwargs.get("ddof", 1),
+            max_contribution=kwargs.get("max_contribution", 1),
+        )
+
+    def _analyze_histogram(self, kwargs: Mapping[str, object]) -> SensitivityReport:
+        return self.histogram(max_contribution=kwargs.get("max_contribution", 1))
+
+    def _analyze_range(self, kwargs: Mapping[str, object]) -> SensitivityReport:
+        domain = self._require_domain(kwargs.get("domain"), "range")
+        window = self._require_param(kwargs.get("window"), "window", "range")
+        return self.range(domain, window=window, max_contribution=kwargs.get("max_contribution", 1), metric=kwargs.get("metric", "sum"))
+
+    def _analyze_local(self, kwargs: Mapping[str, object]) -> SensitivityReport:
+        values = self._require_param(kwargs.get("values"), "values", "local")
+        return self.local(values, metric=kwargs.get("metric", "l1"))
+
+    def _analyze_smooth_mean(self, kwargs: Mapping[str, object]) -> SensitivityReport:
+        values = self._require_param(kwargs.get("values"), "values", "smooth_mean")
+        beta = self._require_param(kwargs.get("beta"), "beta", "smooth_mean")
+        return self.smooth_mean(values, beta=beta)
 
     # ------------------------------------------------------------------ helpers
     @staticmethod
     def _require_domain(domain: Optional[ContinuousDomain], name: str) -> ContinuousDomain:
         # 辅助校验 domain 参数是否为 ContinuousDomain 并在缺失时抛出统一错误信息
+        # 说明：精确类型比较覆盖常见调用，仅子类与非法输入才走 isinstance 回退
+        if type(domain) is ContinuousDomain:
+            return domain
         if domain is None or not isinstance(domain, ContinuousDomain):
             raise ParamValidationError(f"domain (ContinuousDomain) is required for {name} sensitivity")
         return domain
@@ -228,3 +435,92 @@ class SensitivityAnalyzer:
         if value is None:
             raise ParamValidationError(f"{param} is required for {name} sensitivity")
         return value
+
+
+# analyze 的查询名分派表；处理函数以 (analyzer, kwargs) 调用，类定义完成后一次性构建
+_ANALYZE_HANDLERS = {
+    sys.intern(name): handler
+    for name, handler in (
+        ("count", SensitivityAnalyzer._analyze_count),
+        ("sum", SensitivityAnalyzer._analyze_sum),
+        ("mean", SensitivityAnalyzer._analyze_mean),
+        ("variance", SensitivityAnalyzer._analyze_variance),
+        ("histogram", SensitivityAnalyzer._analyze_histogram),
+        ("range", SensitivityAnalyzer._analyze_range),
+        ("local", SensitivityAnalyzer._analyze_local),
+        ("smooth_mean", SensitivityAnalyzer._analyze_smooth_mean),
+    )
+}
+
+# 开销随样本规模增长的方法；其余查询均为 O(1) 闭式算术，优化只需关注调用/分派开销，
+# 向量化、JIT 等重量级手段仅对这里列出的路径有意义
+_HOT_METHODS = frozenset({"local", "smooth_mean"})
+
+# 报告被驻留共享的全局敏感度查询（即非样本相关的方法），analyze 可在分派层直接复用其结果
+_CACHEABLE_QUERIES = frozenset(_ANALYZE_HANDLERS) - _HOT_METHODS
+_ANALYZE_CACHE_SIZE = 4096
+# 按最近使用顺序排列的有界缓存（LRU）
+_ANALYZE_CACHE: "OrderedDict[Tuple[Any, ...], SensitivityReport]" = OrderedDict()
+
+
+def _analyze_cache_key(query: str, kwargs: Mapping[str, Any]) -> Optional[Tuple[Any, ...]]:
+    # 构造 analyze 分派层缓存键（query 已由 analyze 归一化为小写）：ContinuousDomain 为可变对象，按其类型与边界取值而非对象身份参与键；
+    # 样本相关查询、不可哈希参数均不缓存；
+    # 参数取值连同其类型参与键（2 与 2.0 相等但报告中的数值类型不同），避免返回先前调用类型的报告
+    if query not in _CACHEABLE_QUERIES:
+        return None
+    items = []
+    for name, value in kwargs.items():
+        if isinstance(value, ContinuousDomain):
+            minimum, maximum = value.minimum, value.maximum
+            value = (type(value), type(minimum), minimum, type(maximum), maximum)
+        items.append((name, type(value), value))
+    items.sort()
+    key = (query, tuple(items))
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+# 分析器本身无状态，共享一个模块级默认实例，调用方无需逐次构造；
+# 其方法同时以模块级函数暴露，例如 `from ...sensitivity_analyzer import count as count_report`
+# 说明：sum / range 以 *_report 命名导出，避免在本模块及星号导入方遮蔽同名内置函数
+default_analyzer = SensitivityAnalyzer()
+
+count = default_analyzer.count
+sum_report = default_analyzer.sum
+mean = default_analyzer.mean
+variance = default_analyzer.variance
+histogram = default_analyzer.histogram
+range_report = default_analyzer.range
+local = default_analyzer.local
+smooth_mean = default_analyzer.smooth_mean
+analyze = default_analyzer.analyze
+run = default_analyzer.run
+
+__all__ = [
+    "ReportMetadata",
+    "SensitivityReport",
+    "SensitivityAnalyzer",
+    "CountQuery",
+    "SumQuery",
+    "MeanQuery",
+    "VarianceQuery",
+    "HistogramQuery",
+    "RangeQuery",
+    "LocalQuery",
+    "SmoothMeanQuery",
+    "default_analyzer",
+    "count",
+    "sum_report",
+    "mean",
+    "variance",
+    "histogram",
+    "range_report",
+    "local",
+    "smooth_mean",
+    "analyze",
+    "run",
+]
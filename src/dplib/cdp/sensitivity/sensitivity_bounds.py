@@ -25,22 +25,25 @@ Limitations
 
 from __future__ import annotations
 
+import functools
 from dataclasses import dataclass
-from typing import Dict, Optional
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional
 
 from dplib.core.data.domain import ContinuousDomain
 from dplib.core.data.sensitivity import (
-    count_global_sensitivity,
-    histogram_global_sensitivity,
+    _fast_count_sensitivity,
+    _fast_histogram_sensitivity,
+    _fast_sum_sensitivity,
     mean_global_sensitivity,
     range_global_sensitivity,
-    sum_global_sensitivity,
     variance_global_sensitivity,
 )
+from dplib.core.utils.compat import DATACLASS_SLOTS
 from dplib.core.utils.param_validation import ensure_type
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class SensitivityBounds:
     """
     Container for lower/upper bounds and an optional proof note.
@@ -66,22 +69,40 @@ class SensitivityBounds:
         return {"lower": float(self.lower), "upper": float(self.upper)}
 
 
+@functools.lru_cache(maxsize=1024, typed=True)
+def _make_bounds(upper: float, proof: str) -> SensitivityBounds:
+    # 下界恒为 0 的区间只由上界数值与证明说明决定；核心敏感度函数已按域边界原始取值缓存，
+    # 此处再按 (upper, proof) 复用同一不可变实例（typed=True 保留 int/float 上界类型），
+    # 等价但非同一对象的域也会命中同一区间
+    return SensitivityBounds(lower=0.0, upper=upper, proof=proof)
+
+
+# 区间查询各度量对应的证明说明，以模块级只读映射共享，避免每次调用重建字典
+_RANGE_PROOFS: Mapping[str, str] = MappingProxyType(
+    {
+        "sum": "range sum bound = span * window * contribution",
+        "mean": "range mean bound = (span * window * contribution)/window",
+        "count": "range count bound = max_contribution",
+    }
+)
+
+
 def count_bounds(max_contribution: int = 1) -> SensitivityBounds:
     # 针对 count 查询基于全局敏感度构造下界为 0 的敏感度区间
-    upper = count_global_sensitivity(max_contribution=max_contribution)
-    return SensitivityBounds(lower=0.0, upper=upper, proof="global bound; lower bound by definition >=0")
+    upper = _fast_count_sensitivity(max_contribution)
+    return _make_bounds(upper, "global bound; lower bound by definition >=0")
 
 
 def sum_bounds(domain: ContinuousDomain, *, max_contribution: int = 1) -> SensitivityBounds:
     # 针对求和查询在有界连续域和贡献上界条件下给出敏感度上下界与证明说明
-    upper = sum_global_sensitivity(domain, max_contribution=max_contribution)
-    return SensitivityBounds(lower=0.0, upper=upper, proof="bounded continuous domain span * contribution")
+    upper = _fast_sum_sensitivity(domain, max_contribution)
+    return _make_bounds(upper, "bounded continuous domain span * contribution")
 
 
 def mean_bounds(domain: ContinuousDomain, *, sample_size: int, max_contribution: int = 1) -> SensitivityBounds:
     # 针对均值查询通过 sum 全局敏感度与样本量构造上下界并记录 sum/sample_size 关系
     upper = mean_global_sensitivity(domain, sample_size=sample_size, max_contribution=max_contribution)
-    return SensitivityBounds(lower=0.0, upper=upper, proof="sum bound / sample_size")
+    return _make_bounds(upper, "sum bound / sample_size")
 
 
 def variance_bounds(
@@ -98,13 +119,13 @@ def variance_bounds(
         ddof=ddof,
         max_contribution=max_contribution,
     )
-    return SensitivityBounds(lower=0.0, upper=upper, proof="bounded variable variance <= span^2/4")
+    return _make_bounds(upper, "bounded variable variance <= span^2/4")
 
 
 def histogram_bounds(max_contribution: int = 1) -> SensitivityBounds:
     # 针对直方图计数向量的每个 bin 给出基于贡献次数的敏感度上下界
-    upper = histogram_global_sensitivity(max_contribution=max_contribution)
-    return SensitivityBounds(lower=0.0, upper=upper, proof="each record contributes to one bin")
+    upper = _fast_histogram_sensitivity(max_contribution)
+    return _make_bounds(upper, "each record contributes to one bin")
 
 
 def range_bounds(
@@ -121,12 +142,7 @@ def range_bounds(
         max_contribution=max_contribution,
         metric=metric,
     )
-    proof = {
-        "sum": "range sum bound = span * window * contribution",
-        "mean": "range mean bound = (span * window * contribution)/window",
-        "count": "range count bound = max_contribution",
-    }.get(metric, "range bound")
-    return SensitivityBounds(lower=0.0, upper=upper, proof=proof)
+    return _make_bounds(upper, _RANGE_PROOFS.get(metric, "range bound"))
 
 
 def tighten(bounds: SensitivityBounds, *, observed: float) -> SensitivityBounds:
@@ -134,6 +150,13 @@ def tighten(bounds: SensitivityBounds, *, observed: float) -> SensitivityBounds:
     Optionally tighten bounds using an observed sensitivity (e.g., local estimate).
     """
     # 使用观测敏感度值对既有敏感度区间的上界进行收紧，保持下界与证明说明不变
-    ensure_type(observed, (int, float), label="observed")
-    upper = min(bounds.upper, float(observed))
+    # 说明：内建 int/float 经精确类型比较直接放行，其余输入再交由 ensure_type 给出统一报错
+    observed_type = type(observed)
+    if observed_type is not float and observed_type is not int:
+        ensure_type(observed, (int, float), label="observed")
+    observed = float(observed)
+    # 观测值未能改进上界时原样返回既有区间，避免重复构造不可变对象
+    if observed >= bounds.upper:
+        return bounds
+    upper = min(bounds.upper, observed)
     return SensitivityBounds(lower=bounds.lower, upper=upper, proof=bounds.proof)
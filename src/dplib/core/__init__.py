@@ -2,126 +2,63 @@
 
 from __future__ import annotations
 
-__all__: list[str] = []
+import importlib
+from typing import Any, Dict
 
-# Data
-try:
-    from .data import (
-        BaseDomain,
-        BucketizedDomain,
-        ContinuousDomain,
-        DataValidationError,
-        Dataset,
-        DatasetError,
-        DiscreteDomain,
-        DomainError,
-        Schema,
-        SchemaField,
-        SchemaValidator,
-    )
+# 说明：公共符号按 PEP 562 在首次访问时才导入所属子包，仅需单个符号的调用方无需加载整个 data/privacy/utils 子树
+_LAZY_IMPORTS: Dict[str, str] = {
+    # Data
+    "BaseDomain": ".data",
+    "BucketizedDomain": ".data",
+    "ContinuousDomain": ".data",
+    "DataValidationError": ".data",
+    "Dataset": ".data",
+    "DatasetError": ".data",
+    "DiscreteDomain": ".data",
+    "DomainError": ".data",
+    "Schema": ".data",
+    "SchemaField": ".data",
+    "SchemaValidator": ".data",
+    # Privacy
+    "BaseMechanism": ".privacy",
+    "BudgetExceededError": ".privacy",
+    "BudgetTracker": ".privacy",
+    "CalibrationError": ".privacy",
+    "MechanismError": ".privacy",
+    "MechanismType": ".privacy",
+    "NotCalibratedError": ".privacy",
+    "PrivacyAccountant": ".privacy",
+    "PrivacyBudget": ".privacy",
+    "PrivacyEvent": ".privacy",
+    "PrivacyGuarantee": ".privacy",
+    "PrivacyModel": ".privacy",
+    "ValidationError": ".privacy",
+    # Utils
+    "ParamValidationError": ".utils",
+    "RuntimeConfig": ".utils",
+    "configure": ".utils",
+    "get_config": ".utils",
+    "get_logger": ".utils",
+}
 
-    __all__.extend(
-        [
-            "BaseDomain",
-            "BucketizedDomain",
-            "ContinuousDomain",
-            "DataValidationError",
-            "Dataset",
-            "DatasetError",
-            "DiscreteDomain",
-            "DomainError",
-            "Schema",
-            "SchemaField",
-            "SchemaValidator",
-        ]
-    )
-except Exception:  # pragma: no cover - optional until implemented
-    BaseDomain = None  # type: ignore
-    BucketizedDomain = None  # type: ignore
-    ContinuousDomain = None  # type: ignore
-    DataValidationError = None  # type: ignore
-    Dataset = None  # type: ignore
-    DatasetError = None  # type: ignore
-    DiscreteDomain = None  # type: ignore
-    DomainError = None  # type: ignore
-    Schema = None  # type: ignore
-    SchemaField = None  # type: ignore
-    SchemaValidator = None  # type: ignore
+# 子包本身也按需导入，保持 `import dplib.core; dplib.core.data` 这类访问可用
+_SUBPACKAGES = frozenset({"data", "privacy", "utils"})
 
+__all__: list[str] = list(_LAZY_IMPORTS)
 
-# Privacy
-try:
-    from .privacy import (
-        BaseMechanism,
-        BudgetExceededError,
-        BudgetTracker,
-        CalibrationError,
-        MechanismError,
-        MechanismType,
-        NotCalibratedError,
-        PrivacyAccountant,
-        PrivacyBudget,
-        PrivacyEvent,
-        PrivacyGuarantee,
-        PrivacyModel,
-        ValidationError,
-    )
 
-    __all__.extend(
-        [
-            "BaseMechanism",
-            "BudgetExceededError",
-            "BudgetTracker",
-            "CalibrationError",
-            "MechanismError",
-            "MechanismType",
-            "NotCalibratedError",
-            "PrivacyAccountant",
-            "PrivacyBudget",
-            "PrivacyEvent",
-            "PrivacyGuarantee",
-            "PrivacyModel",
-            "ValidationError",
-        ]
-    )
-except Exception:  # pragma: no cover - optional until implemented
-    BaseMechanism = None  # type: ignore
-    BudgetExceededError = None  # type: ignore
-    BudgetTracker = None  # type: ignore
-    CalibrationError = None  # type: ignore
-    MechanismError = None  # type: ignore
-    MechanismType = None  # type: ignore
-    NotCalibratedError = None  # type: ignore
-    PrivacyAccountant = None  # type: ignore
-    PrivacyBudget = None  # type: ignore
-    PrivacyEvent = None  # type: ignore
-    PrivacyGuarantee = None  # type: ignore
-    PrivacyModel = None  # type: ignore
-    ValidationError = None  # type: ignore
+def __getattr__(name: str) -> Any:
+    # 首次访问公共符号时导入对应子包并写回模块全局，后续访问不再经过本函数
+    if name in _SUBPACKAGES:
+        return importlib.import_module(f".{name}", __name__)
+    module_path = _LAZY_IMPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # 核心子包均为必需组件，导入失败直接向调用方抛出，而不是以 None 占位掩盖问题
+    value = getattr(importlib.import_module(module_path, __name__), name)
+    globals()[name] = value
+    return value
 
 
-# Utils
-try:
-    from .utils import (
-        ParamValidationError,
-        RuntimeConfig,
-        configure,
-        get_config,
-        get_logger,
-    )
-
-    __all__.extend(
-        [
-            "ParamValidationError",
-            "RuntimeConfig",
-            "configure",
-            "get_config",
-            "get_logger",
-        ]
-    )
-except Exception:  # pragma: no cover - optional until implemented
-    ParamValidationError = None  # type: ignore
-    RuntimeConfig = None  # type: ignore
-    configure = None  # type: ignore
-    get_config = None  # type: ignore
-    get_logger = None  # type: ignore
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_IMPORTS) | _SUBPACKAGES)
@@ -6,6 +6,7 @@ against domain constraints and missing-value rules.
 Responsibilities
   - Define schema and field descriptors for required, optional, and nullable inputs.
   - Validate records against schema constraints and domain rules.
+  - Validate columnar batches with per-column domain membership checks.
   - Provide missing-value counting utilities for required fields.
 
 Usage Context
@@ -14,13 +15,13 @@ Usage Context
 
 Limitations
   - Validation operates on explicit schemas and does not infer fields from data.
-  - Missing-value detection treats only None and empty strings as missing.
+  - Missing-value detection treats only None, empty strings and NaN as missing.
   - Imputation relies on field defaults or a caller-supplied callback.
 """
 # 说明：通用数据校验辅助工具。
 # 职责：
 # - Schema / SchemaField：描述字段名、Domain、是否必填、默认值等模式信息
-# - SchemaValidator：按给定策略（RAISE / DROP / IMPUTE）对记录进行校验与缺失处理
+# - SchemaValidator：按给定策略（RAISE / DROP / IMPUTE）对记录进行校验与缺失处理，支持按列批量校验
 # - DataValidationError：用于无法满足校验（尤其是无法插补）时的错误报告
 # - detect_missing：统计必填字段在记录集中的缺失次数（None / 空字符串 / NaN）
 # 约定：
@@ -32,7 +33,10 @@ Limitations
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Union
+
+import numpy as np
 
 from .domain import BaseDomain, DomainError
 from dplib.core.utils.param_validation import ensure, ensure_type, ParamValidationError
@@ -60,6 +64,15 @@ class ValidationStrategy:
     IMPUTE = "impute"
 
 
+# 公共 API 沿用字符串策略名；校验器内部换算为整数编码，错误分支上以整数比较代替字符串比较
+_RAISE, _DROP, _IMPUTE = 0, 1, 2
+_STRATEGY_CODES: Dict[str, int] = {
+    ValidationStrategy.RAISE: _RAISE,
+    ValidationStrategy.DROP: _DROP,
+    ValidationStrategy.IMPUTE: _IMPUTE,
+}
+
+
 @dataclass
 class SchemaField:
     """Describe a single field inside a schema definition.
@@ -99,19 +112,20 @@ class Schema:
       - fields: Ordered sequence of SchemaField definitions.
     
     - Behavior
-      - Provides a name-to-field mapping for lookup.
+      - Provides a read-only name-to-field mapping for lookup, built once at initialization.
       - Validates that fields and domains are of expected types at initialization.
     
     - Usage Notes
       - Field order is preserved in the input sequence for validator iteration.
+      - Fields are treated as fixed after construction; build a new schema to change them.
     """
     # 模式对象：由多个 SchemaField 组成
 
     fields: Sequence[SchemaField]
 
-    def field_map(self) -> Dict[str, SchemaField]:
-        # 字段映射：将字段序列转换为 {字段名: SchemaField} 映射，便于按名称快速查询
-        return {field.name: field for field in self.fields}
+    def field_map(self) -> Mapping[str, SchemaField]:
+        # 字段映射：返回初始化时预先构建的 {字段名: SchemaField} 只读映射，便于按名称快速查询
+        return self._field_map
 
     def __post_init__(self) -> None:
         # 初始化时对 fields 容器与每个字段/域做一次轻量类型校验，避免静态配置错误
@@ -119,6 +133,13 @@ class Schema:
         for field in self.fields:
             ensure_type(field, (SchemaField,), label="field")
             ensure_type(field.domain, (BaseDomain,), label=f"{field.name}.domain")
+        # 说明：字段在构造后视为固定，一次性预解析按名映射与校验计划，
+        # 计划元组为 (字段名, 绑定的域校验函数, 缺失是否需处理, 默认值, 字段)，供校验器逐记录直接解包
+        self._field_map: Mapping[str, SchemaField] = MappingProxyType({field.name: field for field in self.fields})
+        self._compiled = tuple(
+            (field.name, field.domain.validate, field.required and not field.allow_null, field.default, field)
+            for field in self.fields
+        )
 
 
 class DataValidationError(ValueError):
@@ -162,51 +183,145 @@ class SchemaValidator:
         imputer: Optional[Callable[[SchemaField], Any]] = None,
     ):
         # 初始化校验器：绑定 Schema、错误处理策略与可选插补函数
-        ensure(
-            on_error in {ValidationStrategy.RAISE, ValidationStrategy.DROP, ValidationStrategy.IMPUTE},
-            "unknown validation strategy",
-            error=ParamValidationError,
-        )
+        ensure(on_error in _STRATEGY_CODES, "unknown validation strategy", error=ParamValidationError)
         ensure_type(schema, (Schema,), label="schema")
         self.schema = schema
         self.on_error = on_error
         self.imputer = imputer
-
-    def validate_record(self, record: Mapping[str, Any]) -> Optional[Dict[str, Any]]:
+        # 说明：复用 Schema 预解析的字段计划，逐记录校验时直接解包局部变量，
+        # 省去每字段的属性查找与 required/allow_null 组合判断
+        self._plan = schema._compiled
+
+    @property
+    def on_error(self) -> str:
+        # 对外保持字符串形式的策略名（"raise" / "drop" / "impute"）
+        return self._on_error
+
+    @on_error.setter
+    def on_error(self, value: str) -> None:
+        # 设置策略时同步换算为整数编码，逐记录处理错误时只做整数比较
+        ensure(value in _STRATEGY_CODES, "unknown validation strategy", error=ParamValidationError)
+        self._on_error = value
+        self._on_error_code = _STRATEGY_CODES[value]
+
+    def validate_record(self, record: Mapping[str, Any], *, copy: bool = True) -> Optional[Dict[str, Any]]:
         # 校验单条记录：按 Schema 检查缺失与 Domain 约束，根据策略决定抛错 / 丢弃 / 插补
+        # copy=False 时，已符合模式的 dict 记录原样返回，不再复制（调用方需自行避免修改共享记录）
+        if not copy and type(record) is dict and self._conforms(record):
+            return record  # type: ignore[return-value]
         result: Dict[str, Any] = dict(record)
-        for field in self.schema.fields:
-            value = result.get(field.name, field.default)
+        for name, validate, must_fill, default, field in self._plan:
+            value = result.get(name, default)
             if value is None:
                 # 处理缺失：若必填且不允许为空，按策略 RAISE/DROP/IMPUTE 处理
-                if field.required and not field.allow_null:
-                    if self.on_error == ValidationStrategy.RAISE:
-                        raise ParamValidationError(f"field '{field.name}' missing")
-                    if self.on_error == ValidationStrategy.DROP:
+                if must_fill:
+                    if self._on_error_code == _RAISE:
+                        raise ParamValidationError(f"field '{name}' missing")
+                    if self._on_error_code == _DROP:
                         return None
                     value = self._impute(field)
-                result[field.name] = value
+                result[name] = value
                 continue
             try:
                 # 非缺失值交由域对象执行类型/范围等校验与规范化
-                result[field.name] = field.domain.validate(value)
+                result[name] = validate(value)
             except DomainError as exc:
                 # 域校验失败：按策略处理
-                if self.on_error == ValidationStrategy.RAISE:
+                if self._on_error_code == _RAISE:
                     raise ParamValidationError(str(exc)) from exc
-                if self.on_error == ValidationStrategy.DROP:
+                if self._on_error_code == _DROP:
                     return None
                 # IMPUTE 策略下，对域校验失败的值进行插补
-                result[field.name] = self._impute(field)
+                result[name] = self._impute(field)
         return result
 
-    def validate_records(self, records: Iterable[Mapping[str, Any]]) -> List[Dict[str, Any]]:
-        # 批量校验多条记录，自动过滤掉策略为 DROP 时返回 None 的记录
+    def _conforms(self, record: Dict[str, Any]) -> bool:
+        # 只读预检：所有模式字段均已存在、缺失值无需处理且域校验结果就是原对象时，记录无需任何改写；
+        # 任一条件不满足即返回 False，交由常规路径复制并处理（仅不合规记录会重复执行域校验）
+        for name, validate, must_fill, _default, _field in self._plan:
+            if name not in record:
+                return False
+            value = record[name]
+            if value is None:
+                if must_fill:
+                    return False
+                continue
+            try:
+                if validate(value) is not value:
+                    return False
+            except DomainError:
+                return False
+        return True
+
+    def validate_records(self, records: Iterable[Mapping[str, Any]], *, copy: bool = True) -> List[Dict[str, Any]]:
+        # 批量校验多条记录，自动过滤掉策略为 DROP 时返回 None 的记录；copy 语义同 validate_record
         output: List[Dict[str, Any]] = []
+        validate_record = self.validate_record
+        append = output.append
         for record in records:
-            validated = self.validate_record(record)
+            validated = validate_record(record, copy=copy)
             if validated is not None:
-                output.append(validated)
+                append(validated)
+        return output
+
+    def validate_columns(self, columns: Mapping[str, Sequence[Any]]) -> Dict[str, List[Any]]:
+        """Validate a columnar batch (field name -> column values) with per-column domain checks.
+
+        Produces the same values as ``validate_records`` on the equivalent rows, returned as
+        columns; rows dropped under the DROP strategy are removed from every column.
+        """
+        # 列式批量校验：每个字段整列做缺失判定与一次批量域成员判定（ContinuousDomain 为向量化比较），
+        # 再按策略统一处理问题行；结果与逐行调用 validate_record 一致（RAISE 时报告行优先的首个错误）
+        size = len(next(iter(columns.values()), ()))
+        output: Dict[str, List[Any]] = {name: list(column) for name, column in columns.items()}
+        keep = np.ones(size, dtype=bool)
+        first_error: Optional[tuple] = None
+        for name, validate, must_fill, default, field in self._plan:
+            values = output.setdefault(name, [default] * size)
+            missing = np.fromiter((value is None for value in values), dtype=bool, count=size)
+            present = np.flatnonzero(~missing)
+            invalid = np.zeros(size, dtype=bool)
+            domain = field.domain
+            if present.size:
+                if type(domain).validate is BaseDomain.validate:
+                    # 未覆盖 validate 的域：批量 contains 后仅对合法值逐个 encode（默认 encode 为恒等时跳过）
+                    batch = [values[i] for i in present]
+                    invalid[present] = ~domain.contains_array(batch)
+                    if type(domain).encode is not BaseDomain.encode:
+                        encode = domain.encode
+                        for i in present[~invalid[present]]:
+                            values[i] = encode(values[i])
+                else:
+                    # 自定义 validate 的域逐元素调用，保持其原有规范化语义
+                    for i in present:
+                        try:
+                            values[i] = validate(values[i])
+                        except DomainError:
+                            invalid[i] = True
+            bad = missing | invalid if must_fill else invalid
+            if not bad.any():
+                continue
+            if self._on_error_code == _RAISE:
+                row = int(np.argmax(bad))
+                if first_error is None or row < first_error[0]:
+                    first_error = (row, name, bool(missing[row]), values[row], validate)
+            elif self._on_error_code == _DROP:
+                keep &= ~bad
+            else:
+                for i in np.flatnonzero(bad):
+                    values[i] = self._impute(field)
+        if first_error is not None:
+            # 按字段顺序遍历时仅在更早的行出现错误才替换，因此得到与逐行校验相同的首个错误
+            _, name, is_missing, value, validate = first_error
+            if is_missing:
+                raise ParamValidationError(f"field '{name}' missing")
+            try:
+                validate(value)
+            except DomainError as exc:
+                raise ParamValidationError(str(exc)) from exc
+        if not keep.all():
+            rows = np.flatnonzero(keep)
+            output = {name: [values[i] for i in rows] for name, values in output.items()}
         return output
 
     def _impute(self, field: SchemaField) -> Any:
@@ -218,13 +333,56 @@ class SchemaValidator:
         raise DataValidationError(f"cannot impute field '{field.name}'")
 
 
-def detect_missing(records: Iterable[Mapping[str, Any]], *, required: Sequence[str]) -> Dict[str, int]:
-    """Return counts of missing values per field."""
-    # 缺失检测：对 required 列表中的缺失字段逐条记录计数
-    # 规则：值为 None / 空字符串 "" / NaN 视为缺失
+def detect_missing(
+    records: Union[Iterable[Mapping[str, Any]], Mapping[str, Sequence[Any]]], *, required: Sequence[str]
+) -> Dict[str, int]:
+    """Return counts of missing values per field.
+
+    Accepts either row records or a columnar mapping of field name to column values.
+    """
+    # 缺失检测：对 required 列表中的缺失字段计数
+    # 规则：值为 None / 空字符串 "" / NaN 视为缺失（NaN 与自身不相等，需单独判断，不能依赖 in 元组比较）
+    if isinstance(records, Mapping):
+        # 列式输入：每列整体转换为数组，数值列与定长字符串列用向量化比较，仅 object 列逐元素判断
+        size = len(next(iter(records.values()), ()))
+        return {field: _count_missing_column(records[field]) if field in records else size for field in required}
     counts = {field: 0 for field in required}
     for record in records:
+        get = record.get
         for field in required:
-            if record.get(field) in (None, "", float("nan")):
+            if _is_missing(get(field)):
                 counts[field] += 1
     return counts
+
+
+def _is_missing(value: Any) -> bool:
+    # 单个取值的缺失判断：None、空字符串，或与自身不相等的浮点 NaN
+    if value is None:
+        return True
+    if isinstance(value, str):
+        return not value
+    return isinstance(value, (float, np.floating)) and value != value
+
+
+def _count_missing_column(column: Sequence[Any]) -> int:
+    # 统计单列缺失数：浮点列用 isnan，整数/布尔列不可能缺失，纯字符串列比较空串，其余回退逐元素判断
+    # 注意：混合列经 np.asarray 会被统一转换为字符串（NaN 变为 'nan'），字节串也不属于缺失，
+    # 因此字符串向量化比较仅用于源数据全部为 str 的列，其余情况按原始取值逐个判断，与行式路径保持一致
+    is_array = isinstance(column, np.ndarray)
+    try:
+        arr = np.asarray(column)
+    except ValueError:
+        arr = None
+    if arr is None or (not is_array and arr.ndim != 1):
+        # 嵌套取值（如列表单元格）会被展开为多维数组、不规则时甚至无法构成数组；
+        # 此时每个单元格本身才是一个取值，直接按原始取值逐个判断
+        return sum(1 for value in column if _is_missing(value))
+    kind = arr.dtype.kind
+    if kind == "f":
+        return int(np.count_nonzero(np.isnan(arr)))
+    if kind in "iub":
+        return 0
+    if kind == "U" and (is_array or all(type(value) is str for value in column)):
+        return int(np.count_nonzero(arr == ""))
+    values = arr.ravel() if is_array else column
+    return sum(1 for value in values if _is_missing(value))
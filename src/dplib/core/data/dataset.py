@@ -24,7 +24,8 @@ Limitations
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any,Callable,Dict,Iterable,Iterator,List,Mapping,MutableSequence,Optional,Sequence,Tuple,Union
+from itertools import islice
+from typing import Any,Callable,Dict,Iterable,Iterator,List,Mapping,Optional,Sequence,Tuple,Union
 
 
 DataRecord = Union[Mapping[str, Any], Sequence[Any]]
@@ -79,6 +80,35 @@ class DatasetMetadata:
         }
 
 
+class _SliceView(Sequence):
+    # 只读切片视图：以 (父序列, lo, hi) 表示父数据的一段连续区间，按需换算下标而不复制记录
+
+    __slots__ = ("_data", "_lo", "_hi")
+
+    def __init__(self, data: Sequence[DataRecord], lo: int, hi: int) -> None:
+        self._data = data
+        self._lo = lo
+        self._hi = hi
+
+    def __len__(self) -> int:
+        return self._hi - self._lo
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[DataRecord, List[DataRecord]]:
+        positions = range(self._lo, self._hi)[index]
+        if isinstance(positions, int):
+            return self._data[positions]
+        if positions.step == 1:
+            # 正向连续区间可直接对父序列切片（下标均非负，不会触发负索引语义）
+            return self._data[positions.start : positions.stop]
+        data = self._data
+        return [data[i] for i in positions]
+
+    def __iter__(self) -> Iterator[DataRecord]:
+        data = self._data
+        for i in range(self._lo, self._hi):
+            yield data[i]
+
+
 class Dataset:
     """In-memory dataset wrapper with convenience helpers.
 
@@ -103,7 +133,7 @@ class Dataset:
         self._metadata = metadata or DatasetMetadata()
         self._cache_enabled = cache                      # 是否将加载结果缓存在内存中
         self._loader = data if callable(data) else None  # 可调用视为惰性加载器
-        self._data: Optional[List[DataRecord]] = None
+        self._data: Optional[Sequence[DataRecord]] = None
         if not callable(data):
             self._data = list(data)                      # 立即物化为列表，保证可多次遍历
 
@@ -112,7 +142,7 @@ class Dataset:
         # 暴露元数据对象（调用方可自行读取/复制使用）
         return self._metadata
 
-    def _ensure_materialized(self) -> MutableSequence[DataRecord]:
+    def _ensure_materialized(self) -> Sequence[DataRecord]:
         # 确保数据已物化：若存在 loader 则调用；cache=True 时保存副本以复用
         if self._data is None:
             if not self._loader:
@@ -129,6 +159,12 @@ class Dataset:
 
     def __getitem__(self, index: Union[int, slice]) -> Union[DataRecord, List[DataRecord]]:
         # 索引访问：支持下标/切片访问
+        if self._data is None and not self._cache_enabled and type(index) is slice and self._loader:
+            # 未缓存的惰性数据源：非负起止、正步长的切片直接流式截取所需窗口，无需物化全部记录
+            start, stop = index.start or 0, index.stop
+            step = 1 if index.step is None else index.step
+            if type(start) is int and type(stop) is int and type(step) is int and start >= 0 and stop >= 0 and step > 0:
+                return list(islice(self._loader(), start, stop, step))
         data = self._ensure_materialized()
         return data[index]
 
@@ -147,14 +183,11 @@ class Dataset:
                 yield [record]
             return
 
-        batch: List[DataRecord] = []
-        for record in data:
-            batch.append(record)
-            if len(batch) == batch_size:
-                yield batch
-                batch = []
-        if batch and not drop_last:
-            yield batch  # 处理尾部非满批次
+        # 说明：数据已物化为序列，直接按步长切片产出批次（每批仍为独立新列表），省去逐条 append 与长度判断
+        size = len(data)
+        stop = size - size % batch_size if drop_last else size  # drop_last 时跳过尾部非满批次
+        for start in range(0, stop, batch_size):
+            yield data[start : start + batch_size]
 
     def map(self, fn: Callable[[DataRecord], DataRecord]) -> "Dataset":
         """Return a new dataset where `fn` has been applied to every record."""
@@ -180,7 +213,19 @@ class Dataset:
             raise DatasetError("fractions must sum to 1.0")
         data = self._ensure_materialized()
         split_idx = int(len(data) * fractions[0])
-        return Dataset(data[:split_idx], metadata=self.metadata), Dataset(data[split_idx:], metadata=self.metadata)
+        # 说明：两个分区以只读切片视图共享已物化的数据，不再各自复制一份记录列表
+        return (
+            Dataset._from_view(_SliceView(data, 0, split_idx), metadata=self.metadata),
+            Dataset._from_view(_SliceView(data, split_idx, len(data)), metadata=self.metadata),
+        )
+
+    @classmethod
+    def _from_view(cls, view: "_SliceView", *, metadata: DatasetMetadata) -> "Dataset":
+        # 先经 __init__ 以空数据完成常规初始化（新增的实例属性自动具备），再将只读切片视图设为已物化数据，
+        # 跳过对视图的 list() 复制；视图仅由 split 内部构造，公开构造函数始终复制调用方传入的数据
+        dataset = cls((), metadata=metadata)
+        dataset._data = view
+        return dataset
 
     @classmethod
     def from_records(cls, records: Iterable[Mapping[str, Any]], *, metadata: Optional[DatasetMetadata] = None) -> "Dataset":
@@ -200,8 +245,9 @@ class Dataset:
         lengths = {len(values) for values in arrays.values()}
         if len(lengths) != 1:
             raise DatasetError("all columns must have the same length")
-        size = lengths.pop()
-        records = [{key: arrays[key][idx] for key in arrays} for idx in range(size)]
+        # 说明：按行 zip 各列并与列名元组一次性组装字典，避免逐单元格查找 arrays[key] 并索引
+        keys = tuple(arrays)
+        records = [dict(zip(keys, row)) for row in zip(*(arrays[key] for key in keys))]
         return cls(records, metadata=metadata or DatasetMetadata(format="records"))
 
     def to_list(self) -> List[DataRecord]:
@@ -28,6 +28,8 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from typing import Any, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
 
+import numpy as np
+
 
 class DomainError(ValueError):
     """Error raised when a value violates a domain constraint.
@@ -111,6 +113,12 @@ class BaseDomain(ABC):
         """Return True when the provided value belongs to the domain."""
         # 成员关系判定：子类必须实现
 
+    def contains_array(self, values: Sequence[Any]) -> np.ndarray:
+        """Return a boolean membership mask for a batch of values."""
+        # 批量成员判定：默认逐元素调用 contains，子类可覆盖为向量化实现
+        contains = self.contains
+        return np.fromiter((contains(value) for value in values), dtype=bool, count=len(values))
+
     def clamp(self, value: Any) -> Any:
         """Clamp the value to the domain if supported; otherwise, raise."""
         # 默认实现：不支持自动裁剪，若不在域内则抛错（连续域会覆盖）
@@ -268,6 +276,23 @@ class ContinuousDomain(BaseDomain):
                     return False
         return True
 
+    def contains_array(self, values: Sequence[Any]) -> np.ndarray:
+        # 向量化成员判定：实数/整数/布尔批次整体转为 float64 后按边界比较；比较写成取反形式，与标量 contains 对 NaN 的判定保持一致；
+        # 其余批次（含 None、字符串、复数或混合对象）回退逐元素判定，保持与 float() 转换完全相同的语义
+        try:
+            raw = np.asarray(values)
+        except (TypeError, ValueError):
+            return super().contains_array(values)
+        if raw.ndim != 1 or raw.dtype.kind not in "fiub":
+            return super().contains_array(values)
+        numeric = raw.astype(np.float64, copy=False)
+        mask = np.ones(numeric.shape, dtype=bool)
+        if self.minimum is not None:
+            mask &= ~(numeric < self.minimum) if self.inclusive[0] else ~(numeric <= self.minimum)
+        if self.maximum is not None:
+            mask &= ~(numeric > self.maximum) if self.inclusive[1] else ~(numeric >= self.maximum)
+        return mask
+
     def clamp(self, value: Any) -> float:
         # 支持裁剪到边界范围内；返回浮点数
         numeric = float(value)
@@ -23,11 +23,19 @@ Limitations
 
 from __future__ import annotations
 
+import functools
 from dataclasses import dataclass
-from typing import Sequence
+from types import MappingProxyType
+from typing import Iterable, Mapping, Optional
+
+import numpy as np
 
 from .domain import ContinuousDomain
 
+# 受支持的度量名以模块级 frozenset 共享；调用方已使用小写规范名时直接命中，未命中才回退 lower() 归一化
+_RANGE_METRICS = frozenset({"sum", "count", "mean"})
+_LOCAL_METRICS = frozenset({"l1", "l2"})
+
 
 class SensitivityError(ValueError):
     # 表示在参数不合法或无法定义合理敏感度时使用的异常类型
@@ -55,9 +63,16 @@ def count_global_sensitivity(max_contribution: int = 1) -> float:
 def sum_global_sensitivity(domain: ContinuousDomain, *, max_contribution: int = 1) -> float:
     # 针对有界连续数值域上的求和查询计算全局敏感度与贡献上界成线性关系
     """Global sensitivity for sum queries over a bounded continuous domain."""
-    if domain.minimum is None or domain.maximum is None:
+    return _sum_sensitivity(domain.minimum, domain.maximum, max_contribution)
+
+
+# 说明：全局敏感度只取决于域边界与少量标量参数，配置扫描/按行分派时会反复以相同参数调用；
+# 以 (minimum, maximum, ...) 为键缓存结果，typed=True 保证 int/float 输入各自保持原返回类型
+@functools.lru_cache(maxsize=4096, typed=True)
+def _sum_sensitivity(minimum: Optional[float], maximum: Optional[float], max_contribution: int) -> float:
+    if minimum is None or maximum is None:
         raise SensitivityError("continuous domain must specify min/max for sum sensitivity")
-    span = domain.maximum - domain.minimum
+    span = maximum - minimum
     if span <= 0:
         raise SensitivityError("domain span must be positive for sum sensitivity")
     return span * max_contribution
@@ -66,9 +81,16 @@ def sum_global_sensitivity(domain: ContinuousDomain, *, max_contribution: int =
 def mean_global_sensitivity(domain: ContinuousDomain, *, sample_size: int, max_contribution: int = 1) -> float:
     # 将求和查询的全局敏感度按样本量缩放得到均值查询的全局敏感度上界
     """Global sensitivity bound for mean queries."""
+    return _mean_sensitivity(domain.minimum, domain.maximum, sample_size, max_contribution)
+
+
+@functools.lru_cache(maxsize=4096, typed=True)
+def _mean_sensitivity(
+    minimum: Optional[float], maximum: Optional[float], sample_size: int, max_contribution: int
+) -> float:
     if sample_size <= 0:
         raise SensitivityError("sample_size must be positive")
-    return sum_global_sensitivity(domain, max_contribution=max_contribution) / sample_size
+    return _sum_sensitivity(minimum, maximum, max_contribution) / sample_size
 
 
 def variance_global_sensitivity(
@@ -80,11 +102,18 @@ def variance_global_sensitivity(
 ) -> float:
     # 针对有界数值域上的方差查询给出全局敏感度上界并考虑 ddof 与贡献约束
     """Global sensitivity bound for variance queries over bounded domains."""
+    return _variance_sensitivity(domain.minimum, domain.maximum, sample_size, ddof, max_contribution)
+
+
+@functools.lru_cache(maxsize=4096, typed=True)
+def _variance_sensitivity(
+    minimum: Optional[float], maximum: Optional[float], sample_size: int, ddof: int, max_contribution: int
+) -> float:
     if sample_size <= ddof:
         raise SensitivityError("sample_size must exceed ddof")
-    if domain.minimum is None or domain.maximum is None:
+    if minimum is None or maximum is None:
         raise SensitivityError("continuous domain must specify min/max for variance sensitivity")
-    span = domain.maximum - domain.minimum
+    span = maximum - minimum
     if span <= 0:
         raise SensitivityError("domain span must be positive for variance sensitivity")
     denom = max(sample_size - ddof, 1)
@@ -101,6 +130,31 @@ def histogram_global_sensitivity(max_contribution: int = 1) -> float:
     return float(max_contribution)
 
 
+# 说明：count/sum/histogram 的闭式公式供高频调用方（cdp 的 SensitivityAnalyzer 与区间工厂）共用的快路径，
+# 合法输入下直接算出结果、省去参数校验与缓存查找；非法输入回退到上方公开函数以保持原有报错。
+# 开关与公式只在此处定义一次，测试可关闭开关与公开函数交叉校验
+_USE_FAST_SENSITIVITY = True
+
+
+def _fast_count_sensitivity(max_contribution: int) -> float:
+    if _USE_FAST_SENSITIVITY and max_contribution > 0:
+        return float(max_contribution)
+    return count_global_sensitivity(max_contribution=max_contribution)
+
+
+def _fast_sum_sensitivity(domain: ContinuousDomain, max_contribution: int) -> float:
+    minimum, maximum = domain.minimum, domain.maximum
+    if _USE_FAST_SENSITIVITY and minimum is not None and maximum is not None and maximum > minimum:
+        return (maximum - minimum) * max_contribution
+    return sum_global_sensitivity(domain, max_contribution=max_contribution)
+
+
+def _fast_histogram_sensitivity(max_contribution: int) -> float:
+    if _USE_FAST_SENSITIVITY and max_contribution > 0:
+        return float(max_contribution)
+    return histogram_global_sensitivity(max_contribution=max_contribution)
+
+
 def range_global_sensitivity(
     domain: ContinuousDomain,
     *,
@@ -110,21 +164,32 @@ def range_global_sensitivity(
 ) -> float:
     # 针对固定窗口长度的区间查询（sum/count/mean）计算全局敏感度
     """Global sensitivity for fixed-length range queries (sum/count/mean)."""
+    # count 指标不依赖域边界，保持与此前一致地允许 domain 为 None
+    if domain is None:
+        return _range_sensitivity(None, None, window, max_contribution, metric)
+    return _range_sensitivity(domain.minimum, domain.maximum, window, max_contribution, metric)
+
+
+@functools.lru_cache(maxsize=4096, typed=True)
+def _range_sensitivity(
+    minimum: Optional[float], maximum: Optional[float], window: int, max_contribution: int, metric: str
+) -> float:
     if window <= 0:
         raise SensitivityError("window must be positive")
     if max_contribution <= 0:
         raise SensitivityError("max_contribution must be positive")
 
-    metric = metric.lower()
-    if metric not in {"sum", "count", "mean"}:
-        raise SensitivityError("metric must be one of {'sum','count','mean'}")
+    if metric not in _RANGE_METRICS:
+        metric = metric.lower()
+        if metric not in _RANGE_METRICS:
+            raise SensitivityError("metric must be one of {'sum','count','mean'}")
 
     if metric == "count":
         return float(max_contribution)
 
-    if domain.minimum is None or domain.maximum is None:
+    if minimum is None or maximum is None:
         raise SensitivityError("continuous domain must specify min/max for range sensitivity")
-    span = domain.maximum - domain.minimum
+    span = maximum - minimum
     if span <= 0:
         raise SensitivityError("domain span must be positive for range sensitivity")
 
@@ -135,20 +200,40 @@ def range_global_sensitivity(
     return float(sum_sensitivity / window)
 
 
-def local_sensitivity(values: Sequence[float], *, metric: str = "l1") -> float:
+def _as_float_array(values: Iterable[float]) -> np.ndarray:
+    # 将样本统一转换为 float64 连续缓冲区：ndarray 与序列直接转换，其余可迭代对象经 fromiter 逐个读取，
+    # 避免先物化为 Python list 再逐元素装箱
+    if isinstance(values, np.ndarray):
+        return values.astype(np.float64, copy=False).ravel()
+    if hasattr(values, "__len__"):
+        return np.asarray(values, dtype=np.float64).ravel()
+    return np.fromiter(values, dtype=np.float64)
+
+
+def _sorted_float_array(values: Iterable[float]) -> np.ndarray:
+    # 返回升序排列的 float64 样本：转换过程中已新建缓冲区时原地排序，省去 np.sort 的额外拷贝；
+    # 仅当缓冲区与调用方数组共享内存时才复制，保证不改动调用方数据
+    arr = _as_float_array(values)
+    if isinstance(values, np.ndarray) and np.may_share_memory(arr, values):
+        return np.sort(arr)
+    arr.sort()
+    return arr
+
+
+def local_sensitivity(values: Iterable[float], *, metric: str = "l1") -> float:
     # 通过排序样本并考察相邻差值来估计局部敏感度支持 L1/L2 等度量
     """Compute local sensitivity by inspecting neighbouring datasets."""
-    if not values:
+    arr = _sorted_float_array(values)
+    if arr.size == 0:
         raise SensitivityError("values cannot be empty")
-    metric = metric.lower()
-    if metric not in {"l1", "l2"}:
-        raise SensitivityError("unsupported metric")
+    if metric not in _LOCAL_METRICS:
+        metric = metric.lower()
+        if metric not in _LOCAL_METRICS:
+            raise SensitivityError("unsupported metric")
     # 对样本排序，计算相邻差分的最大值作为 L1 情况的估计
-    sorted_vals = sorted(values)
-    diffs = [abs(sorted_vals[i] - sorted_vals[i - 1]) for i in range(1, len(sorted_vals))]
-    if not diffs:
+    if arr.size == 1:
         return 0.0
-    max_diff = max(diffs)
+    max_diff = float(np.diff(arr).max())
     if metric == "l1":
         return max_diff
     # 若 metric="l2"，则返回相同的结果（标量输出时 L2 敏感度与 L1 相同）
@@ -174,7 +259,7 @@ class SmoothSensitivityEstimate:
     estimate: float
 
 
-def smooth_sensitivity_mean(values: Sequence[float], *, beta: float) -> SmoothSensitivityEstimate:
+def smooth_sensitivity_mean(values: Iterable[float], *, beta: float) -> SmoothSensitivityEstimate:
     """
     Simple smooth sensitivity estimator for mean queries based on Nissim et al.
 
@@ -187,14 +272,32 @@ def smooth_sensitivity_mean(values: Sequence[float], *, beta: float) -> SmoothSe
     # - 取所有 k 的最大加权影响，最后除以 n 得到均值的平滑敏感度估计
     if beta <= 0:
         raise SensitivityError("beta must be positive")
-    if not values:
+    # 说明：数值型 ndarray（含 float32/整数/非连续视图）直接在原缓冲区上求极值，免去 float64 转换拷贝；
+    # 极值先逐个转为 Python float 再相减，与先整体转换为 float64 的结果一致
+    if isinstance(values, np.ndarray) and values.dtype.kind in "fiub":
+        arr = values
+    else:
+        arr = _as_float_array(values)
+    n = arr.size
+    if n == 0:
         raise SensitivityError("values cannot be empty")
-    sorted_vals = sorted(float(v) for v in values)
-    n = len(sorted_vals)
-    max_smooth = 0.0
-    for k in range(n):
-        left = sorted_vals[k]
-        right = sorted_vals[-k - 1]
-        contribution = (right - left) * pow(2.0, -beta * k)
-        max_smooth = max(max_smooth, contribution)
+    # NaN 会使极差退化为 0，下游据此将不加噪声，因此直接拒绝
+    if arr.dtype.kind == "f" and np.isnan(arr).any():
+        raise SensitivityError("values must not contain NaN")
+    # 第 k 项为 (x_{n-1-k} - x_k) * 2^{-βk}（x 为升序样本）：差值随 k 单调不增、衰减权重单调递减，
+    # 故各项单调不增，最大值恒为 k=0 项 x_max - x_min（浮点舍入同样保持该序）；
+    # 直接取极差即可，无需排序或逐 k 扫描，对不含 NaN 的输入结果与完整扫描逐位一致（下界为 0）
+    max_smooth = max(0.0, float(arr.max()) - float(arr.min()))
     return SmoothSensitivityEstimate(beta=beta, estimate=max_smooth / n)
+
+
+# 为常见查询类型提供名称到底层敏感度实现函数名的映射；以只读视图对外共享，作为唯一数据源
+_PRESETS = {
+    "count": "count_global_sensitivity",
+    "sum": "sum_global_sensitivity",
+    "mean": "mean_global_sensitivity",
+    "variance": "variance_global_sensitivity",
+    "histogram": "histogram_global_sensitivity",
+    "range": "range_global_sensitivity",
+}
+PRESETS: Mapping[str, str] = MappingProxyType(_PRESETS)
@@ -21,8 +21,9 @@ Limitations
 
 from __future__ import annotations
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional, Tuple, Type
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Type
 import json
+import math
 import numbers
 import numpy as np
 
@@ -121,6 +122,11 @@ class BaseMechanism(ABC):
       - Subclasses implement calibration and randomization logic.
     """
 
+    # 参与批量列式序列化的数值字段；为空表示该机制不支持 serialize_batch
+    _BATCH_FIELDS: Tuple[str, ...] = ()
+    # 可跳过 _coerce_numeric 直接走标量快路径的 Python/NumPy 数值标量类型
+    _SCALAR_TYPES: Tuple[type, ...] = (int, float, np.integer, np.floating)
+
     def __init__(
         self,
         epsilon: float,
@@ -139,6 +145,10 @@ class BaseMechanism(ABC):
         self._rng: np.random.Generator = _make_rng(rng)
         self._calibrated: bool = False
         self._meta: Dict[str, Any] = {}
+        # 可复用的噪声缓冲区：批量加噪时按最近一次请求的形状/类型缓存，避免重复分配
+        self._noise_buf: Optional[np.ndarray] = None
+        # 最近一次校准所用输入的签名；输入未变化时子类可跳过重复的派生参数计算
+        self._last_calib_sig: Optional[Tuple[Any, ...]] = None
 
     # ------------------------------------------------------ Validation helpers
     # 基础参数校验：确保为 Real 且满足正性/非负性约束
@@ -196,6 +206,16 @@ class BaseMechanism(ABC):
     def randomise(self, value: Any) -> Any:
         """Add mechanism specific noise to the provided value according to the calibrated parameters."""
 
+    # 线程安全的加噪入口：默认直接委托给 randomise；复用噪声缓冲区的机制需覆盖为每次新分配
+    def randomise_fresh(self, value: Any) -> Any:
+        """Thread-safe variant of `randomise` that never reuses a cached noise buffer."""
+        return self.randomise(value)
+
+    # 批量加噪入口：默认逐个调用 randomise；可一次性采样拼接噪声的机制可覆盖以摊薄调度开销
+    def randomise_batch(self, arrays: Sequence[Any]) -> List[Any]:
+        """Add noise to each array in `arrays`, returning results in the same order."""
+        return [self.randomise(arr) for arr in arrays]
+
     # 语义别名，便于更自然的 API 使用
     def add_noise(self, value: Any) -> Any:
         """Alias for randomise to provide a more descriptive API name."""
@@ -240,6 +260,54 @@ class BaseMechanism(ABC):
         instance._calibrated = bool(data.get("calibrated", False))
         return instance
 
+    @classmethod
+    def serialize_batch(cls: Type["BaseMechanism"], mechanisms: Sequence["BaseMechanism"]) -> Dict[str, np.ndarray]:
+        """
+        Pack many mechanisms of this class into column arrays (structure-of-arrays).
+
+        - Args:
+            - mechanisms: Instances of `cls` to persist together.
+        - Returns:
+            - Mapping of field name to a 1-D array; suitable for `np.savez(path, **batch)`.
+        - Notes:
+            - Numeric fields listed in `_BATCH_FIELDS` become float64 columns (None -> NaN).
+            - Free-form `meta` entries are not packed.
+        """
+        if not cls._BATCH_FIELDS:
+            raise ValidationError(f"{cls.__name__} does not support batch serialization")
+        for mech in mechanisms:
+            if type(mech) is not cls:
+                raise ValidationError(f"serialize_batch expects {cls.__name__} instances only")
+        # 按字段逐列打包为连续的 float64 数组，避免为每个机制构造独立字典
+        batch: Dict[str, np.ndarray] = {
+            field: np.asarray([getattr(mech, field) for mech in mechanisms], dtype=np.float64)
+            for field in cls._BATCH_FIELDS
+        }
+        batch["calibrated"] = np.asarray([mech._calibrated for mech in mechanisms], dtype=bool)
+        batch["name"] = np.asarray([mech.name for mech in mechanisms], dtype=str)
+        return batch
+
+    @classmethod
+    def deserialize_batch(cls: Type["BaseMechanism"], batch: Any) -> List["BaseMechanism"]:
+        """
+        Rebuild mechanisms from columns produced by `serialize_batch` (or loaded via `np.load`).
+        """
+        if not cls._BATCH_FIELDS:
+            raise ValidationError(f"{cls.__name__} does not support batch serialization")
+        # 逐列读取后按行切片重建实例；NaN 还原为 None 表示尚未校准的参数
+        columns = {field: np.asarray(batch[field], dtype=np.float64).tolist() for field in cls._BATCH_FIELDS}
+        calibrated = np.asarray(batch["calibrated"], dtype=bool).tolist()
+        names = np.asarray(batch["name"]).tolist() if "name" in batch else [None] * len(calibrated)
+        restored: List["BaseMechanism"] = []
+        for idx, flag in enumerate(calibrated):
+            row: Dict[str, Any] = {
+                field: (None if math.isnan(values[idx]) else values[idx]) for field, values in columns.items()
+            }
+            row["calibrated"] = flag
+            row["name"] = names[idx]
+            restored.append(cls.deserialize(row))
+        return restored
+
     def to_json(self) -> str:
         """Serialize to a JSON string using the built-in snapshot representation."""
         return json.dumps(self.serialize(), default=str)
@@ -283,6 +351,15 @@ class BaseMechanism(ABC):
         # 跟踪原始输入是否为标量，以便在后续恢复结果时能准确还原其类型
         return arr, arr.ndim == 0
 
+    # 返回与目标形状/类型一致的缓存噪声缓冲区；形状或 dtype 变化时重新分配
+    # 注意：缓冲区按实例共享，依赖它的 randomise 在多线程并发调用下不安全
+    def _noise_buffer(self, shape: Tuple[int, ...], dtype: Any = np.float64) -> np.ndarray:
+        buf = self._noise_buf
+        if buf is None or buf.shape != shape or buf.dtype != dtype:
+            buf = np.empty(shape, dtype=dtype)
+            self._noise_buf = buf
+        return buf
+
     # 按原输入类型“还原”数值结果：标量/ndarray/tuple/list
     @staticmethod
     def _restore_numeric_like(original: Any, value: np.ndarray, was_scalar: bool) -> Any:
@@ -296,6 +373,29 @@ class BaseMechanism(ABC):
             return value.tolist()
         return value
 
+    @classmethod
+    def _integer_preserving_restore(cls, original: Any, value: np.ndarray, was_scalar: bool) -> Any:
+        # 在恢复输出类型时尽量保持原始整数 dtype（数组/列表/元组/标量），避免因噪声导致类型退化
+        """Restore output type while preserving integer dtype when possible."""
+        original_dtype = None
+        if not isinstance(original, (str, bytes)):
+            try:
+                original_dtype = np.asarray(original).dtype
+            except Exception:  # pragma: no cover - defensive
+                original_dtype = None
+
+        restored = cls._restore_numeric_like(original, value, was_scalar)
+        if original_dtype is not None and np.issubdtype(original_dtype, np.integer):
+            if isinstance(restored, np.ndarray):
+                return np.rint(restored).astype(original_dtype)
+            if isinstance(restored, list):
+                return [int(round(x)) for x in restored]
+            if isinstance(restored, tuple):
+                return tuple(int(round(x)) for x in restored)
+            if isinstance(restored, float):
+                return int(round(restored))
+        return restored
+
     # ---------------------------------------------------------- Representation
     # 便于调试与日志的简洁 __repr__，包含名称、(ε,δ) 与校准状态
     def __repr__(self) -> str:
@@ -0,0 +1,24 @@
+"""
+Python version compatibility helpers shared across the library.
+
+Responsibilities
+  - Centralize feature switches that depend on the running Python version.
+
+Usage Context
+  - Imported by modules that declare dataclasses and want ``__slots__`` where
+    the interpreter supports it.
+
+Limitations
+  - Only covers the version gates currently used by the library.
+"""
+# 说明：集中存放依赖 Python 版本的兼容开关，避免各模块各自复制同一判断。
+# 职责：
+# - DATACLASS_SLOTS：Python 3.10+ 下为数据类启用 __slots__，旧版本保持普通数据类
+
+from __future__ import annotations
+
+import sys
+from typing import Any, Dict
+
+# 以 `@dataclass(**DATACLASS_SLOTS)` 使用：3.10+ 去掉每实例 __dict__，旧版本展开为空参数
+DATACLASS_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
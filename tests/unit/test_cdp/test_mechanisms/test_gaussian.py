@@ -92,3 +92,51 @@ def test_serialize_roundtrip(gaussian: GaussianMechanism) -> None:
     assert restored.delta == gaussian.delta
     assert restored.sigma == gaussian.sigma
     assert restored._meta == gaussian._meta
+
+
+def test_randomise_reuses_noise_buffer_without_aliasing_results() -> None:
+    # 缓冲区复用：同形状的连续调用复用同一噪声缓冲区，但返回结果不能与缓冲区共享内存
+    mech = GaussianMechanism(epsilon=1.0, delta=1e-5, rng=0)
+    mech.calibrate()
+    values = np.zeros(8)
+    first = mech.randomise(values)
+    buf = mech._noise_buf  # noqa: SLF001
+    second = mech.randomise(values)
+    assert mech._noise_buf is buf  # noqa: SLF001
+    assert not np.shares_memory(first, buf)
+    assert not np.array_equal(first, second)
+
+
+def test_randomise_fresh_matches_randomise_stream() -> None:
+    # 线程安全变体与缓冲区版本在相同种子下应产生相同的噪声序列
+    buffered = GaussianMechanism(epsilon=1.0, delta=1e-5, rng=7)
+    fresh = GaussianMechanism(epsilon=1.0, delta=1e-5, rng=7)
+    buffered.calibrate()
+    fresh.calibrate()
+    values = np.arange(5, dtype=float)
+    np.testing.assert_array_equal(buffered.randomise(values), fresh.randomise_fresh(values))
+    assert fresh._noise_buf is None  # noqa: SLF001
+
+
+def test_randomise_preserves_float32_arrays() -> None:
+    # float32 输入直接采样 float32 噪声，输出保持单精度；其他数值输入仍提升为 float64
+    mech = GaussianMechanism(epsilon=1.0, delta=1e-5, rng=0)
+    mech.calibrate()
+    noisy32 = mech.randomise(np.zeros(16, dtype=np.float32))
+    assert noisy32.dtype == np.float32
+    assert np.all(np.isfinite(noisy32))
+    assert mech.randomise(np.zeros(4, dtype=np.int64)).dtype == np.float64
+
+
+def test_recalibration_tracks_changed_inputs() -> None:
+    # 相同输入重复校准应保持 sigma 不变；修改 ε 或 δ 后应重新计算 sigma
+    mech = GaussianMechanism(epsilon=1.0, delta=1e-5, sensitivity=1.0)
+    mech.calibrate()
+    sigma = mech.sigma
+    mech.calibrate(sensitivity=1.0, delta=1e-5)
+    assert mech.sigma == sigma
+    mech.epsilon = 2.0
+    mech.calibrate()
+    assert mech.sigma == pytest.approx(sigma / 2.0)
+    mech.calibrate(delta=1e-3)
+    assert mech.sigma < sigma / 2.0
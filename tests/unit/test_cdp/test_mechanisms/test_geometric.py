@@ -70,3 +70,14 @@ def test_serialize_roundtrip(geometric: GeometricMechanism) -> None:
     assert restored.sensitivity == geometric.sensitivity
     assert restored.decay == geometric.decay
     assert restored.success_prob == geometric.success_prob
+
+
+def test_scalar_fast_path_matches_reference_draws(geometric: GeometricMechanism) -> None:
+    # 标量快路径应与“几何幅度 + 随机符号”的参考采样序列逐一吻合
+    geometric.calibrate()
+    geometric.reseed(42)
+    reference = np.random.default_rng(42)
+    for _ in range(20):
+        magnitude = int(reference.geometric(geometric.success_prob)) - 1
+        sign = 1 if reference.integers(0, 2) else -1
+        assert geometric.randomise(10) == 10 + sign * magnitude
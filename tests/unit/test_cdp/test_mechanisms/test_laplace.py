@@ -85,3 +85,50 @@ def test_serialize_roundtrip(laplace: LaplaceMechanism) -> None:
     assert restored.sensitivity == laplace.sensitivity
     assert restored.scale == laplace.scale
     assert restored._meta == laplace._meta
+
+
+def test_serialize_batch_roundtrip_via_npz(tmp_path) -> None:
+    # 批量列式序列化：经 np.savez 落盘再读回，逐个机制的参数应保持一致
+    mechs = [LaplaceMechanism(epsilon=eps, sensitivity=2.0) for eps in (0.5, 1.0, 2.0)]
+    for mech in mechs[:2]:
+        mech.calibrate()
+    batch = LaplaceMechanism.serialize_batch(mechs)
+    assert batch["epsilon"].dtype == np.float64
+    path = tmp_path / "laplace_batch.npz"
+    np.savez(path, **batch)
+    with np.load(path) as loaded:
+        restored = LaplaceMechanism.deserialize_batch(loaded)
+    assert [m.epsilon for m in restored] == [m.epsilon for m in mechs]
+    assert [m.scale for m in restored] == [m.scale for m in mechs]
+    assert [m.calibrated for m in restored] == [True, True, False]
+
+
+def test_serialize_batch_rejects_mixed_classes(laplace: LaplaceMechanism) -> None:
+    # 批量序列化只接受同一机制类的实例
+    from dplib.cdp.mechanisms.gaussian import GaussianMechanism
+
+    with pytest.raises(ValidationError):
+        LaplaceMechanism.serialize_batch([laplace, GaussianMechanism()])
+
+
+@pytest.mark.parametrize("size", [10_000, 200_000])
+def test_array_noise_matches_laplace_moments(size: int) -> None:
+    # 指数差（小数组）与逆 CDF（大数组）两种采样路径都应满足拉普拉斯分布的矩：均值 0，方差 2·scale²
+    mech = LaplaceMechanism(epsilon=0.5, sensitivity=1.0, rng=11)
+    mech.calibrate()
+    noise = mech.randomise(np.zeros(size))
+    assert np.all(np.isfinite(noise))
+    assert abs(float(noise.mean())) < 0.1
+    assert float(noise.var()) == pytest.approx(2.0 * mech.scale**2, rel=0.1)
+
+
+def test_randomise_array_fast_path_matches_generic_path() -> None:
+    # ndarray 快路径与通用路径（列表输入）在相同种子下应得到相同结果
+    fast = LaplaceMechanism(epsilon=1.0, rng=5)
+    generic = LaplaceMechanism(epsilon=1.0, rng=5)
+    fast.calibrate()
+    generic.calibrate()
+    values = np.linspace(-1.0, 1.0, 6)
+    np.testing.assert_array_equal(fast.randomise(values), np.asarray(generic.randomise(values.tolist())))
+    with pytest.raises(NotCalibratedError):
+        LaplaceMechanism().randomise_array(values)
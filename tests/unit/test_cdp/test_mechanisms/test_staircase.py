@@ -63,3 +63,108 @@ def test_serialize_roundtrip(staircase: StaircaseMechanism) -> None:
     assert restored.gamma == staircase.gamma
     assert restored.decay == staircase.decay
     assert restored.success_prob == staircase.success_prob
+
+
+def test_noise_follows_staircase_structure() -> None:
+    # 噪声结构：|噪声|/Δ = 几何步长 + {0, γ} 偏移；符号各半、偏移概率≈γ、步长均值≈decay/(1-decay)
+    mech = StaircaseMechanism(epsilon=1.0, sensitivity=2.0, gamma=0.3, rng=3)
+    mech.calibrate()
+    noise = mech._sample_noise((100_000,)) / mech.sensitivity  # noqa: SLF001 - 直接取噪声以保留 -0.0 的符号
+    magnitude = np.abs(noise)
+    offset = magnitude - np.floor(magnitude)
+    assert np.all(np.isclose(offset, 0.0) | np.isclose(offset, mech.gamma))
+    assert float(np.mean(np.signbit(noise))) == pytest.approx(0.5, abs=0.01)
+    assert float(np.mean(np.isclose(offset, mech.gamma))) == pytest.approx(mech.gamma, abs=0.01)
+    expected_steps = mech.decay / (1.0 - mech.decay)
+    assert float(np.floor(magnitude).mean()) == pytest.approx(expected_steps, rel=0.03)
+
+
+def test_deserialized_mechanism_can_randomise(staircase: StaircaseMechanism) -> None:
+    # 反序列化后的已校准机制应恢复采样所需的缓存速率，可直接加噪
+    staircase.calibrate()
+    restored = StaircaseMechanism.deserialize(staircase.serialize())
+    assert isinstance(restored.randomise(1.0), float)
+
+
+def test_numba_kernel_matches_numpy_path() -> None:
+    # 显式开启的 numba 融合内核与默认 NumPy 路径消费相同随机样本，结果应逐元素一致（numba 缺失时跳过）
+    from dplib.cdp.mechanisms import staircase as staircase_module
+
+    if staircase_module._staircase_noise_numba is None:  # noqa: SLF001
+        pytest.skip("numba unavailable")
+    jitted = StaircaseMechanism(epsilon=0.7, sensitivity=2.0, gamma=0.4, rng=9, use_numba=True)
+    plain = StaircaseMechanism(epsilon=0.7, sensitivity=2.0, gamma=0.4, rng=9)
+    assert jitted.use_numba and not plain.use_numba
+    assert staircase_module._NUMBA_WARMED_UP  # noqa: SLF001
+    jitted.calibrate()
+    plain.calibrate()
+    size = (staircase_module._NUMBA_MIN_SIZE,)  # noqa: SLF001
+    expected_jit = jitted._sample_noise(size)  # noqa: SLF001
+    expected_plain = plain._sample_noise(size)  # noqa: SLF001
+    np.testing.assert_allclose(np.abs(expected_jit), np.abs(expected_plain))
+    np.testing.assert_array_equal(np.signbit(expected_jit), np.signbit(expected_plain))
+
+
+def test_numba_kernel_matches_numpy_distribution() -> None:
+    # 不同种子下两条路径的经验分布应一致：比较若干分位点处的经验 CDF 与偏移比例（numba 缺失时跳过）
+    from dplib.cdp.mechanisms import staircase as staircase_module
+
+    if staircase_module._staircase_noise_numba is None:  # noqa: SLF001
+        pytest.skip("numba unavailable")
+    jitted = StaircaseMechanism(epsilon=0.8, sensitivity=1.0, gamma=0.3, rng=1, use_numba=True)
+    plain = StaircaseMechanism(epsilon=0.8, sensitivity=1.0, gamma=0.3, rng=2)
+    jitted.calibrate()
+    plain.calibrate()
+    jit_noise = jitted.randomise(np.zeros(200_000))
+    plain_noise = plain.randomise(np.zeros(200_000))
+    for point in (-3.0, -1.0, -0.2, 0.0, 0.2, 1.0, 3.0):
+        assert np.mean(jit_noise <= point) == pytest.approx(np.mean(plain_noise <= point), abs=0.01)
+    offset_share = [np.mean(np.abs(noise) % 1.0 > 0) for noise in (jit_noise, plain_noise)]
+    assert offset_share[0] == pytest.approx(offset_share[1], abs=0.01)
+
+
+def test_numba_kernel_is_opt_in_and_round_trips() -> None:
+    # 默认不启用 numba 内核；开启标记随序列化保留
+    assert not StaircaseMechanism().use_numba
+    mech = StaircaseMechanism(use_numba=True)
+    assert StaircaseMechanism.deserialize(mech.serialize()).use_numba == mech.use_numba
+
+
+def test_stream_block_serves_scalars_from_buffer() -> None:
+    # 开启 stream_block 后，逐个标量加噪应依次消费整块预抽取的噪声，重置种子后缓冲区重建
+    streamed = StaircaseMechanism(epsilon=1.0, sensitivity=1.0, gamma=0.3, rng=11, stream_block=8)
+    streamed.calibrate()
+    reference = StaircaseMechanism(epsilon=1.0, sensitivity=1.0, gamma=0.3, rng=11)
+    reference.calibrate()
+    expected = reference._sample_noise((8,))
+    values = [streamed.randomise(0.0) for _ in range(8)]
+    np.testing.assert_allclose(values, expected)
+    streamed.reseed(11)
+    assert streamed.randomise(0.0) == pytest.approx(expected[0])
+    with pytest.raises(ValidationError):
+        StaircaseMechanism(stream_block=0)
+
+
+def test_scalar_fast_path_matches_array_draw() -> None:
+    # 标量快路径与 0 维数组输入应得到相同的噪声结果
+    fast = StaircaseMechanism(epsilon=1.0, sensitivity=1.0, gamma=0.4, rng=9)
+    slow = StaircaseMechanism(epsilon=1.0, sensitivity=1.0, gamma=0.4, rng=9)
+    fast.calibrate()
+    slow.calibrate()
+    values = [fast.randomise(v) for v in (0, 1.5, np.int32(2))]
+    expected = [slow.randomise(np.asarray(v, dtype=float)) for v in (0, 1.5, 2)]
+    assert all(type(v) is float for v in values)
+    assert values == pytest.approx(expected)
+
+
+def test_randomise_batch_uses_single_draw(staircase: StaircaseMechanism) -> None:
+    # 批量加噪：各结果保持原形状，且与一次性采样拼接数组的噪声一致
+    staircase.calibrate()
+    staircase.reseed(21)
+    arrays = [np.zeros((2, 3)), np.ones(4), np.zeros(0)]
+    results = staircase.randomise_batch(arrays)
+    assert [r.shape for r in results] == [(2, 3), (4,), (0,)]
+    staircase.reseed(21)
+    flat = staircase._sample_noise((10,))
+    np.testing.assert_allclose(np.concatenate([r.ravel() for r in results]), flat + np.r_[np.zeros(6), np.ones(4)])
+    assert staircase.randomise_batch([]) == []
@@ -76,3 +76,108 @@ def test_serialize_roundtrip(gaussian_vector: VectorMechanism) -> None:
     assert restored.distribution == gaussian_vector.distribution
     assert restored.norm == gaussian_vector.norm
     assert restored.sensitivity == gaussian_vector.sensitivity
+
+
+@pytest.mark.parametrize("kind", ["laplace", "gaussian"])
+def test_parallel_sample_is_deterministic_and_advances_rng(kind: str) -> None:
+    # 分片并行采样：相同种子与分片数得到相同结果（与线程数无关），父 RNG 被推进到子流之后
+    from dplib.cdp.mechanisms.vector import _parallel_sample
+
+    rng_a = np.random.default_rng(7)
+    rng_b = np.random.default_rng(7)
+    first = _parallel_sample(rng_a, kind, 2.0, (300, 100), 4, 4)
+    second = _parallel_sample(rng_b, kind, 2.0, (300, 100), 4, 1)
+    assert first.shape == (300, 100)
+    np.testing.assert_array_equal(first, second)
+    assert rng_a.random() == rng_b.random()
+    assert np.std(first) == pytest.approx(2.0 * (math.sqrt(2.0) if kind == "laplace" else 1.0), rel=0.05)
+    # 已用子流不会在父 RNG 的后续输出中重复
+    follow_up = _parallel_sample(rng_a, kind, 2.0, (300, 100), 4, 4)
+    assert not np.array_equal(first, follow_up)
+
+
+def test_large_randomise_does_not_depend_on_cpu_count(monkeypatch: pytest.MonkeyPatch) -> None:
+    # 大数组分片数只由元素个数决定：同一种子在不同 CPU 数下输出完全一致
+    from dplib.cdp.mechanisms import vector as vector_module
+
+    outputs = []
+    for cpus in (1, 2, 4):
+        monkeypatch.setattr(vector_module.os, "cpu_count", lambda cpus=cpus: cpus)
+        mech = VectorMechanism(epsilon=1.0, sensitivity=1.0, rng=np.random.default_rng(7))
+        mech.calibrate()
+        outputs.append(mech.randomise(np.zeros(2**20)))
+    np.testing.assert_array_equal(outputs[0], outputs[1])
+    np.testing.assert_array_equal(outputs[0], outputs[2])
+
+
+@pytest.mark.parametrize(
+    "dtype, expected",
+    [("float32", np.float32), ("float16", np.float16), ("bfloat16", np.float32)],
+)
+def test_reduced_precision_output(dtype: str, expected: type) -> None:
+    # 低精度模式：输出 dtype 符合配置，输入数组保持不变，bfloat16 结果低 16 位为零
+    mech = VectorMechanism(epsilon=1.0, delta=1e-5, sensitivity=1.0, dtype=dtype, rng=3)
+    mech.calibrate()
+    data = np.linspace(-1.0, 1.0, 1000, dtype=np.float32)
+    original = data.copy()
+    noisy = mech.randomise(data)
+    assert noisy.dtype == expected
+    assert noisy.shape == data.shape
+    np.testing.assert_array_equal(data, original)
+    assert np.std(noisy.astype(np.float64) - original) == pytest.approx(mech.sigma, rel=0.15)
+    if dtype == "bfloat16":
+        assert not np.any(noisy.view(np.uint32) & np.uint32(0xFFFF))
+    restored = VectorMechanism.deserialize(mech.serialize())
+    assert restored.dtype == dtype
+    assert restored._scale32 == np.float32(mech.sigma)
+
+
+def test_invalid_dtype_rejected() -> None:
+    # 不支持的精度配置应在构造时抛出 ValidationError
+    from dplib.core.privacy.base_mechanism import ValidationError
+
+    with pytest.raises(ValidationError):
+        VectorMechanism(dtype="int8")
+
+
+@pytest.mark.parametrize("distribution", ["laplace", "gaussian"])
+def test_scalar_fast_path_matches_array_draw(distribution: str) -> None:
+    # 标量快路径应与 0 维数组输入消费相同的随机数并返回 Python float
+    fast = VectorMechanism(epsilon=1.0, delta=1e-5, distribution=distribution, rng=5)
+    slow = VectorMechanism(epsilon=1.0, delta=1e-5, distribution=distribution, rng=5)
+    fast.calibrate()
+    slow.calibrate()
+    values = [fast.randomise(v) for v in (1, 2.5, np.float32(3.0), np.int64(4))]
+    expected = [slow.randomise(np.asarray(v, dtype=float)) for v in (1, 2.5, 3.0, 4)]
+    assert all(type(v) is float for v in values)
+    assert values == pytest.approx(expected)
+
+
+def test_discrete_laplace_keeps_integer_semantics() -> None:
+    # 离散 Laplace：整数 ndarray 保持 dtype，列表/标量输出整数，方差符合 2·decay/(1-decay)^2
+    mech = VectorMechanism(epsilon=1.0, sensitivity=1.0, distribution="discrete_laplace", rng=2)
+    mech.calibrate()
+    assert mech.decay == pytest.approx(math.exp(-1.0))
+    counts = np.zeros(200_000, dtype=np.int32)
+    noisy = mech.randomise(counts)
+    assert noisy.dtype == np.int32
+    assert np.all(counts == 0)
+    expected_var = 2.0 * mech.decay / (1.0 - mech.decay) ** 2
+    assert np.var(noisy) == pytest.approx(expected_var, rel=0.05)
+    assert all(isinstance(v, int) for v in mech.randomise([1, 2, 3]))
+    assert isinstance(mech.randomise(5), int)
+    assert isinstance(mech.randomise(5.5), float)
+    restored = VectorMechanism.deserialize(mech.serialize())
+    assert restored.success_prob == pytest.approx(mech.success_prob)
+    assert restored.randomise(np.arange(4)).dtype == np.arange(4).dtype
+
+
+def test_randomise_batch_matches_concatenated_draw(laplace_vector: VectorMechanism) -> None:
+    # 批量加噪：结果与对拼接数组一次加噪一致，并还原各自形状
+    laplace_vector.calibrate()
+    laplace_vector.reseed(4)
+    results = laplace_vector.randomise_batch([np.zeros((2, 2)), [1.0, 2.0]])
+    laplace_vector.reseed(4)
+    expected = laplace_vector.randomise(np.array([0.0, 0.0, 0.0, 0.0, 1.0, 2.0]))
+    assert results[0].shape == (2, 2)
+    np.testing.assert_allclose(np.concatenate([r.ravel() for r in results]), expected)
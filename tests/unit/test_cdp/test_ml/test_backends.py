@@ -6,6 +6,7 @@ Unit tests for CDP ML backend registry helpers.
 # - 后端探测接口返回的注册项
 # - get_backend 的未知名称校验
 # - 缺失依赖时抛出 BackendNotAvailable
+# - 探测结果缓存与返回副本的隔离性
 
 from __future__ import annotations
 
@@ -43,8 +44,13 @@ def test_get_backend_missing_dependency_raises(monkeypatch: pytest.MonkeyPatch)
         return original_find_spec(name)
 
     monkeypatch.setattr(backend_registry.importlib.util, "find_spec", fake_find_spec)
-    with pytest.raises(BackendNotAvailable):
-        get_backend("sklearn")
+    # 探测结果带进程级缓存，替换 find_spec 前后都需清空
+    detect_available_backends.cache_clear()
+    try:
+        with pytest.raises(BackendNotAvailable):
+            get_backend("sklearn")
+    finally:
+        detect_available_backends.cache_clear()
 
 
 def test_get_backend_available_returns_spec() -> None:
@@ -55,3 +61,68 @@ def test_get_backend_available_returns_spec() -> None:
     backend = get_backend("sklearn")
     assert backend.name == "sklearn"
     assert backend.available is True
+
+
+def test_detect_available_backends_is_cached(monkeypatch: pytest.MonkeyPatch) -> None:
+    # 验证重复探测只扫描一次依赖，且返回的字典副本互不影响
+    import dplib.cdp.ml.backends.registry as backend_registry
+
+    calls = []
+    original_find_spec = backend_registry.importlib.util.find_spec
+
+    def counting_find_spec(name: str) -> object:
+        calls.append(name)
+        return original_find_spec(name)
+
+    monkeypatch.setattr(backend_registry.importlib.util, "find_spec", counting_find_spec)
+    detect_available_backends.cache_clear()
+    try:
+        first = detect_available_backends()
+        first.pop("sklearn")
+        second = detect_available_backends()
+        assert "sklearn" in second
+        assert len(calls) == 3
+    finally:
+        detect_available_backends.cache_clear()
+
+
+def test_backend_records_share_empty_metadata() -> None:
+    # 验证缺省元数据为共享只读映射，且在支持的 Python 版本上不再携带 __dict__
+    import sys
+
+    from dplib.cdp.ml.backends import BackendCapabilities, BackendSpec
+
+    first = BackendCapabilities()
+    second = BackendCapabilities()
+    assert first.metadata is second.metadata
+    assert dict(first.metadata) == {}
+    assert BackendCapabilities.from_dict(first.to_dict()) == first
+    if sys.version_info >= (3, 10):
+        assert not hasattr(first, "__dict__")
+        assert not hasattr(BackendSpec(name="x", module="x"), "__dict__")
+
+
+def test_backend_table_is_read_only_and_names_normalized() -> None:
+    # 验证内置后端表不可修改，且非规范写法的名称仍能解析到同一后端
+    import dplib.cdp.ml.backends.registry as backend_registry
+
+    with pytest.raises(TypeError):
+        backend_registry._BACKEND_SPECS["custom"] = backend_registry._BACKEND_SPECS["sklearn"]  # type: ignore[index]
+    if not detect_available_backends()["sklearn"].available:
+        pytest.skip("sklearn not available")
+    assert get_backend("  SKLearn ") == get_backend("sklearn")
+
+
+def test_backend_not_available_message_is_stable_and_picklable() -> None:
+    # 验证 args / repr 携带完整错误消息（含安装提示），且序列化后仍保留各字段
+    import pickle
+
+    error = BackendNotAvailable("torch", extras=["torch", "ml"])
+    expected = "backend 'torch' is not available. Install with `pip install dplib[torch,ml]`."
+    assert error.args == (expected,)
+    assert str(error) == expected
+    restored = pickle.loads(pickle.dumps(error))
+    assert str(restored) == str(error)
+    assert restored.backend == "torch"
+    assert restored.extras == "torch,ml"
+    assert str(BackendNotAvailable("x", message="custom")) == "custom"
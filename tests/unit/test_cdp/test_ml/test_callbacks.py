@@ -0,0 +1,152 @@
+"""
+Unit tests for sklearn-style callback runner helpers.
+"""
+# 说明：CallbackRunner 训练回调运行器的单元测试。
+# 覆盖：
+# - partial_fit 路径下回调事件顺序与可选参数透传
+# - 签名检查在 epoch 循环外只执行一次
+# - 缺少 partial_fit 时回退为单次 fit
+
+from __future__ import annotations
+
+from typing import Any, List, Mapping
+
+import pytest
+
+from dplib.cdp.ml.backends.sklearn import callbacks as callbacks_module
+from dplib.cdp.ml.backends.sklearn.callbacks import Callback, CallbackRunner
+
+
+class _PartialFitEstimator:
+    # 记录每次 partial_fit 收到的关键字参数
+    def __init__(self) -> None:
+        self.calls: List[Mapping[str, Any]] = []
+
+    def partial_fit(self, features: Any, labels: Any, classes: Any = None) -> "_PartialFitEstimator":
+        self.calls.append({"classes": classes})
+        return self
+
+    def fit(self, features: Any, labels: Any) -> "_PartialFitEstimator":
+        return self
+
+
+class _FitOnlyEstimator:
+    # 仅支持 fit 的估计器，用于验证回退路径
+    def __init__(self) -> None:
+        self.fit_calls = 0
+
+    def fit(self, features: Any, labels: Any, sample_weight: Any = None) -> "_FitOnlyEstimator":
+        self.fit_calls += 1
+        return self
+
+
+class _RecordingCallback(Callback):
+    # 记录回调事件名称与所处 epoch
+    def __init__(self) -> None:
+        self.events: List[str] = []
+
+    def on_train_start(self, context: Mapping[str, Any]) -> None:
+        self.events.append("train_start")
+
+    def on_epoch_start(self, context: Mapping[str, Any]) -> None:
+        self.events.append(f"epoch_start:{context['epoch']}")
+
+    def on_step_end(self, context: Mapping[str, Any]) -> None:
+        self.events.append(f"step_end:{context['step']}")
+
+    def on_epoch_end(self, context: Mapping[str, Any]) -> None:
+        self.events.append(f"epoch_end:{context['epoch']}")
+
+    def on_train_end(self, context: Mapping[str, Any]) -> None:
+        self.events.append(f"train_end:{context['epochs_run']}")
+
+
+def test_partial_fit_emits_events_and_passes_supported_args(monkeypatch: pytest.MonkeyPatch) -> None:
+    # 验证事件顺序、classes 透传、不支持的 sample_weight 被忽略，且签名检查不随 epoch 增长
+    checks: List[str] = []
+    original = callbacks_module._supports_argument
+
+    def counting_supports(func: Any, name: str) -> bool:
+        checks.append(name)
+        return original(func, name)
+
+    monkeypatch.setattr(callbacks_module, "_supports_argument", counting_supports)
+    estimator = _PartialFitEstimator()
+    callback = _RecordingCallback()
+    CallbackRunner([callback]).run(estimator, [[0.0]], [0], epochs=3, sample_weight=[1.0], classes=[0, 1])
+    assert [call["classes"] for call in estimator.calls] == [[0, 1]] * 3
+    assert sorted(checks) == ["classes", "sample_weight"]
+    assert callback.events == [
+        "train_start",
+        "epoch_start:0",
+        "step_end:0",
+        "epoch_end:0",
+        "epoch_start:1",
+        "step_end:1",
+        "epoch_end:1",
+        "epoch_start:2",
+        "step_end:2",
+        "epoch_end:2",
+        "train_end:3",
+    ]
+
+
+def test_fit_fallback_runs_single_epoch() -> None:
+    # 验证缺少 partial_fit 时只执行一次 fit，并报告 epochs_run=1
+    estimator = _FitOnlyEstimator()
+    callback = _RecordingCallback()
+    CallbackRunner([callback]).run(estimator, [[0.0]], [0], epochs=4)
+    assert estimator.fit_calls == 1
+    assert callback.events[-1] == "train_end:1"
+
+
+def test_runner_without_callbacks_runs_every_epoch() -> None:
+    # 验证无回调时的快速路径仍执行全部 epoch
+    estimator = _PartialFitEstimator()
+    result = CallbackRunner().run(estimator, [[0.0]], [0], epochs=5)
+    assert result is estimator
+    assert len(estimator.calls) == 5
+
+
+def test_non_callable_partial_fit_falls_back_to_fit() -> None:
+    # 验证 partial_fit 属性不可调用时按缺失处理并回退到 fit
+    estimator = _FitOnlyEstimator()
+    estimator.partial_fit = None  # type: ignore[attr-defined]
+    CallbackRunner().run(estimator, [[0.0]], [0], epochs=2, sample_weight=[1.0])
+    assert estimator.fit_calls == 1
+
+
+def test_overlap_runs_previous_epoch_callbacks_during_next_fit() -> None:
+    # 验证 overlap 模式：每轮 partial_fit 都执行，上一轮的结束回调在下一轮开始后触发且 epoch 正确
+    estimator = _PartialFitEstimator()
+    callback = _RecordingCallback()
+    CallbackRunner([callback], overlap=True).run(estimator, [[0.0]], [0], epochs=3, classes=[0, 1])
+    assert len(estimator.calls) == 3
+    assert callback.events == [
+        "train_start",
+        "epoch_start:0",
+        "epoch_start:1",
+        "step_end:0",
+        "epoch_end:0",
+        "epoch_start:2",
+        "step_end:1",
+        "epoch_end:1",
+        "step_end:2",
+        "epoch_end:2",
+        "train_end:3",
+    ]
+
+
+def test_single_fit_without_callbacks_passes_sample_weight() -> None:
+    # 验证无回调、单轮且无 partial_fit 时直接调用 fit，并透传受支持的 sample_weight
+    class _WeightedFit:
+        def __init__(self) -> None:
+            self.weights: List[Any] = []
+
+        def fit(self, features: Any, labels: Any, sample_weight: Any = None) -> "_WeightedFit":
+            self.weights.append(sample_weight)
+            return self
+
+    estimator = _WeightedFit()
+    assert CallbackRunner().run(estimator, [[0.0]], [0], sample_weight=[2.0]) is estimator
+    assert estimator.weights == [[2.0]]
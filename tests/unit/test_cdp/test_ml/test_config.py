@@ -62,3 +62,111 @@ def test_model_config_missing_type() -> None:
     # 验证缺失 model_type 时会抛出参数校验错误
     with pytest.raises(ParamValidationError):
         ModelConfig.from_dict({})
+
+
+def test_validate_result_is_reset_by_field_assignment() -> None:
+    # 验证 validate 结果被缓存，且字段重新赋值（含嵌套子配置）后会重新校验
+    config = MLConfig(model=ModelConfig(model_type="linear"))
+    assert config.validate() is config
+    assert config._validated and config.training._validated
+    config.training.epochs = 0
+    with pytest.raises(ParamValidationError):
+        config.validate()
+    config.training.epochs = 2
+    config.validate()
+    config.dp = DPConfig(enabled=True)
+    with pytest.raises(ParamValidationError):
+        config.validate()
+
+
+def test_config_dicts_are_copied_on_export_and_import() -> None:
+    # 验证 params/metadata 在导入与导出时均为独立的浅拷贝
+    from types import MappingProxyType
+
+    payload = {"model": {"model_type": "linear", "params": MappingProxyType({"alpha": 1.0})}, "metadata": {"k": 1}}
+    config = MLConfig.from_dict(payload)
+    assert type(config.model.params) is dict
+    exported = config.to_dict()
+    exported["model"]["params"]["alpha"] = 2.0
+    exported["metadata"]["k"] = 2
+    assert config.model.params == {"alpha": 1.0}
+    assert config.metadata == {"k": 1}
+
+
+def test_config_defaults_survive_slotted_dataclasses() -> None:
+    # 验证启用 __slots__ 后 from_dict 仍回退到字段默认值，且实例不再携带 __dict__
+    import sys
+
+    training = TrainingConfig.from_dict({})
+    assert (training.epochs, training.batch_size, training.shuffle) == (1, 32, True)
+    assert DPConfig.from_dict({}).enabled is False
+    assert AccountingConfig.from_dict({}).method == "rdp"
+    if sys.version_info >= (3, 10):
+        for config in (training, DPConfig(), AccountingConfig(), ModelConfig(model_type="x")):
+            assert not hasattr(config, "__dict__")
+
+
+def test_ml_config_from_dict_accepts_instances_and_rejects_bad_sections() -> None:
+    # 验证子配置可直接传入实例或映射，非法类型给出对应字段的错误
+    training = TrainingConfig(epochs=3)
+    config = MLConfig.from_dict({"model": ModelConfig(model_type="linear"), "training": training})
+    assert config.training is training
+    assert isinstance(config.dp, DPConfig)
+    with pytest.raises(ParamValidationError, match="dp must be DPConfig or mapping"):
+        MLConfig.from_dict({"model": {"model_type": "linear"}, "dp": 1})
+
+
+def test_mapping_fields_accept_any_mapping_and_reject_others() -> None:
+    # 验证 params/metadata 的映射校验：dict 与其他 Mapping 均通过，非映射报错
+    from types import MappingProxyType
+
+    ModelConfig(model_type="linear", params=MappingProxyType({"a": 1})).validate()  # type: ignore[arg-type]
+    with pytest.raises(ParamValidationError, match="params must be instance of Mapping"):
+        ModelConfig(model_type="linear", params=[("a", 1)]).validate()  # type: ignore[arg-type]
+    with pytest.raises(ParamValidationError, match="metadata must be instance of Mapping"):
+        MLConfig(model=ModelConfig(model_type="linear"), metadata=None).validate()  # type: ignore[arg-type]
+
+
+def test_disabled_dp_config_still_checks_explicit_values() -> None:
+    # 验证默认的未启用 DP 配置直接通过，但显式给出的非法取值仍会被拒绝
+    assert DPConfig().validate()._validated
+    with pytest.raises(ParamValidationError):
+        DPConfig(enabled=False, epsilon=-1.0).validate()
+    with pytest.raises(ParamValidationError):
+        DPConfig(enabled=0).validate()  # type: ignore[arg-type]
+
+
+def test_invalidate_forces_nested_revalidation() -> None:
+    # 验证就地修改子配置后显式 invalidate，可促使顶层配置重新校验该子配置
+    config = MLConfig(model=ModelConfig(model_type="logreg")).validate()
+    config.model.params["C"] = 1.0
+    config.model.invalidate()
+    assert not config.model._validated
+    config.validate()
+    assert config.model._validated and config._validated
+
+
+def test_training_config_fused_guard_matches_full_checks() -> None:
+    # 验证合并后的快速检查与逐项检查结论一致：合法取值通过，非法取值仍报出具体错误
+    assert TrainingConfig(epochs=3, batch_size=8, learning_rate=1, seed=0).validate()._validated
+    with pytest.raises(ParamValidationError, match="epochs"):
+        TrainingConfig(epochs=0).validate()
+    with pytest.raises(ParamValidationError, match="seed"):
+        TrainingConfig(seed=1.5).validate()  # type: ignore[arg-type]
+
+
+def test_validation_flag_is_not_part_of_serialized_config() -> None:
+    # 校验缓存标记不属于数据类字段：asdict / JSON 序列化结果与引入缓存前一致，pickle 往返后仍可校验
+    import pickle
+    from dataclasses import asdict
+
+    from dplib.core.utils.serialization import serialize_to_json
+
+    config = MLConfig(model=ModelConfig("lr")).validate()
+    dumped = asdict(config)
+    assert set(dumped) == {"model", "training", "dp", "accounting", "metadata"}
+    assert set(dumped["model"]) == {"model_type", "backend", "params"}
+    assert "_validated" not in serialize_to_json(config)
+    restored = pickle.loads(pickle.dumps(config))
+    assert restored == config
+    assert restored.validate() is restored
@@ -43,3 +43,114 @@ def test_wrapper_fit_predict_score() -> None:
     params = wrapper.estimator.get_params()
     assert params.get("class_weight") == "balanced"
     assert params.get("random_state") == 7
+
+
+def test_cached_signature_matches_inspect() -> None:
+    # 验证签名缓存对绑定方法与普通函数的结果与 inspect.signature 一致，且重复调用命中缓存
+    import inspect
+
+    from dplib.cdp.ml.backends.sklearn.estimator_wrappers import _cached_signature, _signature_for
+
+    estimator = LogisticRegression()
+    for method in (estimator.fit, estimator.predict, estimator.score, make_classification):
+        assert list(_cached_signature(method).parameters) == list(inspect.signature(method).parameters)
+    hits = _signature_for.cache_info().hits
+    _cached_signature(LogisticRegression().fit)
+    assert _signature_for.cache_info().hits == hits + 1
+
+
+def test_wrapper_filters_kwargs_with_precomputed_params() -> None:
+    # 验证构造时预解析的参数集合：不支持的关键字参数被丢弃，支持的被透传
+    class _Recorder:
+        def __init__(self) -> None:
+            self.fit_kwargs: dict = {}
+
+        def fit(self, features, labels, sample_weight=None, check_input=True):
+            self.fit_kwargs = {"sample_weight": sample_weight, "check_input": check_input}
+            return self
+
+        def predict(self, features):
+            return np.zeros(len(features))
+
+        def score(self, features, labels):
+            return 1.0
+
+    recorder = _Recorder()
+    wrapper = SklearnEstimatorWrapper(recorder)
+    assert "sample_weight" in wrapper._fit_params
+    wrapper.fit([[0.0]], [0], sample_weight=[1.0], check_input=False, unknown=1)
+    assert recorder.fit_kwargs == {"sample_weight": [1.0], "check_input": False}
+    assert wrapper.score([[0.0]], [0], sample_weight=[1.0], unknown=1) == 1.0
+    assert wrapper.predict([[0.0]], unknown=1).shape == (1,)
+
+
+def test_supports_argument_fast_path_edge_cases() -> None:
+    # 验证 __code__ 快速判断与签名解析结论一致，且装饰器包装的函数仍按真实签名判断
+    import functools
+
+    from dplib.cdp.ml.backends.sklearn.estimator_wrappers import _supports_argument
+
+    def keyword_only(features, *, sample_weight=None):
+        return None
+
+    @functools.wraps(keyword_only)
+    def wrapped(*args, **kwargs):
+        return keyword_only(*args, **kwargs)
+
+    assert _supports_argument(keyword_only, "sample_weight")
+    assert _supports_argument(wrapped, "sample_weight")
+    assert not _supports_argument(keyword_only, "classes")
+    assert _supports_argument(LogisticRegression().fit, "sample_weight")
+
+
+def test_set_param_if_supported_skips_get_params(monkeypatch: pytest.MonkeyPatch) -> None:
+    # 验证参数写入只做属性探测与 set_params，不再调用 get_params，且不支持的参数返回 False
+    from sklearn.tree import DecisionTreeClassifier
+
+    from dplib.cdp.ml.backends.sklearn.estimator_wrappers import _set_param_if_supported
+
+    estimator = DecisionTreeClassifier()
+
+    def _fail(*args, **kwargs):
+        raise AssertionError("get_params should not be called")
+
+    monkeypatch.setattr(estimator, "get_params", _fail)
+    assert _set_param_if_supported(estimator, "random_state", 3)
+    assert estimator.random_state == 3
+    assert not _set_param_if_supported(estimator, "no_such_param", 1)
+    assert not _set_param_if_supported(estimator, "random_state", None)
+
+
+def test_set_param_if_supported_falls_back_to_setattr() -> None:
+    # 验证非 sklearn 对象的 set_params 拒绝参数时回退为直接赋值
+    from dplib.cdp.ml.backends.sklearn.estimator_wrappers import _set_param_if_supported
+
+    class _Strict:
+        random_state = None
+
+        def set_params(self, **params):
+            raise ValueError("unsupported")
+
+    strict = _Strict()
+    assert _set_param_if_supported(strict, "random_state", 5)
+    assert strict.random_state == 5
+
+
+def test_wrapper_prebinds_estimator_methods() -> None:
+    # 验证构造时预绑定的方法指向被包装估计器，预测结果与直接调用一致
+    features, labels = make_classification(n_samples=32, n_features=4, random_state=1)
+    estimator = LogisticRegression(max_iter=50)
+    wrapper = SklearnEstimatorWrapper(estimator).fit(features, labels)
+    assert wrapper._predict.__self__ is estimator
+    np.testing.assert_array_equal(wrapper.predict(features), estimator.predict(features))
+
+
+def test_wrapper_plain_calls_skip_kwargs_filtering() -> None:
+    # 验证无附加参数时 fit/score 直接调用估计器，结果与带空权重调用一致
+    features, labels = make_classification(n_samples=32, n_features=4, random_state=2)
+    wrapper = SklearnEstimatorWrapper(LogisticRegression(max_iter=50))
+    wrapper._fit_params = frozenset()
+    wrapper._score_params = frozenset()
+    wrapper.fit(features, labels)
+    expected = wrapper.estimator.score(features, labels)
+    assert wrapper.score(features, labels) == pytest.approx(expected)
@@ -53,6 +53,16 @@ def test_train_result_round_trip_with_privacy() -> None:
     assert restored.metrics["accuracy"] == [0.75]
 
 
+def test_train_result_privacy_numpy_scalars_are_json_serializable() -> None:
+    # 隐私摘要中的 numpy 标量应经 _jsonify 转换为内置类型，整体可直接 json.dumps
+    import json
+
+    result = TrainResult(privacy=PrivacySummary(epsilon=np.float32(1.5), delta=np.float64(1e-5), method="rdp"))
+    payload = result.to_dict()
+    assert type(payload["privacy"]["epsilon"]) is float
+    assert json.loads(json.dumps(payload))["privacy"]["epsilon"] == pytest.approx(1.5)
+
+
 def test_metric_spec_and_eval_result_defaults() -> None:
     # 验证指标规格与评估结果的默认值与往返行为
     spec = MetricSpec(name="accuracy")
@@ -70,3 +80,70 @@ def test_metric_spec_and_eval_result_defaults() -> None:
     assert restored_result.per_split == {}
     assert restored_result.per_class == {}
     assert restored_result.n_samples == {}
+
+
+def test_jsonify_nested_builtin_containers() -> None:
+    # 验证内置 dict/list 的快速路径仍会递归转换其中的 numpy 值与其他 Mapping
+    from collections import OrderedDict
+
+    from dplib.cdp.ml.types import _jsonify
+
+    payload = {"a": [np.float64(1.5), {"b": np.arange(2)}], "c": OrderedDict(d=(1, 2)), "e": "x"}
+    assert _jsonify(payload) == {"a": [1.5, {"b": [0, 1]}], "c": {"d": [1, 2]}, "e": "x"}
+
+
+def test_jsonify_caches_dataclass_field_names() -> None:
+    # 验证嵌套 dataclass 序列化结果不变，且字段名按类缓存
+    from dplib.cdp.ml.types import _field_names, _jsonify
+
+    summaries = [PrivacySummary(epsilon=1.0, details={"step": i}) for i in range(3)]
+    out = _jsonify(summaries)
+    assert out[2] == {"epsilon": 1.0, "delta": None, "method": None, "details": {"step": 2}}
+    assert _field_names(PrivacySummary) == ("epsilon", "delta", "method", "details")
+    assert _field_names.cache_info().hits >= 2
+
+
+def test_jsonify_dispatch_table_handles_tuples_and_sets() -> None:
+    # 验证查表分发与回退路径一致：tuple/set 统一转为 list，未知对象原样返回
+    from dplib.cdp.ml.types import _jsonify
+
+    marker = object()
+    assert _jsonify((1, (2.0, None))) == [1, [2.0, None]]
+    assert _jsonify({3}) == [3]
+    assert _jsonify(marker) is marker
+
+
+def test_jsonify_numpy_fast_path_matches_tolist() -> None:
+    # 验证 ndarray 与 numpy 标量的快速分发结果与 tolist/item 一致
+    from dplib.cdp.ml.types import _jsonify
+
+    values = np.linspace(0.0, 1.0, 5, dtype=np.float32)
+    assert _jsonify(values) == values.tolist()
+    assert _jsonify(np.arange(6).reshape(2, 3)) == [[0, 1, 2], [3, 4, 5]]
+    converted = _jsonify({"loss": np.float32(0.5), "n": np.int64(3), "ok": np.bool_(True)})
+    assert converted == {"loss": 0.5, "n": 3, "ok": True}
+    assert type(converted["n"]) is int and type(converted["ok"]) is bool
+
+
+def test_payload_types_use_slots_and_field_order() -> None:
+    # 验证载体类型在支持的 Python 版本上使用 slots，且 to_dict 按字段顺序导出
+    import sys
+
+    batch = TrainBatch(features=[1], labels=[0])
+    if sys.version_info >= (3, 10):
+        assert not hasattr(batch, "__dict__")
+    assert list(batch.to_dict()) == ["features", "labels", "sample_weight", "metadata"]
+    assert list(EvalResult().to_dict()) == ["metrics", "per_split", "per_class", "n_samples", "metadata"]
+    result = TrainResult(privacy=PrivacySummary(epsilon=2.0))
+    assert result.to_dict()["privacy"]["epsilon"] == 2.0
+
+
+def test_train_result_from_dict_privacy_variants() -> None:
+    # 验证 privacy 为 dict、其他 Mapping、PrivacySummary 实例或非法类型时的还原结果
+    from types import MappingProxyType
+
+    summary = PrivacySummary(epsilon=1.0, delta=1e-5)
+    assert TrainResult.from_dict({"privacy": {"epsilon": 1.0, "delta": 1e-5}}).privacy == summary
+    assert TrainResult.from_dict({"privacy": MappingProxyType({"epsilon": 1.0, "delta": 1e-5})}).privacy == summary
+    assert TrainResult.from_dict({"privacy": summary}).privacy is summary
+    assert TrainResult.from_dict({"privacy": "n/a"}).privacy is None
@@ -0,0 +1,118 @@
+"""
+Unit tests for CDP ML utility helpers.
+"""
+# 说明：CDP ML 工具函数的单元测试。
+# 覆盖：
+# - checkpoint_path 的路径拼接与 Path 规范化结果一致
+# - checkpoint_path 对非法参数的校验
+# - resolve_device 的 torch 导入探测缓存
+# - seed_everything 的后端播种函数调用
+# - json_read / json_write 的往返一致性
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from dplib.cdp.ml.utils import checkpoint_path
+from dplib.core.utils.param_validation import ParamValidationError
+
+
+@pytest.mark.parametrize("base_dir", ["runs", "runs//exp/", "./runs", "", "/", Path("runs/./exp")])
+def test_checkpoint_path_matches_pathlib(base_dir) -> None:
+    # 验证缓存目录前缀后的字符串拼接与 Path 拼接结果完全一致
+    assert checkpoint_path(base_dir, "model") == str(Path(base_dir) / "model.ckpt")
+    assert checkpoint_path(base_dir, "model", 12) == str(Path(base_dir) / "model_step_12.ckpt")
+    assert checkpoint_path(base_dir, "sub//model") == str(Path(base_dir) / "sub//model.ckpt")
+
+
+def test_checkpoint_path_validates_arguments() -> None:
+    # 验证空名称与负步数仍被拒绝
+    with pytest.raises(ParamValidationError):
+        checkpoint_path("runs", " ")
+    with pytest.raises(ParamValidationError):
+        checkpoint_path("runs", "model", -1)
+
+
+def test_resolve_device_caches_torch_import() -> None:
+    # 验证多次解析设备时 torch 导入探测只执行一次
+    from dplib.cdp.ml.utils import _try_import_torch, resolve_device
+
+    _try_import_torch.cache_clear()
+    for _ in range(3):
+        assert resolve_device() in {"cpu", "cuda"}
+    info = _try_import_torch.cache_info()
+    assert info.misses == 1 and info.hits == 2
+
+
+def test_seed_everything_runs_module_level_seeders(monkeypatch: pytest.MonkeyPatch) -> None:
+    # 验证 seed_everything 依次调用模块级后端播种函数，未给定种子时跳过
+    import dplib.cdp.ml.utils as ml_utils
+
+    calls = []
+    monkeypatch.setattr(ml_utils, "_SEEDERS", (calls.append,))
+    first = ml_utils.seed_everything(5)
+    second = ml_utils.seed_everything(5)
+    ml_utils.seed_everything(None)
+    assert calls == [5, 5]
+    assert first.random() == second.random()
+
+
+def test_seed_everything_leaves_global_numpy_state_by_default() -> None:
+    # 验证默认不改动 np.random 全局状态，legacy_global=True 时恢复全局播种
+    import numpy as np
+
+    from dplib.cdp.ml.utils import seed_everything
+
+    np.random.seed(123)
+    expected = np.random.random()
+    np.random.seed(123)
+    seed_everything(7)
+    assert np.random.random() == expected
+    seed_everything(7, legacy_global=True)
+    first = np.random.random()
+    np.random.seed(7)
+    assert np.random.random() == first
+
+
+def test_json_write_read_round_trip(tmp_path: Path) -> None:
+    # 验证 JSON 读写往返一致（orjson 可用时走快速路径），并能读取标准库写出的 NaN
+    import numpy as np
+
+    from dplib.cdp.ml.types import PrivacySummary
+    from dplib.cdp.ml.utils import json_read, json_write
+
+    target = tmp_path / "history.json"
+    json_write(target, {"loss": [0.5, 0.25], "privacy": PrivacySummary(epsilon=1.0), "name": "运行"})
+    assert json_read(target) == {
+        "loss": [0.5, 0.25],
+        "privacy": {"epsilon": 1.0, "delta": None, "method": None, "details": {}},
+        "name": "运行",
+    }
+    json_write(target, {"loss": 1.0}, version="1")
+    assert json_read(target) == {"version": "1", "payload": {"loss": 1.0}}
+    target.write_text('{"loss": NaN}', encoding="utf-8")
+    assert np.isnan(json_read(target)["loss"])
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_json_write_keeps_non_finite_floats_and_big_ints(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, use_orjson: bool
+) -> None:
+    # NaN/Inf 与超过 64 位的整数无论 orjson 是否可用都应无损往返，而不是被写成 null 或报错
+    import math
+
+    from dplib.cdp.ml import utils as ml_utils
+
+    if use_orjson and ml_utils.orjson is None:
+        pytest.skip("orjson not available")
+    if not use_orjson:
+        monkeypatch.setattr(ml_utils, "orjson", None)
+    target = tmp_path / "history.json"
+    ml_utils.json_write(target, {"loss": [1.0, float("nan"), float("inf")], "n": 2**70})
+    loaded = ml_utils.json_read(target)
+    assert loaded["loss"][0] == 1.0
+    assert math.isnan(loaded["loss"][1])
+    assert loaded["loss"][2] == float("inf")
+    assert loaded["n"] == 2**70
@@ -24,3 +24,35 @@ def test_global_sensitivity_wrappers_cover_range_variants() -> None:
     assert range(domain, window=3, max_contribution=1, metric="sum") == pytest.approx(15.0)
     assert range(domain, window=3, max_contribution=1, metric="mean") == pytest.approx(5.0)
     assert range(domain, window=3, max_contribution=3, metric="count") == pytest.approx(3.0)
+
+
+def test_presets_are_shared_read_only_mapping() -> None:
+    # 验证 CDP 层 PRESETS 与核心数据层共享同一只读映射，且名称均指向真实实现
+    import dplib.core.data.sensitivity as core_sensitivity
+    from dplib.cdp.sensitivity import GLOBAL_SENSITIVITY_PRESETS
+
+    assert GLOBAL_SENSITIVITY_PRESETS is core_sensitivity.PRESETS
+    assert all(hasattr(core_sensitivity, name) for name in GLOBAL_SENSITIVITY_PRESETS.values())
+    with pytest.raises(TypeError):
+        GLOBAL_SENSITIVITY_PRESETS["count"] = "other"  # type: ignore[index]
+
+
+def test_batch_wrappers_match_scalar_versions() -> None:
+    # 验证批量接口与逐个调用标量接口的结果一致，并对缺失边界的域报错
+    import numpy as np
+
+    from dplib.cdp.sensitivity import mean_batch, sum_batch, variance_batch
+    from dplib.core.data.sensitivity import SensitivityError
+
+    domains = [ContinuousDomain(minimum=0.0, maximum=1.0), ContinuousDomain(minimum=-2.0, maximum=3.0)]
+    np.testing.assert_allclose(sum_batch(domains, max_contribution=2), [sum(d, max_contribution=2) for d in domains])
+    np.testing.assert_allclose(
+        mean_batch(domains, sample_size=[10, 20]),
+        [mean(d, sample_size=n) for d, n in zip(domains, [10, 20])],
+    )
+    np.testing.assert_allclose(
+        variance_batch(domains, sample_size=3, ddof=1),
+        [variance(d, sample_size=3, ddof=1) for d in domains],
+    )
+    with pytest.raises(SensitivityError):
+        sum_batch([ContinuousDomain(minimum=0.0)])
@@ -39,3 +39,44 @@ def test_calibrate_dispatch_and_errors() -> None:
         calibrate("vector", 1.0, sensitivity=1.0, distribution="gaussian")
     with pytest.raises(ParamValidationError):
         calibrate("unknown", 1.0, sensitivity=1.0)
+
+
+def test_calibrate_gaussian_reuses_delta_factor() -> None:
+    # 验证固定 delta 扫描 epsilon 时复用缓存的对数因子，且结果与直接公式一致
+    from dplib.cdp.sensitivity.noise_calibrator import _gaussian_factor
+
+    _gaussian_factor.cache_clear()
+    for epsilon in (0.5, 1.0, 2.0):
+        expected = 1.0 * math.sqrt(2.0 * math.log(1.25 / 1e-6)) / epsilon
+        assert calibrate_gaussian(epsilon, 1e-6, sensitivity=1.0) == expected
+    assert _gaussian_factor.cache_info().hits == 2
+
+
+def test_batch_calibration_matches_scalar_versions() -> None:
+    # 验证批量校准与逐个调用标量接口结果一致，包括零敏感度与非法参数的处理
+    import numpy as np
+
+    from dplib.cdp.sensitivity.noise_calibrator import calibrate_gaussian_batch, calibrate_laplace_batch
+
+    epsilons = np.array([0.1, 1.0, 5.0])
+    sens = np.array([0.0, 1.0, 2.5])
+    scales = calibrate_laplace_batch(epsilons, sensitivity=sens)
+    assert scales.tolist() == [calibrate_laplace(e, sensitivity=s) for e, s in zip(epsilons, sens)]
+    sigmas = calibrate_gaussian_batch(epsilons, 1e-5, sensitivity=1.0)
+    assert sigmas == pytest.approx([calibrate_gaussian(e, 1e-5, sensitivity=1.0) for e in epsilons])
+    assert calibrate_laplace_batch([1e308], sensitivity=[1e-308]).tolist() == [math.ulp(0.0)]
+    with pytest.raises(ParamValidationError):
+        calibrate_laplace_batch([1.0, 0.0], sensitivity=1.0)
+    with pytest.raises(ParamValidationError):
+        calibrate_gaussian_batch(1.0, [0.5, 1.0], sensitivity=1.0)
+
+
+def test_scalar_validation_fast_path_keeps_errors() -> None:
+    # 验证快速校验路径对非法类型、NaN 与越界取值仍抛出 ParamValidationError
+    with pytest.raises(ParamValidationError, match="epsilon"):
+        calibrate_laplace("1", sensitivity=1.0)  # type: ignore[arg-type]
+    with pytest.raises(ParamValidationError):
+        calibrate_laplace(float("nan"), sensitivity=1.0)
+    with pytest.raises(ParamValidationError, match="delta"):
+        calibrate_gaussian(1.0, 1, sensitivity=1.0)
+    assert calibrate_laplace(True, sensitivity=2) == 2.0
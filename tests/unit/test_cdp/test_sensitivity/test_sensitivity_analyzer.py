@@ -8,6 +8,7 @@ Tests for SensitivityAnalyzer dispatch and validation.
 # - analyze 接口在缺失必填参数或传入非法组合时抛出 ParamValidationError
 # - 对未知查询名称的防御性校验分支
 
+import numpy as np
 import pytest
 
 from dplib.cdp.sensitivity import SensitivityAnalyzer
@@ -54,3 +55,206 @@ def test_sensitivity_analyzer_validate_inputs() -> None:
         analyzer.analyze("range", domain=domain, window=None)  # type: ignore[arg-type]
     with pytest.raises(ParamValidationError):
         analyzer.analyze("unknown")
+
+
+def test_analyze_dispatch_table_is_case_insensitive() -> None:
+    # 验证分派表对查询名大小写不敏感，且与直接调用对应方法的结果一致
+    analyzer = SensitivityAnalyzer()
+    domain = ContinuousDomain(minimum=0.0, maximum=2.0)
+
+    assert analyzer.analyze("HISTOGRAM").sensitivity == analyzer.histogram().sensitivity
+    report = analyzer.analyze("Variance", domain=domain, sample_size=10)
+    assert report == analyzer.variance(domain, sample_size=10)
+    with pytest.raises(ParamValidationError):
+        analyzer.analyze("smooth_mean", values=[1.0, 2.0])
+
+
+def test_sensitivity_report_is_slotted_with_mapping_metadata() -> None:
+    # 验证报告在支持的 Python 版本上不再携带 __dict__，metadata 仍按映射访问
+    import sys
+
+    report = SensitivityAnalyzer().count(max_contribution=3)
+    if sys.version_info >= (3, 10):
+        assert not hasattr(report, "__dict__")
+    assert report.metadata["max_contribution"] == 3.0
+
+
+def test_run_dispatches_typed_queries() -> None:
+    # 验证类型化查询对象经 run 分派后与对应方法结果一致，未知对象抛出 ParamValidationError
+    from dplib.cdp.sensitivity import CountQuery, MeanQuery, RangeQuery, SmoothMeanQuery
+
+    analyzer = SensitivityAnalyzer()
+    domain = ContinuousDomain(minimum=0.0, maximum=4.0)
+    assert analyzer.run(CountQuery(max_contribution=2)) == analyzer.count(max_contribution=2)
+    assert analyzer.run(MeanQuery(domain, sample_size=8)) == analyzer.mean(domain, sample_size=8)
+    assert analyzer.run(RangeQuery(domain, window=2, metric="mean")).query == "range_mean"
+    assert analyzer.run(SmoothMeanQuery([1.0, 2.0], beta=1.0)).query == "smooth_mean"
+    with pytest.raises(ParamValidationError):
+        analyzer.run("count")
+
+
+def test_global_reports_are_interned_and_read_only() -> None:
+    # 验证相同参数的全局敏感度报告复用同一只读实例，元数据不可修改
+    import dataclasses
+
+    analyzer = SensitivityAnalyzer()
+    domain = ContinuousDomain(minimum=0.0, maximum=1.0)
+    first = analyzer.mean(domain, sample_size=4)
+    assert analyzer.mean(domain, sample_size=4) is first
+    assert first.metadata == {"sample_size": 4.0, "max_contribution": 1.0}
+    with pytest.raises(TypeError):
+        first.metadata["sample_size"] = 1.0  # type: ignore[index]
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        first.sensitivity = 0.0  # type: ignore[misc]
+
+
+def test_interned_reports_distinguish_value_types() -> None:
+    # 1 / 1.0 / True 彼此相等，但驻留缓存不应让后来的调用拿到先前类型的报告
+    from dplib.cdp.sensitivity import sensitivity_analyzer as module
+
+    int_report = module._make_report("count", 1, (("max_contribution", 1),))
+    float_report = module._make_report("count", 1.0, (("max_contribution", True),))
+    assert float_report is not int_report
+    assert type(float_report.sensitivity) is float
+    assert type(float_report.metadata["max_contribution"]) is bool
+    assert module._make_report("count", 1, (("max_contribution", 1),)) is int_report
+
+
+def test_analyze_dispatch_cache_tracks_domain_bounds() -> None:
+    # 验证 analyze 分派层缓存按域边界取值命中，域被修改后不会返回过期结果
+    from dplib.cdp.sensitivity import sensitivity_analyzer as module
+
+    module._ANALYZE_CACHE.clear()
+    analyzer = SensitivityAnalyzer()
+    domain = ContinuousDomain(minimum=0.0, maximum=1.0)
+    first = analyzer.analyze("sum", domain=domain, max_contribution=2)
+    assert analyzer.analyze("sum", max_contribution=2, domain=ContinuousDomain(minimum=0.0, maximum=1.0)) is first
+    domain.maximum = 3.0
+    assert analyzer.analyze("sum", domain=domain, max_contribution=2).sensitivity == pytest.approx(6.0)
+    assert analyzer.analyze("local", values=[1.0, 3.0]).sensitivity == pytest.approx(2.0)
+    assert all(key[0] != "local" for key in module._ANALYZE_CACHE)
+
+
+def test_analyze_dispatch_cache_distinguishes_argument_types() -> None:
+    # 相等但类型不同的参数（2 与 2.0、整数与浮点域边界）不应命中彼此的缓存报告
+    from dplib.cdp.sensitivity import sensitivity_analyzer as module
+
+    analyzer = SensitivityAnalyzer()
+    int_key = module._analyze_cache_key("count", {"max_contribution": 2})
+    assert int_key != module._analyze_cache_key("count", {"max_contribution": 2.0})
+    int_sum = analyzer.analyze("sum", domain=ContinuousDomain(minimum=0, maximum=1), max_contribution=2)
+    float_sum = analyzer.analyze("sum", domain=ContinuousDomain(minimum=0.0, maximum=1.0), max_contribution=2)
+    assert type(int_sum.sensitivity) is int
+    assert type(float_sum.sensitivity) is float
+
+
+def test_analyze_dispatch_cache_skips_subclasses_and_evicts_oldest(monkeypatch: pytest.MonkeyPatch) -> None:
+    # 子类实例可能持有各自状态，不走分派层缓存；缓存满时只淘汰最久未使用的一项
+    from dplib.cdp.sensitivity import sensitivity_analyzer as module
+
+    class ScaledAnalyzer(SensitivityAnalyzer):
+        def __init__(self, factor: float) -> None:
+            self.factor = factor
+
+        def count(self, *, max_contribution: int = 1):
+            report = super().count(max_contribution=max_contribution)
+            return module.SensitivityReport("count", report.sensitivity * self.factor, report.metadata)
+
+    assert ScaledAnalyzer(2.0).analyze("count").sensitivity == pytest.approx(2.0)
+    assert ScaledAnalyzer(3.0).analyze("count").sensitivity == pytest.approx(3.0)
+
+    module._ANALYZE_CACHE.clear()
+    monkeypatch.setattr(module, "_ANALYZE_CACHE_SIZE", 2)
+    analyzer = SensitivityAnalyzer()
+    first = analyzer.analyze("count", max_contribution=1)
+    analyzer.analyze("count", max_contribution=2)
+    assert analyzer.analyze("count", max_contribution=1) is first
+    analyzer.analyze("count", max_contribution=3)
+    assert len(module._ANALYZE_CACHE) == 2
+    assert module._analyze_cache_key("count", {"max_contribution": 1}) in module._ANALYZE_CACHE
+    assert module._analyze_cache_key("count", {"max_contribution": 2}) not in module._ANALYZE_CACHE
+
+
+def test_analyze_normalizes_mixed_case_query_to_shared_cache_entry() -> None:
+    # 验证大小写不同的查询名归一到同一分派项与缓存条目，未知查询保留原始名称报错
+    analyzer = SensitivityAnalyzer()
+    assert analyzer.analyze("COUNT", max_contribution=3) is analyzer.analyze("count", max_contribution=3)
+    with pytest.raises(ParamValidationError, match="'Median'"):
+        analyzer.analyze("Median")
+
+
+def test_analyze_accepts_continuous_domain_subclass_and_rejects_other_domains() -> None:
+    # 验证域校验快路径之外，子类仍经 isinstance 回退被接受，非连续域依旧报错
+    class BoundedDomain(ContinuousDomain):
+        pass
+
+    analyzer = SensitivityAnalyzer()
+    report = analyzer.analyze("sum", domain=BoundedDomain(minimum=-1.0, maximum=1.0))
+    assert report.sensitivity == pytest.approx(2.0)
+    with pytest.raises(ParamValidationError, match="required for sum"):
+        analyzer.analyze("sum", domain=(0.0, 1.0))
+
+
+def test_local_and_smooth_mean_accept_arrays_and_generators_without_copying_to_lists() -> None:
+    # 验证分析器将 ndarray 与生成器原样交给底层向量化内核，结果与列表输入一致
+    analyzer = SensitivityAnalyzer()
+    values = [0.0, 2.0, 5.0, 6.0]
+    expected = analyzer.local(values).sensitivity
+    assert analyzer.local(np.array(values, dtype=np.float32)).sensitivity == expected
+    assert analyzer.analyze("local", values=(v for v in values)).sensitivity == expected
+    smooth = analyzer.smooth_mean(values, beta=0.5).sensitivity
+    assert analyzer.analyze("smooth_mean", values=iter(values), beta=0.5).sensitivity == pytest.approx(smooth)
+
+
+def test_fast_count_sum_histogram_keep_core_errors() -> None:
+    # 快路径下非法输入仍沿用核心函数的报错
+    from dplib.core.data.sensitivity import SensitivityError
+
+    analyzer = SensitivityAnalyzer()
+    with pytest.raises(SensitivityError):
+        analyzer.count(max_contribution=0)
+    with pytest.raises(SensitivityError):
+        analyzer.sum(ContinuousDomain(minimum=1.0, maximum=1.0))
+
+
+def test_module_level_functions_use_shared_default_analyzer() -> None:
+    # 验证模块级函数绑定到共享的默认分析器，返回与实例方法相同的报告
+    from dplib.cdp.sensitivity import default_analyzer
+    from dplib.cdp.sensitivity import sensitivity_analyzer as module
+
+    domain = ContinuousDomain(minimum=0.0, maximum=4.0)
+    assert module.count.__self__ is default_analyzer
+    assert module.sum_report(domain, max_contribution=2) is SensitivityAnalyzer().sum(domain, max_contribution=2)
+    assert module.analyze("mean", domain=domain, sample_size=4).sensitivity == pytest.approx(1.0)
+    assert module.local([1.0, 4.0]).sensitivity == pytest.approx(3.0)
+    # 模块不导出遮蔽内置函数的名称，星号导入不会覆盖调用方的 sum / range
+    assert not {"sum", "range"} & set(module.__all__)
+    assert not hasattr(module, "sum") and not hasattr(module, "range")
+    assert all(hasattr(module, name) for name in module.__all__)
+
+
+def test_reports_are_hashable_with_compact_metadata() -> None:
+    # 验证元数据以键值对元组存储：只读、与等价字典相等，报告可哈希并可导出为独立字典
+    from dplib.cdp.sensitivity import ReportMetadata
+
+    analyzer = SensitivityAnalyzer()
+    report = analyzer.variance(ContinuousDomain(minimum=0.0, maximum=1.0), sample_size=5)
+    assert isinstance(report.metadata, ReportMetadata)
+    assert report.metadata == {"max_contribution": 1.0, "ddof": 1.0, "sample_size": 5.0}
+    assert hash(ReportMetadata([("a", 1.0), ("b", 2.0)])) == hash(ReportMetadata([("b", 2.0), ("a", 1.0)]))
+    assert hash(analyzer.local([0.0, 2.0])) == hash(analyzer.local([0.0, 2.0]))
+    assert len({report, analyzer.variance(ContinuousDomain(minimum=0.0, maximum=1.0), sample_size=5)}) == 1
+    exported = report.as_dict()
+    exported["ddof"] = 0.0
+    assert report.metadata["ddof"] == 1.0
+    with pytest.raises(KeyError):
+        report.metadata["beta"]
+
+
+def test_hot_methods_are_excluded_from_dispatch_cache() -> None:
+    # 验证样本相关的热点方法与可缓存的全局查询恰好划分全部分派项
+    from dplib.cdp.sensitivity import sensitivity_analyzer as module
+
+    assert module._HOT_METHODS == {"local", "smooth_mean"}
+    assert module._CACHEABLE_QUERIES | module._HOT_METHODS == set(module._ANALYZE_HANDLERS)
+    assert not module._CACHEABLE_QUERIES & module._HOT_METHODS
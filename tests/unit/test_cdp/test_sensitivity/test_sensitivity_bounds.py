@@ -7,6 +7,8 @@ Tests for sensitivity bounds helpers.
 # - 区间下界固定为 0 且上界非负等基本不变量
 # - tighten 在给定观测值时是否能按观测值收紧上界
 
+import pytest
+
 from dplib.cdp.sensitivity.sensitivity_bounds import (
     SensitivityBounds,
     count_bounds,
@@ -18,6 +20,7 @@ from dplib.cdp.sensitivity.sensitivity_bounds import (
     variance_bounds,
 )
 from dplib.core.data import ContinuousDomain
+from dplib.core.utils.param_validation import ParamValidationError
 
 
 def test_bounds_and_tighten_cover_all_queries() -> None:
@@ -39,3 +42,48 @@ def test_bounds_and_tighten_cover_all_queries() -> None:
 
     tightened = tighten(sb, observed=0.5)
     assert tightened.upper == 0.5
+
+
+def test_tighten_returns_same_bounds_when_observation_does_not_improve() -> None:
+    # 验证观测值不小于上界时 tighten 直接返回原区间，严格改进时才构造新区间，非法类型仍报错
+    bounds = count_bounds(max_contribution=2)
+    assert tighten(bounds, observed=2) is bounds
+    assert tighten(bounds, observed=5.0) is bounds
+    improved = tighten(bounds, observed=1)
+    assert improved is not bounds
+    assert (improved.upper, improved.proof) == (1.0, bounds.proof)
+    with pytest.raises(ParamValidationError, match="observed must be instance of int, float"):
+        tighten(bounds, observed="1.0")
+
+
+def test_sensitivity_bounds_uses_slots_and_returns_fresh_dicts() -> None:
+    # 验证支持的版本上区间容器不带实例 __dict__，且 to_dict 每次返回独立字典以免共享状态被修改
+    import sys
+
+    bounds = SensitivityBounds(lower=0.0, upper=2)
+    if sys.version_info >= (3, 10):
+        assert not hasattr(bounds, "__dict__")
+    exported = bounds.to_dict()
+    exported["upper"] = 9.0
+    assert bounds.to_dict() == {"lower": 0.0, "upper": 2.0}
+
+
+def test_range_bounds_proof_notes_follow_metric() -> None:
+    # 验证区间查询的证明说明按度量取自共享常量表，不可变以防被调用方篡改
+    from dplib.cdp.sensitivity import sensitivity_bounds as module
+
+    domain = ContinuousDomain(minimum=0.0, maximum=1.0)
+    for metric, proof in module._RANGE_PROOFS.items():
+        assert range_bounds(domain, window=3, metric=metric).proof == proof
+    with pytest.raises(TypeError):
+        module._RANGE_PROOFS["sum"] = "changed"  # type: ignore[index]
+
+
+def test_bounds_helpers_share_instances_for_equivalent_domains() -> None:
+    # 验证缓存以域边界取值而非域对象身份为键：等价但不同的域实例得到同一区间对象
+    first = sum_bounds(ContinuousDomain(minimum=-1.0, maximum=1.0), max_contribution=2)
+    second = sum_bounds(ContinuousDomain(minimum=-1.0, maximum=1.0), max_contribution=2)
+    assert first is second
+    assert mean_bounds(ContinuousDomain(minimum=0.0, maximum=4.0), sample_size=2).upper == 2.0
+    assert sum_bounds(ContinuousDomain(minimum=0.0, maximum=3.0), max_contribution=2).upper == 6.0
+
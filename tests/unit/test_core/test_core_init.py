@@ -0,0 +1,52 @@
+"""
+Unit tests for the lazy public exports of dplib.core.
+"""
+# 说明：dplib.core 包级按需导出（PEP 562 __getattr__）的单元测试。
+# 覆盖：
+# - 仅导入 dplib.core 时不加载 data/privacy/utils 子树
+# - 首次访问公共符号返回子包中的同一对象，子包属性访问保持可用
+# - 未知属性仍抛出 AttributeError
+
+import os
+import subprocess
+import sys
+from typing import Optional
+
+import pytest
+
+import dplib.core as core
+
+
+def test_importing_core_defers_subpackages() -> None:
+    # 在独立解释器中验证导入 dplib.core 本身不会连带加载任何子包
+    script = "import sys, dplib.core; print(sorted(m for m in sys.modules if m.startswith('dplib.core.')))"
+    src_root = os.path.dirname(os.path.dirname(os.path.dirname(core.__file__)))
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, [src_root, os.environ.get("PYTHONPATH")]))}
+    output = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True, env=env).stdout
+    assert output.strip() == "[]"
+
+
+def test_lazy_exports_resolve_to_subpackage_objects() -> None:
+    # 验证 __all__ 中的每个符号均可解析为子包导出的同一对象，未知名称仍报错
+    from dplib.core import data, privacy, utils
+
+    for name in core.__all__:
+        owner = next(module for module in (data, privacy, utils) if hasattr(module, name))
+        assert getattr(core, name) is getattr(owner, name)
+    assert core.data is data
+    with pytest.raises(AttributeError):
+        core.NotAnExport  # noqa: B018
+
+
+def test_lazy_export_import_errors_propagate(monkeypatch: pytest.MonkeyPatch) -> None:
+    # 验证子包导入失败时直接抛出 ImportError，不再以 None 占位并写入模块全局
+    import importlib
+
+    def fail(name: str, package: Optional[str] = None) -> None:
+        raise ImportError(f"cannot import {name}")
+
+    monkeypatch.delitem(core.__dict__, "Schema", raising=False)
+    monkeypatch.setattr(importlib, "import_module", fail)
+    with pytest.raises(ImportError):
+        core.Schema  # noqa: B018
+    assert "Schema" not in core.__dict__
@@ -88,3 +88,123 @@ def test_unknown_strategy_raises_param_validation_error() -> None:
     schema = Schema([SchemaField("score", domain, required=True)])
     with pytest.raises(ParamValidationError):
         SchemaValidator(schema, on_error="invalid")
+
+
+def test_schema_validator_precompiled_plan_preserves_field_semantics() -> None:
+    # 预解析字段计划后：可空/非必填字段原样保留 None，默认值参与校验，额外键保持不变
+    domain = ContinuousDomain(minimum=0.0, maximum=10.0)
+    schema = Schema(
+        [
+            SchemaField("a", domain),
+            SchemaField("b", domain, required=False),
+            SchemaField("c", domain, allow_null=True),
+            SchemaField("d", domain, default=3),
+        ]
+    )
+    validator = SchemaValidator(schema, on_error=ValidationStrategy.DROP)
+    assert validator.validate_records([{"a": 1.0, "extra": "x"}, {"a": 20.0}]) == [
+        {"a": 1.0, "extra": "x", "b": None, "c": None, "d": 3.0}
+    ]
+
+
+def test_detect_missing_counts_nan_and_accepts_columnar_input() -> None:
+    # NaN（含 numpy 浮点 NaN）计为缺失；列式输入按列向量化统计，缺失整列按行数计
+    import numpy as np
+
+    records = [{"a": float("nan"), "b": 0.0}, {"a": np.float32("nan"), "b": "x"}, {"a": 1.0}]
+    assert detect_missing(records, required=["a", "b"]) == {"a": 2, "b": 1}
+    columns = {
+        "x": np.array([1.0, np.nan, np.nan]),
+        "y": ["", "ok", None],
+        "z": np.array(["", "a", ""]),
+        "n": np.arange(3),
+    }
+    assert detect_missing(columns, required=["x", "y", "z", "n", "absent"]) == {
+        "x": 2,
+        "y": 2,
+        "z": 2,
+        "n": 0,
+        "absent": 3,
+    }
+
+
+def test_detect_missing_columnar_mixed_columns_match_row_form() -> None:
+    # 混合类型列（NaN 与字符串混排）及字节串列：列式统计结果应与等价的行式输入一致
+    columns = {"a": [float("nan"), "x"], "b": [b"", b"x"], "c": ["", "y"]}
+    rows = [dict(zip(columns, values)) for values in zip(*columns.values())]
+    expected = detect_missing(rows, required=["a", "b", "c"])
+    assert expected == {"a": 1, "b": 0, "c": 1}
+    assert detect_missing(columns, required=["a", "b", "c"]) == expected
+    # 不规则的嵌套取值无法构成数组，应回退逐元素判断而不是报错
+    ragged = {"a": [[1], [1, 2], None]}
+    assert detect_missing(ragged, required=["a"]) == {"a": 1}
+    assert detect_missing([{"a": [1]}, {"a": [1, 2]}, {"a": None}], required=["a"]) == {"a": 1}
+    assert detect_missing({"a": [[1.0, float("nan")], [2.0, 3.0]]}, required=["a"]) == {"a": 0}
+
+
+def test_schema_field_map_and_plan_are_precomputed() -> None:
+    # Schema 初始化时一次性构建只读字段映射与校验计划，校验器直接复用同一计划
+    domain = ContinuousDomain(minimum=0.0, maximum=1.0)
+    schema = Schema([SchemaField("a", domain), SchemaField("b", domain, allow_null=True)])
+    mapping = schema.field_map()
+    assert schema.field_map() is mapping
+    assert list(mapping) == ["a", "b"]
+    with pytest.raises(TypeError):
+        mapping["c"] = schema.fields[0]  # type: ignore[index]
+    assert SchemaValidator(schema)._plan is schema._compiled
+    assert [entry[2] for entry in schema._compiled] == [True, False]
+
+
+def test_on_error_reassignment_updates_strategy() -> None:
+    # 对外仍以字符串策略名读写 on_error，重新赋值后立即生效，非法值在赋值时即报错
+    domain = ContinuousDomain(minimum=0.0, maximum=1.0)
+    validator = SchemaValidator(Schema([SchemaField("score", domain)]))
+    assert validator.on_error == "raise"
+    validator.on_error = ValidationStrategy.DROP
+    assert validator.validate_record({"score": 3.0}) is None
+    with pytest.raises(ParamValidationError):
+        validator.on_error = "skip"
+    assert validator.on_error == "drop"
+
+
+def test_validate_columns_matches_row_wise_validation() -> None:
+    # 列式批量校验与逐行校验结果一致：DROP 按行过滤各列，IMPUTE 插补缺失与越界值，RAISE 报告行优先的首个错误
+    from dplib.core.data import DiscreteDomain
+
+    schema = Schema(
+        [
+            SchemaField("x", ContinuousDomain(minimum=0.0, maximum=10.0)),
+            SchemaField("label", DiscreteDomain(["a", "b"]), default="a"),
+        ]
+    )
+    columns = {"x": [1.0, None, 20.0, 4.0], "label": ["b", "a", "a", None], "extra": [0, 1, 2, 3]}
+    rows = [dict(zip(columns, values)) for values in zip(*columns.values())]
+    for strategy in (ValidationStrategy.DROP, ValidationStrategy.IMPUTE):
+        validator = SchemaValidator(schema, on_error=strategy, imputer=lambda field: 5.0 if field.name == "x" else "b")
+        expected = validator.validate_records(rows)
+        assert validator.validate_columns(columns) == {name: [row[name] for row in expected] for name in columns}
+    assert SchemaValidator(schema, on_error=ValidationStrategy.DROP).validate_columns(columns)["label"] == [1]
+    with pytest.raises(ParamValidationError, match="field 'x' missing"):
+        SchemaValidator(schema).validate_columns(columns)
+
+
+def test_validate_record_without_copy_shares_conforming_records() -> None:
+    # copy=False 时合规 dict 记录原样返回；需要规范化、补键或插补的记录仍返回新字典且不改动输入
+    from dplib.core.data import DiscreteDomain
+
+    schema = Schema(
+        [
+            SchemaField("x", ContinuousDomain(minimum=0.0, maximum=1.0)),
+            SchemaField("y", DiscreteDomain(["a"]), required=False),
+        ]
+    )
+    validator = SchemaValidator(schema, on_error=ValidationStrategy.IMPUTE, imputer=lambda field: 0.5)
+    clean = {"x": 0.2, "y": None}
+    assert validator.validate_record(clean, copy=False) is clean
+    assert validator.validate_record(clean) is not clean
+    encoded = {"x": 0.2, "y": "a"}
+    assert validator.validate_record(encoded, copy=False) == {"x": 0.2, "y": 0}
+    assert encoded == {"x": 0.2, "y": "a"}
+    bad = {"x": 3.0}
+    assert validator.validate_records([bad], copy=False) == [{"x": 0.5, "y": None}]
+    assert bad == {"x": 3.0}
@@ -66,6 +66,30 @@ def test_dataset_split_and_materialize() -> None:
     assert len(train.to_list()) == 6
 
 
+def test_dataset_split_partitions_share_records_and_support_access() -> None:
+    # split 返回的分区应复用父数据中的记录对象，且索引、切片、分批迭代与 map 行为与普通数据集一致
+    records = [{"x": i} for i in range(10)]
+    ds = Dataset(records)
+    train, test = ds.split(fractions=(0.7, 0.3))
+    assert test[0] is ds[7]
+    assert test[-1] == {"x": 9}
+    assert test[1:] == [{"x": 8}, {"x": 9}]
+    assert test[::-1] == [{"x": 9}, {"x": 8}, {"x": 7}]
+    assert [batch for batch in train.iter(batch_size=3)] == [records[0:3], records[3:6], records[6:7]]
+    assert test.map(lambda r: r["x"]).to_list() == [7, 8, 9]
+    with pytest.raises(IndexError):
+        test[3]
+    # 分区经由 __init__ 构造，实例属性与普通数据集一致，且不复制父数据
+    assert set(vars(train)) == set(vars(ds))
+    assert not isinstance(train._data, list)
+    # 公开构造函数始终复制调用方传入的数据，后续修改调用方列表不会影响数据集
+    with pytest.raises(TypeError):
+        Dataset(records, _copy=False)  # type: ignore[call-arg]
+    copied = Dataset(records)
+    records.append({"x": 10})
+    assert len(copied) == 10
+
+
 def test_dataset_from_records_and_arrays() -> None:
     # 通过 from_records 构建数据集，并携带元数据
     records = [{"x": 1}, {"x": 2}]
@@ -81,3 +105,43 @@ def test_dataset_from_arrays_requires_equal_length() -> None:
     # from_arrays 需要所有字段数组长度一致，否则应抛出 DatasetError
     with pytest.raises(DatasetError):
         Dataset.from_arrays({"x": [1, 2], "y": [1]})
+
+
+def test_dataset_from_arrays_preserves_column_order_and_element_types() -> None:
+    # 按行 zip 组装记录：键顺序与列顺序一致，NumPy 列元素按原样取出
+    import numpy as np
+
+    ds = Dataset.from_arrays({"b": np.array([1.5, 2.5]), "a": ("x", "y")})
+    assert [list(record) for record in ds] == [["b", "a"], ["b", "a"]]
+    assert ds[1] == {"b": 2.5, "a": "y"}
+    assert isinstance(ds[0]["b"], np.floating)
+
+
+def test_dataset_iter_batches_are_independent_slices() -> None:
+    # 切片批次：整除与非整除长度下 drop_last 语义不变，批次为独立列表，修改不影响数据集
+    ds = Dataset(list(range(6)))
+    assert list(ds.iter(batch_size=3, drop_last=True)) == [[0, 1, 2], [3, 4, 5]]
+    assert list(ds.iter(batch_size=4)) == [[0, 1, 2, 3], [4, 5]]
+    assert list(ds.iter(batch_size=10, drop_last=True)) == []
+    first = next(ds.iter(batch_size=2))
+    first.append(99)
+    assert ds.to_list() == [0, 1, 2, 3, 4, 5]
+
+
+def test_uncached_loader_slices_stream_only_needed_records() -> None:
+    # 未缓存的惰性数据集：非负正步长切片只消费到 stop 为止的记录，结果与物化后切片一致
+    consumed = []
+
+    def loader():
+        for idx in range(1000):
+            consumed.append(idx)
+            yield {"i": idx}
+
+    ds = Dataset(loader, cache=False)
+    assert ds[2:8:3] == [{"i": 2}, {"i": 5}]
+    assert len(consumed) == 8
+    assert ds[-2:] == [{"i": 998}, {"i": 999}]
+    assert ds[5:3] == []
+    # 步长为 0 应回退到物化路径，与普通列表切片一致抛出 ValueError
+    with pytest.raises(ValueError):
+        ds[0:4:0]
@@ -55,3 +55,14 @@ def test_bucketized_domain_encode_decode() -> None:
     assert domain.encode(2.4) == 2
     # decode 从桶索引恢复对应的区间边界
     assert domain.decode(1) == (1.0, 2.0)
+
+
+def test_contains_array_matches_scalar_contains() -> None:
+    # 批量成员判定与逐元素 contains 一致：覆盖开区间边界、NaN、字符串与 None 混合批次
+    import numpy as np
+
+    domain = ContinuousDomain(minimum=0.0, maximum=1.0, inclusive=(False, True))
+    for batch in ([0.0, 0.5, 1.0, 1.5, float("nan")], np.array([-1, 0, 1]), ["0.5", None, "x", 2.0]):
+        assert domain.contains_array(batch).tolist() == [domain.contains(value) for value in batch]
+    discrete = DiscreteDomain(["A", "B"])
+    assert discrete.contains_array(["A", "C"]).tolist() == [True, False]
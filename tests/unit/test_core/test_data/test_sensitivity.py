@@ -66,3 +66,115 @@ def test_smooth_sensitivity_mean_returns_positive_estimate() -> None:
     assert estimate.estimate > 0
     with pytest.raises(SensitivityError):
         smooth_sensitivity_mean([], beta=0.5)
+
+
+def test_local_and_smooth_sensitivity_accept_arrays_and_iterators() -> None:
+    # 验证 ndarray、生成器与列表输入得到一致结果，且平滑敏感度与逐项公式一致
+    import numpy as np
+
+    values = [3.0, 0.0, 1.0, 7.0]
+    assert local_sensitivity(np.array(values)) == local_sensitivity(v for v in values) == 4.0
+    expected = max((7.0 - 0.0), (3.0 - 1.0) * 2.0 ** -0.5, 0.0) / 4
+    assert smooth_sensitivity_mean(np.array(values, dtype=np.float32), beta=0.5).estimate == pytest.approx(expected)
+    assert smooth_sensitivity_mean(iter(values), beta=0.5).estimate == pytest.approx(expected)
+
+
+def test_local_sensitivity_does_not_reorder_caller_arrays() -> None:
+    # 验证原地排序只作用于内部新建的缓冲区，调用方传入的 float64 数组及其视图保持原有顺序
+    import numpy as np
+
+    values = np.array([5.0, 1.0, 4.0, 0.0])
+    original = values.copy()
+    assert local_sensitivity(values) == 3.0
+    assert local_sensitivity(values[::2]) == 1.0
+    smooth_sensitivity_mean(values, beta=0.5)
+    assert np.array_equal(values, original)
+
+
+def test_smooth_sensitivity_mean_matches_full_scan_for_odd_and_even_sizes() -> None:
+    # 验证极差闭式实现与完整 k 扫描公式逐位一致，覆盖奇偶样本量与不同 beta
+    import numpy as np
+
+    rng = np.random.default_rng(7)
+    for size in (1, 2, 5, 8, 301):
+        for beta in (1e-4, 0.7, 5.0):
+            values = rng.normal(size=size)
+            ordered = np.sort(values)
+            full = (ordered[::-1] - ordered) * np.power(2.0, -beta * np.arange(size))
+            expected = max(0.0, float(full.max())) / size
+            assert smooth_sensitivity_mean(values, beta=beta).estimate == expected
+
+
+def test_smooth_sensitivity_mean_rejects_nan() -> None:
+    # NaN 输入会让敏感度估计失真（可能为 0 导致不加噪声），应直接抛出 SensitivityError
+    import numpy as np
+
+    with pytest.raises(SensitivityError, match="NaN"):
+        smooth_sensitivity_mean([1.0, float("nan"), 5.0], beta=0.5)
+    with pytest.raises(SensitivityError, match="NaN"):
+        smooth_sensitivity_mean(np.array([1.0, np.nan, 5.0], dtype=np.float32), beta=0.5)
+
+
+def test_global_sensitivity_results_are_cached_by_bounds() -> None:
+    # 验证相同边界与参数的重复调用命中缓存，int 与 float 输入保持各自的返回类型，错误不被缓存
+    from dplib.core.data import sensitivity as core_sensitivity
+
+    core_sensitivity._mean_sensitivity.cache_clear()
+    domain = ContinuousDomain(minimum=0.0, maximum=2.0)
+    other = ContinuousDomain(minimum=0.0, maximum=2.0)
+    assert mean_global_sensitivity(domain, sample_size=4) == mean_global_sensitivity(other, sample_size=4) == 0.5
+    assert core_sensitivity._mean_sensitivity.cache_info().hits == 1
+    assert type(sum_global_sensitivity(ContinuousDomain(minimum=0, maximum=3))) is int
+    assert type(sum_global_sensitivity(ContinuousDomain(minimum=0.0, maximum=3.0))) is float
+    for _ in range(2):
+        with pytest.raises(SensitivityError):
+            mean_global_sensitivity(domain, sample_size=0)
+    assert range_global_sensitivity(None, window=2, metric="count") == 1.0  # type: ignore[arg-type]
+
+
+def test_metric_names_are_case_insensitive_and_validated() -> None:
+    # 验证规范小写度量名直接命中，大小写混合的名称经归一化后结果一致，未知度量仍报错
+    domain = ContinuousDomain(minimum=0.0, maximum=2.0)
+    assert range_global_sensitivity(domain, window=2, metric="Mean") == range_global_sensitivity(
+        domain, window=2, metric="mean"
+    )
+    assert local_sensitivity([0.0, 3.0], metric="L2") == local_sensitivity([0.0, 3.0], metric="l2") == 3.0
+    with pytest.raises(SensitivityError):
+        range_global_sensitivity(domain, window=2, metric="median")
+    with pytest.raises(SensitivityError):
+        local_sensitivity([0.0, 1.0], metric="linf")
+
+
+def test_smooth_sensitivity_mean_reads_numeric_arrays_in_place() -> None:
+    # 验证 float32/整数/跨步视图数组无需转换拷贝，结果与列表输入一致
+    import numpy as np
+
+    values = [0.1, 7.25, 3.5, -2.75]
+    expected = smooth_sensitivity_mean(values, beta=0.5).estimate
+    assert smooth_sensitivity_mean(np.array(values, dtype=np.float32), beta=0.5).estimate == pytest.approx(expected)
+    assert smooth_sensitivity_mean(np.array([[4, -1], [2, 9]]), beta=0.5).estimate == 10 / 4
+    assert smooth_sensitivity_mean(np.repeat(values, 2)[::2], beta=0.5).estimate == expected
+
+
+def test_fast_sensitivity_toggle_matches_public_formulas(monkeypatch: pytest.MonkeyPatch) -> None:
+    # count/sum/histogram 快路径只在核心模块定义一次：关闭开关后分析器与区间工厂的结果应与开启时完全一致
+    from dplib.cdp.sensitivity import SensitivityAnalyzer
+    from dplib.cdp.sensitivity.sensitivity_bounds import count_bounds, histogram_bounds, sum_bounds
+    from dplib.core.data import sensitivity as module
+
+    domain = ContinuousDomain(minimum=-2.0, maximum=3.0)
+    analyzer = SensitivityAnalyzer()
+
+    def _collect() -> tuple:
+        return (
+            analyzer.count(max_contribution=3).sensitivity,
+            analyzer.sum(domain, max_contribution=2).sensitivity,
+            analyzer.histogram(max_contribution=2).sensitivity,
+            count_bounds(4).upper,
+            sum_bounds(domain, max_contribution=2).upper,
+            histogram_bounds(2).upper,
+        )
+
+    fast = _collect()
+    monkeypatch.setattr(module, "_USE_FAST_SENSITIVITY", False)
+    assert _collect() == fast == (3.0, 10.0, 2.0, 4.0, 10.0, 2.0)
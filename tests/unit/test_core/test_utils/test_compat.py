@@ -0,0 +1,29 @@
+"""
+Unit tests for Python version compatibility helpers.
+"""
+# 说明：版本兼容开关的单元测试。
+# 覆盖：
+# - DATACLASS_SLOTS：按解释器版本启用数据类 __slots__，且各模块共享同一定义
+
+import sys
+from dataclasses import dataclass
+
+from dplib.core.utils.compat import DATACLASS_SLOTS
+
+
+def test_dataclass_slots_follow_python_version() -> None:
+    # 3.10+ 下数据类实例不带 __dict__，旧版本展开为空参数、行为与普通数据类一致
+    @dataclass(**DATACLASS_SLOTS)
+    class Point:
+        x: int = 0
+
+    assert hasattr(Point(), "__dict__") is (sys.version_info < (3, 10))
+
+
+def test_dataclass_slots_shared_by_library_modules() -> None:
+    # 使用该开关的模块应导入同一对象，而不是各自复制定义
+    from dplib.cdp.ml import config, types
+    from dplib.cdp.sensitivity import sensitivity_analyzer, sensitivity_bounds
+
+    for module in (config, types, sensitivity_analyzer, sensitivity_bounds):
+        assert module.DATACLASS_SLOTS is DATACLASS_SLOTS